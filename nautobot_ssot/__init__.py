@@ -5,6 +5,7 @@ import os
 from importlib import metadata
 
 from django.conf import settings
+from django.db.models.signals import post_delete, post_save
 from nautobot.core.settings_funcs import is_truthy
 from nautobot.extras.plugins import NautobotAppConfig
 
@@ -122,6 +123,7 @@ class NautobotSSOTAppConfig(NautobotAppConfig):
         "servicenow_password": "",
         "servicenow_username": "",
         "enable_global_search": True,
+        "shared_orm_cache_models": [],
     }
     config_view_name = "plugins:nautobot_ssot:config"
     docs_view_name = "plugins:nautobot_ssot:docs"
@@ -130,6 +132,10 @@ class NautobotSSOTAppConfig(NautobotAppConfig):
     def ready(self):
         """Trigger callback when database is ready."""
         super().ready()
+        from nautobot_ssot.utils.cache import shared_orm_cache  # pylint: disable=import-outside-toplevel
+
+        post_save.connect(shared_orm_cache.handle_change, dispatch_uid="nautobot_ssot_shared_orm_cache_save")
+        post_delete.connect(shared_orm_cache.handle_change, dispatch_uid="nautobot_ssot_shared_orm_cache_delete")
         for module in each_enabled_integration_module("signals"):
             logger.debug("Registering signals for %s", module.__file__)
             module.register_signals(self)
@@ -0,0 +1,21 @@
+"""Pagination classes for nautobot_ssot."""
+
+from nautobot.core.views.paginator import get_paginate_count
+from rest_framework.pagination import CursorPagination
+
+
+class SyncLogEntryCursorPagination(CursorPagination):
+    """Keyset pagination of SyncLogEntry records in the order they were logged.
+
+    Rather than counting and skipping all records before the requested page, each page seeks to its first record
+    through the `(sync, ..., timestamp)` indexes of SyncLogEntry, so that deep pages of large syncs load as fast as
+    the first one. The previous and next pages are referenced by opaque `cursor` query parameters.
+    """
+
+    ordering = ("timestamp", "id")
+    page_size_query_param = "limit"
+    max_page_size = 1000
+
+    def get_page_size(self, request):
+        """Use the `limit` query parameter, falling back to the page size configured for the user or Nautobot."""
+        return super().get_page_size(request) or get_paginate_count(request)
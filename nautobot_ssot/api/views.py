@@ -1,9 +1,43 @@
 """API views for nautobot_ssot."""
 
 from nautobot.apps.api import NautobotModelViewSet
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 
 from nautobot_ssot import filters, models
 from nautobot_ssot.api import serializers
+from nautobot_ssot.api.pagination import SyncLogEntryCursorPagination
+from nautobot_ssot.utils.export import (
+    DIFF_EXPORT_FIELDS,
+    EXPORT_FORMATS,
+    LOG_ENTRY_EXPORT_FIELDS,
+    iter_diff_rows,
+    iter_log_entry_rows,
+    streaming_export_response,
+)
+
+
+def get_export_format(request):
+    """Get the export format from the `export_format` query parameter, defaulting to NDJSON."""
+    export_format = request.query_params.get("export_format", "ndjson")
+    if export_format not in EXPORT_FORMATS:
+        raise ValidationError({"export_format": f"Must be one of {', '.join(EXPORT_FORMATS)}."})
+    return export_format
+
+
+def filter_log_entries(request, queryset, ignored_params=()):
+    """Filter log entries by the query parameters of a request, other than `ignored_params`, as the list API does.
+
+    Raises:
+        ValidationError: if any of the filters is invalid or unknown.
+    """
+    filter_params = request.query_params.copy()
+    for param in ignored_params:
+        filter_params.pop(param, None)
+    filterset = filters.SyncLogEntryFilterSet(filter_params, queryset=queryset, request=request)
+    if not filterset.is_valid():
+        raise ValidationError(filterset.errors)
+    return filterset.qs
 
 
 class SyncViewSet(NautobotModelViewSet):  # pylint: disable=too-many-ancestors
@@ -13,6 +47,49 @@ class SyncViewSet(NautobotModelViewSet):  # pylint: disable=too-many-ancestors
     serializer_class = serializers.SyncSerializer
     filterset_class = filters.SyncFilterSet
 
+    @action(detail=True, methods=["get"])
+    def diff(self, request, pk=None):  # pylint: disable=unused-argument
+        """Paginated list of the top-level objects in the diff of a sync, loading only the chunks of the page."""
+        sync = self.get_object()
+        page = self.paginate_queryset(sync.diff_items)
+        return self.get_paginated_response(
+            [{"model_type": model_type, "id": obj_id, "diff": obj_diff} for model_type, obj_id, obj_diff in page]
+        )
+
+    @action(detail=True, methods=["get"])
+    def logs(self, request, pk=None):  # pylint: disable=unused-argument
+        """Cursor-paginated list of the log entries of a sync, optionally filtered, in the order they were logged."""
+        sync = self.get_object()
+        paginator = SyncLogEntryCursorPagination()
+        queryset = filter_log_entries(
+            request,
+            sync.get_log_entries().restrict(request.user, "view"),
+            ignored_params=(paginator.cursor_query_param, paginator.page_size_query_param),
+        )
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = serializers.SyncLogEntrySerializer(page, many=True, context={"request": request})
+        return paginator.get_paginated_response(serializer.data)
+
+    @action(detail=True, methods=["get"], url_path="export-diff")
+    def export_diff(self, request, pk=None):  # pylint: disable=unused-argument
+        """Stream the top-level objects in the diff of a sync as NDJSON or CSV."""
+        sync = self.get_object()
+        return streaming_export_response(
+            get_export_format(request), f"sync-{sync.pk}-diff", DIFF_EXPORT_FIELDS, iter_diff_rows(sync)
+        )
+
+    @action(detail=True, methods=["get"], url_path="export-logs")
+    def export_logs(self, request, pk=None):  # pylint: disable=unused-argument
+        """Stream the log entries of a sync, optionally filtered, as NDJSON or CSV."""
+        sync = self.get_object()
+        export_format = get_export_format(request)
+        queryset = filter_log_entries(
+            request, sync.get_log_entries().restrict(request.user, "view"), ignored_params=("export_format",)
+        )
+        return streaming_export_response(
+            export_format, f"sync-{sync.pk}-logs", LOG_ENTRY_EXPORT_FIELDS, iter_log_entry_rows(queryset)
+        )
+
 
 class SyncLogEntryViewSet(NautobotModelViewSet):  # pylint: disable=too-many-ancestors
     """SyncLogEntry viewset."""
@@ -4,29 +4,40 @@
 # Diffsync relies on underscore-prefixed attributes quite heavily, which is why we disable this here.
 
 import re
-from typing import Dict, List, Type
+from collections import defaultdict
+from functools import partial
+from operator import attrgetter
+from typing import Callable, ClassVar, Dict, List, Optional, Type
 
 import pydantic
 from diffsync import Adapter, DiffSyncModel
+from diffsync.diff import Diff
+from diffsync.enum import DiffSyncActions, DiffSyncFlags
 from diffsync.exceptions import ObjectCrudException
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Model
+from django.core.exceptions import FieldDoesNotExist, FieldError
+from django.db.models import Model, Prefetch, QuerySet
 from nautobot.extras.choices import RelationshipTypeChoices
 from nautobot.extras.models import Relationship
 from nautobot.extras.models.metadata import MetadataType
+from typing_extensions import get_type_hints, is_typeddict
 
 from nautobot_ssot.contrib.base import BaseNautobotAdapter, BaseNautobotModel
+from nautobot_ssot.contrib.bulk import BulkOperationQueue
 from nautobot_ssot.contrib.types import (
     CustomFieldAnnotation,
     CustomRelationshipAnnotation,
     RelationshipSideEnum,
 )
-from nautobot_ssot.utils.cache import ORMCache
+from nautobot_ssot.utils.cache import ORMCache, shared_orm_cache
 from nautobot_ssot.utils.orm import (
-    get_custom_relationship_associations,
+    add_prefetch_lookups,
+    get_custom_relationship_peers,
     load_typed_dict,
     orm_attribute_lookup,
 )
+from nautobot_ssot.utils.parallel_load import LoadUnit, load_in_parallel
 from nautobot_ssot.utils.typing import get_inner_type
 
 
@@ -37,12 +48,52 @@ class NautobotAdapter(Adapter, BaseNautobotAdapter):
     This adapter is able to infer how to load data from Nautobot based on how the models attached to it are defined.
     """
 
+    # When enabled, creates, updates and deletes of `NautobotModel` objects are queued and written to the database
+    # with bulk operations once the sync is complete. See `nautobot_ssot.contrib.bulk.BulkOperationQueue`.
+    bulk_mode: ClassVar[bool] = False
+    # Number of objects per bulk query, optionally overridden per diffsync model name in `bulk_batch_sizes`.
+    bulk_batch_size: ClassVar[int] = 250
+    bulk_batch_sizes: ClassVar[Dict[str, int]] = {}
+    # When enabled, the related objects that the creates and updates of a sync look up (e.g. the locations of new
+    # devices) are loaded into the ORM cache with one query per related model before the sync starts.
+    prefetch_related_objects: ClassVar[bool] = False
+    # Optional bounds for the ORM cache, see `nautobot_ssot.utils.cache.ORMCache`. `cache_capacity` limits the total
+    # number of cached objects, `cache_capacities` the number of cached objects per model (e.g. `{"dcim.device": 1000}`).
+    cache_capacity: ClassVar[Optional[int]] = None
+    cache_capacities: ClassVar[Dict[str, int]] = {}
+    # When enabled, objects loaded from the database are constructed without pydantic validation, unless the model
+    # sets `_trusted_data = False`. Every n-th of them is still validated to catch drift between the models and the
+    # database, where n is `trusted_data_sample_interval`, or 100 if it is unset and `settings.DEBUG` is enabled.
+    trusted_data: ClassVar[bool] = False
+    trusted_data_sample_interval: ClassVar[Optional[int]] = None
+    # Number of rows fetched from the database at a time when loading, optionally overridden per model with
+    # `_load_chunk_size`. Rows are streamed through `QuerySet.iterator` rather than cached by the queryset, so that
+    # memory usage depends on the chunk size rather than on the size of the table. `None` disables chunking.
+    load_chunk_size: ClassVar[Optional[int]] = 2000
+    # When enabled, the top-level models are loaded concurrently in up to `parallel_load_max_workers` threads, see
+    # `get_load_units`. `load_shard_fields` additionally splits the loading of a model into one unit per distinct value
+    # of a field, keyed by diffsync model name (e.g. `{"device": "location__name"}`).
+    parallel_load: ClassVar[bool] = False
+    parallel_load_max_workers: ClassVar[int] = 4
+    load_shard_fields: ClassVar[Dict[str, str]] = {}
+
     def __init__(self, *args, job, sync=None, **kwargs):
         """Instantiate this class, but do not load data immediately from the local system."""
+        cache = kwargs.pop("cache", None)
+        if cache is None:
+            cache = ORMCache(
+                capacity=self.cache_capacity, capacities=self.cache_capacities, shared_cache=shared_orm_cache
+            )
+        self.cache: ORMCache = cache
+        # Use the store selected by the job, such as a disk-backed store, unless one is given explicitly.
+        if getattr(job, "disk_backed_store", False) is True:
+            kwargs.setdefault("internal_storage_engine", job.get_adapter_store())
         super().__init__(*args, **kwargs)
         self.job = job
         self.sync = sync
-        self.cache: ORMCache = kwargs.pop("cache", ORMCache())
+        self.bulk_queue = BulkOperationQueue(self)
+        self.custom_relationship_peers = {}
+        self.trusted_objects_constructed = 0
         self.metadata_type = None
         self.metadata_scope_fields = {}
         self.validate_adapter()
@@ -52,6 +103,52 @@ class NautobotAdapter(Adapter, BaseNautobotAdapter):
         if not hasattr(self, "top_level") or not self.top_level:
             raise ValueError("'top_level' needs to be set on the class.")
 
+    def sync_from(  # pylint: disable=too-many-arguments
+        self, source, diff_class=Diff, flags=DiffSyncFlags.NONE, callback=None, diff=None
+    ):
+        """Synchronize data from the given source adapter into this one, prefetching related objects beforehand."""
+        if self.prefetch_related_objects:
+            if diff is None:
+                diff = self.diff_from(source, diff_class=diff_class, flags=flags, callback=callback)
+            self.prefetch_related_objects_from_diff(diff)
+        return super().sync_from(source, diff_class=diff_class, flags=flags, callback=callback, diff=diff)
+
+    def get_related_object_parameters_from_diff(self, diff: Diff) -> Dict[Type[Model], List[Dict]]:
+        """Collect the parameters of all related objects that the creates and updates in `diff` will look up."""
+        # Example: {Location: [{"name": "Bremen"}, {"name": "Berlin"}]}
+        related_object_parameters = defaultdict(list)
+        elements = list(diff.get_children())
+        while elements:
+            element = elements.pop()
+            elements.extend(element.get_children())
+            if element.action == DiffSyncActions.CREATE:
+                parameters = {**element.keys, **element.source_attrs}
+            elif element.action == DiffSyncActions.UPDATE:
+                parameters = element.get_attrs_diffs().get("+", {})
+            else:
+                continue
+            diffsync_model = getattr(self, element.type, None)
+            if not hasattr(diffsync_model, "_get_related_object_parameters"):
+                continue
+            for model_class, lookup in diffsync_model._get_related_object_parameters(parameters):
+                related_object_parameters[model_class].append(lookup)
+        return related_object_parameters
+
+    def prefetch_related_objects_from_diff(self, diff: Diff):
+        """Load the related objects that the creates and updates in `diff` will look up into the ORM cache in bulk."""
+        for model_class, parameters_list in self.get_related_object_parameters_from_diff(diff).items():
+            try:
+                self.cache.prefetch(model_class, parameters_list)
+            except (FieldError, TypeError, ValueError) as error:
+                # Prefetching is an optimization only, the objects will be looked up one by one instead.
+                self.job.logger.debug(f"Unable to prefetch {model_class._meta.verbose_name} objects: {error}")
+
+    def sync_complete(self, source, diff, flags=DiffSyncFlags.NONE, logger=None):
+        """Write any operations queued in bulk mode to the database once the sync is complete."""
+        if len(self.bulk_queue):
+            self.bulk_queue.flush()
+        super().sync_complete(source, diff, flags=flags, logger=logger)
+
     def get_from_orm_cache(self, parameters: Dict, model_class: Type[Model]):
         """Retrieve an object from the ORM or the cache."""
         return self.cache.get_from_orm(model_class, parameters)
@@ -69,12 +166,116 @@ class NautobotAdapter(Adapter, BaseNautobotAdapter):
         )
         self.cache.invalidate_cache(zero_out_hits=zero_out_hits)
 
-    def _load_objects(self, diffsync_model: BaseNautobotModel):
-        """Given a diffsync model class, load a list of models from the database and return them."""
+    def _load_objects(self, diffsync_model: BaseNautobotModel, filters: Optional[Dict] = None):
+        """Given a diffsync model class, load a list of models from the database and return them.
+
+        :param filters: Optional filters limiting the loaded objects, e.g. to those of a shard in `get_load_units`.
+        """
         parameter_names = diffsync_model.get_synced_attributes()
-        for database_object in diffsync_model._get_queryset():
+        queryset = diffsync_model._get_queryset()
+        if filters and isinstance(queryset, QuerySet):
+            queryset = queryset.filter(**filters)
+        values_plan = self._get_values_plan(diffsync_model, parameter_names)
+        if values_plan is not None and isinstance(queryset, QuerySet):
+            self._load_objects_from_values(queryset, diffsync_model, values_plan)
+            return
+        if isinstance(queryset, QuerySet):
+            queryset = add_prefetch_lookups(queryset, self._get_children_prefetches(diffsync_model))
+        for database_object in self._iterate_in_chunks(queryset, diffsync_model):
             self._load_single_object(database_object, diffsync_model, parameter_names)
 
+    def _iterate_in_chunks(self, queryset, diffsync_model: BaseNautobotModel):
+        """Iterate a queryset in chunks of the diffsync model's load chunk size, including its prefetches."""
+        chunk_size = getattr(diffsync_model, "_load_chunk_size", None)
+        if chunk_size is None:
+            chunk_size = self.load_chunk_size
+        if chunk_size and isinstance(queryset, QuerySet):
+            return queryset.iterator(chunk_size=chunk_size)
+        return queryset
+
+    def _get_children_prefetches(self, diffsync_model: BaseNautobotModel) -> List[Prefetch]:
+        """Get `Prefetch` objects loading the children of a diffsync model, including their own related objects.
+
+        Without these, `_handle_children` would issue a query per parent object and child relation.
+        """
+        prefetches = []
+        for children_parameter, children_field in diffsync_model._children.items():
+            diffsync_model_child = self._get_diffsync_class(model_name=children_parameter)
+            try:
+                related_model = diffsync_model._model._meta.get_field(children_field).related_model
+            except FieldDoesNotExist:
+                continue
+            if related_model is not getattr(diffsync_model_child, "_model", None):
+                continue
+            lookups = []
+            if hasattr(diffsync_model_child, "_get_prefetch_lookups"):
+                lookups.extend(diffsync_model_child._get_prefetch_lookups())
+            lookups.extend(self._get_children_prefetches(diffsync_model_child))
+            queryset = add_prefetch_lookups(related_model._default_manager.all(), lookups)
+            prefetches.append(Prefetch(children_field, queryset=queryset))
+        return prefetches
+
+    def _get_values_plan(self, diffsync_model: BaseNautobotModel, parameter_names):
+        """Get the plan to load a diffsync model from `values_list` rows, or `None` if that isn't possible.
+
+        This is the case if the model has no children and each of its parameters is either a custom field, a concrete
+        field or a lookup of a concrete field through forward foreign keys (e.g. `location__parent__name`), without a
+        `load_param_*` method on the adapter. Loading from `values_list` avoids instantiating any Django models.
+        Adapters overriding `_load_single_object` or `_handle_single_parameter` always load from model instances, so
+        that their overrides keep being called.
+
+        :return: A list of `(parameter_name, values_list_field, custom_field_key)` tuples.
+        """
+        if not getattr(diffsync_model, "_load_from_values", False) or diffsync_model._children:
+            return None
+        adapter_class = type(self)
+        if (
+            adapter_class._load_single_object is not NautobotAdapter._load_single_object
+            or adapter_class._handle_single_parameter is not NautobotAdapter._handle_single_parameter
+        ):
+            return None
+        plan = []
+        for parameter_name in parameter_names:
+            annotation = diffsync_model.get_attr_annotation(parameter_name)
+            if isinstance(annotation, CustomFieldAnnotation):
+                plan.append((parameter_name, "_custom_field_data", annotation.key or annotation.name))
+                continue
+            if annotation or hasattr(self, f"load_param_{parameter_name}"):
+                return None
+            model_class = diffsync_model._model
+            *relation_names, field_name = parameter_name.split("__")
+            try:
+                for relation_name in relation_names:
+                    relation = model_class._meta.get_field(relation_name)
+                    if not (relation.concrete and (relation.many_to_one or relation.one_to_one)):
+                        return None
+                    model_class = relation.related_model
+                django_field = model_class._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                return None
+            if not django_field.concrete or django_field.is_relation:
+                return None
+            plan.append((parameter_name, parameter_name, None))
+        return plan
+
+    def _load_objects_from_values(self, queryset: QuerySet, diffsync_model: BaseNautobotModel, values_plan):
+        """Load diffsync objects from `values_list` rows following the plan from `_get_values_plan`."""
+        fields = list(dict.fromkeys(["pk", *(values_list_field for _, values_list_field, _ in values_plan)]))
+        plan = [
+            (parameter_name, fields.index(values_list_field), custom_field_key)
+            for parameter_name, values_list_field, custom_field_key in values_plan
+        ]
+        # Prefetching only applies to model instances.
+        for row in self._iterate_in_chunks(queryset.prefetch_related(None).values_list(*fields), diffsync_model):
+            parameters = {}
+            for parameter_name, index, custom_field_key in plan:
+                if custom_field_key is None:
+                    parameters[parameter_name] = row[index]
+                elif custom_field_key in (row[index] or {}):
+                    parameters[parameter_name] = row[index][custom_field_key]
+            parameters["pk"] = row[0]
+            self._add_diffsync_object(diffsync_model, parameters)
+
     def _handle_single_parameter(self, parameters, parameter_name, database_object, diffsync_model):
         # Handle custom fields and custom relationships. See CustomFieldAnnotation and CustomRelationshipAnnotation
         # docstrings for more details.
@@ -123,20 +324,187 @@ class NautobotAdapter(Adapter, BaseNautobotAdapter):
         else:
             parameters[parameter_name] = getattr(database_object, parameter_name)
 
+    @classmethod
+    def _get_load_plan(cls, diffsync_model: BaseNautobotModel) -> Dict[str, Callable]:
+        """Get the functions loading each synced attribute of a diffsync model from a database object.
+
+        Annotations, Django fields, typed dictionaries and `load_param_*` methods are resolved once per process for
+        each adapter and model class, rather than once per object and attribute as in `_handle_single_parameter`.
+        The compiled plans are kept on each adapter class for the lifetime of the process, see `clear_load_plans`.
+
+        :return: A dictionary mapping parameter names to functions taking the adapter, the parameters to fill and
+            the database object.
+        """
+        # Looked up in the class' own namespace, so that subclasses with other `load_param_*` methods get their own.
+        load_plans = cls.__dict__.get("_load_plans")
+        if load_plans is None:
+            load_plans = {}
+            cls._load_plans = load_plans
+        load_plan = load_plans.get(diffsync_model)
+        if load_plan is None:
+            load_plan = load_plans[diffsync_model] = cls._compile_load_plan(diffsync_model)
+        return load_plan
+
+    @classmethod
+    def clear_load_plans(cls):
+        """Drop the compiled load plans of this adapter class, e.g. after changing its models in tests."""
+        cls.__dict__.get("_load_plans", {}).clear()
+
+    @classmethod
+    def _compile_load_plan(cls, diffsync_model: BaseNautobotModel) -> Dict[str, Callable]:
+        """Compile the functions loading each synced attribute of a diffsync model from a database object."""
+        return {
+            parameter_name: cls._compile_parameter_loader(diffsync_model, parameter_name)
+            for parameter_name in diffsync_model.get_synced_attributes()
+        }
+
+    @classmethod
+    def _compile_parameter_loader(  # pylint: disable=too-many-return-statements
+        cls, diffsync_model: BaseNautobotModel, parameter_name: str
+    ) -> Callable:
+        """Compile the function loading a single parameter, mirroring `_handle_single_parameter`."""
+        # pylint: disable=unused-argument
+        # Subclasses customizing `_handle_single_parameter` keep having it called for each parameter.
+        if cls._handle_single_parameter is not NautobotAdapter._handle_single_parameter:
+
+            def load_with_handler(adapter, parameters, database_object):
+                adapter._handle_single_parameter(parameters, parameter_name, database_object, diffsync_model)
+
+            return load_with_handler
+
+        annotation = diffsync_model.get_attr_annotation(parameter_name)
+        if isinstance(annotation, CustomFieldAnnotation):
+            field_key = annotation.key or annotation.name
+
+            def load_custom_field(adapter, parameters, database_object):
+                if field_key in database_object.cf:
+                    parameters[parameter_name] = database_object.cf[field_key]
+
+            return load_custom_field
+
+        if "__" in parameter_name:
+            if isinstance(annotation, CustomRelationshipAnnotation):
+
+                def load_custom_relationship_foreign_key(adapter, parameters, database_object):
+                    parameters[parameter_name] = adapter._handle_custom_relationship_foreign_key(
+                        database_object, parameter_name, annotation
+                    )
+
+                return load_custom_relationship_foreign_key
+
+            def load_foreign_key(adapter, parameters, database_object):
+                parameters[parameter_name] = orm_attribute_lookup(database_object, parameter_name)
+
+            return load_foreign_key
+
+        if annotation:
+
+            def load_custom_relationship_to_many(adapter, parameters, database_object):
+                parameters[parameter_name] = adapter._handle_custom_relationship_to_many_relationship(
+                    database_object, diffsync_model, parameter_name, annotation
+                )
+
+            return load_custom_relationship_to_many
+
+        database_field = diffsync_model._model._meta.get_field(parameter_name)
+        if database_field.many_to_many or database_field.one_to_many:
+            # As for `_handle_single_parameter`, customizations of `_handle_to_many_relationship` are kept.
+            if cls._handle_to_many_relationship is not NautobotAdapter._handle_to_many_relationship:
+
+                def load_to_many_with_handler(adapter, parameters, database_object):
+                    parameters[parameter_name] = adapter._handle_to_many_relationship(
+                        database_object, diffsync_model, parameter_name
+                    )
+
+                return load_to_many_with_handler
+
+            inner_type = get_inner_type(diffsync_model, parameter_name)
+            if not is_typeddict(inner_type):
+                raise TypeError("`typed_dict_class` must be a subclass of `TypedDict`.")
+            typed_dict_fields = tuple(get_type_hints(inner_type))
+
+            def load_to_many(adapter, parameters, database_object):
+                related_objects_list = []
+                for related_object in getattr(database_object, parameter_name).all():
+                    dictionary_representation = {
+                        field_name: orm_attribute_lookup(related_object, field_name) for field_name in typed_dict_fields
+                    }
+                    # Only use those where there is a single field defined, all 'None's will not help us.
+                    if any(dictionary_representation.values()):
+                        related_objects_list.append(dictionary_representation)
+                parameters[parameter_name] = related_objects_list
+
+            return load_to_many
+
+        if hasattr(cls, f"load_param_{parameter_name}"):
+            load_param_method_name = f"load_param_{parameter_name}"
+
+            def load_with_method(adapter, parameters, database_object):
+                parameters[parameter_name] = getattr(adapter, load_param_method_name)(parameter_name, database_object)
+
+            return load_with_method
+
+        get_value = attrgetter(parameter_name)
+
+        def load_attribute(adapter, parameters, database_object):
+            parameters[parameter_name] = get_value(database_object)
+
+        return load_attribute
+
     def _load_single_object(self, database_object, diffsync_model, parameter_names):
         """Load a single diffsync object from a single database object."""
         parameters = {}
+        load_plan = self._get_load_plan(diffsync_model)
         for parameter_name in parameter_names:
-            self._handle_single_parameter(parameters, parameter_name, database_object, diffsync_model)
+            if parameter_name in load_plan:
+                load_plan[parameter_name](self, parameters, database_object)
+            else:
+                self._handle_single_parameter(parameters, parameter_name, database_object, diffsync_model)
         parameters["pk"] = database_object.pk
-        try:
-            diffsync_model_instance = diffsync_model(**parameters)
-        except pydantic.ValidationError as error:
-            raise ValueError(f"Parameters: {parameters}") from error
-        self.add(diffsync_model_instance)
+        diffsync_model_instance = self._add_diffsync_object(diffsync_model, parameters)
         self._handle_children(database_object, diffsync_model_instance)
         return diffsync_model_instance
 
+    def _add_diffsync_object(self, diffsync_model, parameters):
+        """Instantiate a diffsync object from the given parameters and add it to the adapter."""
+        if self._is_trusted(diffsync_model):
+            diffsync_model_instance = diffsync_model.model_construct(**parameters)
+            self.trusted_objects_constructed += 1
+            sample_interval = self.trusted_data_sample_interval
+            if sample_interval is None and settings.DEBUG:
+                sample_interval = 100
+            if sample_interval and (self.trusted_objects_constructed - 1) % sample_interval == 0:
+                self._validate_trusted_object(diffsync_model_instance, parameters)
+        else:
+            try:
+                diffsync_model_instance = diffsync_model(**parameters)
+            except pydantic.ValidationError as error:
+                raise ValueError(f"Parameters: {parameters}") from error
+        self.add(diffsync_model_instance)
+        return diffsync_model_instance
+
+    def _is_trusted(self, diffsync_model) -> bool:
+        """Whether objects of the given diffsync model are constructed from database values without validation."""
+        trusted_data = getattr(diffsync_model, "_trusted_data", None)
+        return self.trusted_data if trusted_data is None else trusted_data
+
+    @staticmethod
+    def _validate_trusted_object(diffsync_model_instance, parameters):
+        """Check that an object constructed without validation is equal to the validated object.
+
+        :raises ValueError: If validation fails or changes any of the values, e.g. by coercing their types.
+        """
+        diffsync_model = type(diffsync_model_instance)
+        try:
+            validated_instance = diffsync_model(**parameters)
+        except pydantic.ValidationError as error:
+            raise ValueError(f"Trusted data failed validation for {diffsync_model.get_type()}: {parameters}") from error
+        if validated_instance.model_dump() != diffsync_model_instance.model_dump():
+            raise ValueError(
+                f"Trusted data for {diffsync_model.get_type()} changed during validation: {parameters} became "
+                f"{validated_instance.model_dump()}"
+            )
+
     def _handle_children(self, database_object, diffsync_model: BaseNautobotModel):
         """Recurse through all the children for this model."""
         for children_parameter, children_field in diffsync_model._children.items():
@@ -147,8 +515,35 @@ class NautobotAdapter(Adapter, BaseNautobotAdapter):
                 child_diffsync_object = self._load_single_object(child, diffsync_model_child, parameter_names)
                 diffsync_model.add_child(child_diffsync_object)
 
+    def get_load_units(self) -> List[LoadUnit]:
+        """Get the independent units that `load` runs concurrently when `parallel_load` is enabled.
+
+        By default, there is one unit per top-level model, or per distinct value of its field in `load_shard_fields`.
+        Override this to declare other units, which must not depend on each other's objects.
+        """
+        units = []
+        for model_name in self.top_level:
+            diffsync_model = self._get_diffsync_class(model_name)
+            shard_field = self.load_shard_fields.get(model_name)
+            queryset = diffsync_model._get_queryset()
+            if not shard_field or not isinstance(queryset, QuerySet):
+                units.append(LoadUnit(model_name, partial(self._load_objects, diffsync_model)))
+                continue
+            for value in queryset.order_by(shard_field).values_list(shard_field, flat=True).distinct():
+                units.append(
+                    LoadUnit(
+                        f"{model_name} ({shard_field}={value})",
+                        partial(self._load_objects, diffsync_model, filters={shard_field: value}),
+                    )
+                )
+        return units
+
     def load(self):
         """Generic implementation of the load function."""
+        self.custom_relationship_peers = {}
+        if self.parallel_load:
+            load_in_parallel(self, self.get_load_units(), max_workers=self.parallel_load_max_workers, job=self.job)
+            return
         for model_name in self.top_level:
             # This function directly mutates the diffsync store, i.e. it will create and load the objects
             # for this specific model class as well as its children without returning anything.
@@ -175,18 +570,10 @@ class NautobotAdapter(Adapter, BaseNautobotAdapter):
         # for this many-to-many relationship.
         inner_type = get_inner_type(diffsync_model, parameter_name)
         # TODO: Allow for filtering, i.e. not taking into account all the objects behind the relationship.
-        relationship: Relationship = self.cache.get_from_orm(Relationship, {"label": annotation.name})
-        relationship_associations, _ = get_custom_relationship_associations(
-            relationship=relationship,
-            db_obj=database_object,
-            relationship_side=annotation.side,
-        )
+        relationship, peers = self._get_custom_relationship_peers(annotation)
 
         related_objects_list = []
-        for association in relationship_associations:
-            related_object = getattr(
-                association, "source" if annotation.side == RelationshipSideEnum.DESTINATION else "destination"
-            )
+        for related_object in peers.get(database_object.pk, []):
             dictionary_representation = load_typed_dict(inner_type, related_object)
             # Only use those where there is a single field defined, all 'None's will not help us.
             if any(dictionary_representation.values()):
@@ -276,29 +663,39 @@ class NautobotAdapter(Adapter, BaseNautobotAdapter):
         self, database_object, parameter_name: str, annotation: CustomRelationshipAnnotation
     ):
         """Handle a single custom relationship foreign key field."""
-        relationship_associations, association_count = get_custom_relationship_associations(
-            relationship=self.cache.get_from_orm(Relationship, {"label": annotation.name}),
-            db_obj=database_object,
-            relationship_side=annotation.side,
-        )
+        _, peers = self._get_custom_relationship_peers(annotation)
+        related_objects = peers.get(database_object.pk, [])
 
-        if association_count == 0:
+        if not related_objects:
             return None
-        if association_count > 1:
+        if len(related_objects) > 1:
             self.job.logger.warning(
-                f"Foreign key ({database_object.__name__}.{parameter_name}) "
+                f"Foreign key ({type(database_object).__name__}.{parameter_name}) "
                 "custom relationship matched two associations - this shouldn't happen."
             )
 
         return orm_attribute_lookup(
-            getattr(
-                relationship_associations.first(),
-                "source" if annotation.side == RelationshipSideEnum.DESTINATION else "destination",
-            ),
+            related_objects[0],
             # Discard the first part of the paramater name as it references the initial related object
             re.sub("^(.*?)__", "", parameter_name),
         )
 
+    def _get_custom_relationship_peers(self, annotation: CustomRelationshipAnnotation):
+        """Get a custom relationship and the related objects of all objects on the annotated side of it.
+
+        The associations of a relationship are fetched once per load and side rather than once per object.
+
+        :return: A tuple of the relationship and a dictionary mapping object IDs to lists of related objects.
+        """
+        key = (annotation.name, annotation.side)
+        if key not in self.custom_relationship_peers:
+            relationship: Relationship = self.cache.get_from_orm(Relationship, {"label": annotation.name})
+            self.custom_relationship_peers[key] = (
+                relationship,
+                get_custom_relationship_peers(relationship, annotation.side),
+            )
+        return self.custom_relationship_peers[key]
+
     def get_or_create_metadatatype(self):
         """Retrieve or create a MetadataType object to track the last sync time of this SSoT job."""
         # MetadataType name will be extracted from the Data Source name.
@@ -0,0 +1,491 @@
+"""Bulk write support for `NautobotModel` CRUD operations issued through `NautobotAdapter`."""
+
+# pylint: disable=protected-access
+# Diffsync relies on underscore-prefixed attributes quite heavily, which is why we disable this here.
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Type
+from uuid import UUID
+
+from diffsync.exceptions import ObjectCrudException
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.core.exceptions import FieldDoesNotExist, MultipleObjectsReturned, ObjectDoesNotExist, ValidationError
+from django.db import DatabaseError, transaction
+from django.db.models import ManyToManyField, Model, ProtectedError
+from django.utils import timezone
+from nautobot.extras.models import Relationship, RelationshipAssociation
+
+from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
+from nautobot_ssot.contrib.types import CustomFieldAnnotation, CustomRelationshipAnnotation, RelationshipSideEnum
+from nautobot_ssot.utils.cache import ORMCache
+
+# Errors that can be raised while preparing a single queued object. These are recorded as failures for that object
+# instead of aborting the whole flush.
+_OBJECT_ERRORS = (ObjectCrudException, ObjectDoesNotExist, MultipleObjectsReturned, ValidationError, ValueError)
+
+
+def _batched(iterable: Iterable, batch_size: int):
+    """Yield lists of at most `batch_size` items from `iterable`."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+@dataclass
+class QueuedOperation:
+    """A single create or update of an ORM object, queued for a bulk write."""
+
+    diffsync_model: Type
+    action: str
+    unique_id: str
+    parameters: Dict[str, Any]
+    pk: Optional[UUID] = None
+    obj: Optional[Model] = None
+    relationship_parameters: Dict[str, Any] = field(default_factory=dict)
+
+
+class BulkOperationQueue:
+    """Queue of pending CRUD operations for the models of a `NautobotAdapter` in bulk mode.
+
+    Operations are queued per diffsync model class while diffsync runs through the diff and are written to the
+    database in `flush`, which `NautobotAdapter.sync_complete` calls once the sync has finished:
+
+    1. Creates and updates are written per model class in dependency order, i.e. a model is always written after
+       the models its foreign keys point to, using `bulk_create` and `bulk_update`. Foreign keys are only resolved at
+       this point so they can point to objects that are created in the same sync.
+    2. Many-to-many fields and custom relationships are applied in bulk once all rows exist.
+    3. Deletes are issued in batches in reverse dependency order.
+
+    A batch that fails at the database level is retried object by object, so that a single bad record only fails
+    itself. Every failure is logged to the job and recorded in `failures`.
+    """
+
+    def __init__(self, adapter):
+        """Initialize the queue for the given adapter."""
+        self.adapter = adapter
+        self.failures: List[Dict[str, Any]] = []
+        self._seen_models: List[Type] = []
+        self._creates: Dict[Type, List[QueuedOperation]] = defaultdict(list)
+        self._updates: Dict[Type, List[QueuedOperation]] = defaultdict(list)
+        self._deletes: Dict[Type, Dict[UUID, str]] = defaultdict(dict)
+
+    def __len__(self):
+        """Return the number of queued operations."""
+        return (
+            sum(len(operations) for operations in self._creates.values())
+            + sum(len(operations) for operations in self._updates.values())
+            + sum(len(pks) for pks in self._deletes.values())
+        )
+
+    def _register(self, diffsync_model):
+        if diffsync_model not in self._seen_models:
+            self._seen_models.append(diffsync_model)
+
+    def queue_create(self, diffsync_model, unique_id: str, parameters: Dict[str, Any]):
+        """Queue the creation of an ORM object of `diffsync_model._model` with the given parameters."""
+        self._register(diffsync_model)
+        self._creates[diffsync_model].append(
+            QueuedOperation(
+                diffsync_model,
+                SyncLogEntryActionChoices.ACTION_CREATE,
+                unique_id,
+                parameters,
+                obj=diffsync_model._model(),
+            )
+        )
+
+    def queue_update(self, diffsync_model, unique_id: str, pk: UUID, parameters: Dict[str, Any]):
+        """Queue the update of the ORM object with primary key `pk` with the given parameters."""
+        self._register(diffsync_model)
+        self._updates[diffsync_model].append(
+            QueuedOperation(diffsync_model, SyncLogEntryActionChoices.ACTION_UPDATE, unique_id, parameters, pk=pk)
+        )
+
+    def queue_delete(self, diffsync_model, unique_id: str, pk: UUID):
+        """Queue the deletion of the ORM object with primary key `pk`."""
+        self._register(diffsync_model)
+        self._deletes[diffsync_model][pk] = unique_id
+
+    def get_batch_size(self, diffsync_model) -> int:
+        """Return the batch size to use for the given diffsync model class."""
+        return self.adapter.bulk_batch_sizes.get(diffsync_model.get_type(), self.adapter.bulk_batch_size)
+
+    def get_dependency_order(self) -> List[Type]:
+        """Return the queued diffsync model classes ordered so that each one comes after the ones it depends on.
+
+        The order in which the models were first queued, which follows the adapter's `top_level` and `_children`
+        hierarchy, is kept wherever foreign keys don't require otherwise.
+        """
+        by_orm_model = defaultdict(list)
+        for diffsync_model in self._seen_models:
+            by_orm_model[diffsync_model._model].append(diffsync_model)
+        dependencies = {}
+        for diffsync_model in self._seen_models:
+            dependencies[diffsync_model] = {
+                dependency
+                for django_field in diffsync_model._model._meta.concrete_fields
+                if django_field.is_relation and django_field.related_model is not diffsync_model._model
+                for dependency in by_orm_model.get(django_field.related_model, [])
+            }
+
+        ordered = []
+        remaining = list(self._seen_models)
+        while remaining:
+            ready = [model for model in remaining if not dependencies[model].intersection(remaining)]
+            # Break dependency cycles by falling back to the order in which the models were queued.
+            ordered.append(ready[0] if ready else remaining[0])
+            remaining.remove(ordered[-1])
+        return ordered
+
+    def flush(self):
+        """Write all queued operations to the database and empty the queue."""
+        order = self.get_dependency_order()
+        written = []
+        for diffsync_model in order:
+            written.extend(self._flush_creates(diffsync_model))
+            written.extend(self._flush_updates(diffsync_model))
+        self._apply_relationships(written)
+        for diffsync_model in reversed(order):
+            self._flush_deletes(diffsync_model)
+        if getattr(self.adapter, "metadata_type", None):
+            for operation in written:
+                try:
+                    operation.diffsync_model._update_obj_metadata(operation.obj, self.adapter)
+                except _OBJECT_ERRORS as error:
+                    self._record_failure(operation.diffsync_model, operation.unique_id, operation.action, error)
+        # Bulk operations don't send `post_save`/`post_delete` signals, so the shared cache has to be told explicitly.
+        shared_cache = getattr(self.adapter.cache, "shared_cache", None)
+        if shared_cache is not None:
+            for diffsync_model in order:
+                shared_cache.invalidate(ORMCache.get_model_cache_key(diffsync_model._model))
+        self._seen_models.clear()
+
+    def _record_failure(self, diffsync_model, unique_id: str, action: str, error):
+        """Log a failed operation to the job and keep track of it."""
+        message = f"Bulk {action} of {diffsync_model.get_type()} {unique_id} failed: {error}"
+        self.failures.append(
+            {"model": diffsync_model.get_type(), "unique_id": unique_id, "action": action, "error": str(error)}
+        )
+        job = self.adapter.job
+        job.logger.error(message)
+        if getattr(job, "sync", None):
+            job.sync_log(
+                action=action,
+                status=SyncLogEntryStatusChoices.STATUS_FAILURE,
+                message=message,
+                object_repr=f"{diffsync_model.get_type()} {unique_id}",
+            )
+
+    @staticmethod
+    def _is_relationship_parameter(diffsync_model, parameter_name: str) -> bool:
+        """Return whether a parameter can only be applied once the row itself exists in the database."""
+        annotation = diffsync_model.get_attr_annotation(parameter_name)
+        if isinstance(annotation, CustomRelationshipAnnotation):
+            return True
+        if isinstance(annotation, CustomFieldAnnotation) or "__" in parameter_name:
+            return False
+        try:
+            django_field = diffsync_model._model._meta.get_field(parameter_name)
+        except FieldDoesNotExist:
+            return False
+        return django_field.many_to_many or django_field.one_to_many
+
+    def _prepare(self, operation: QueuedOperation):
+        """Set all fields on the operation's ORM object that live in its own row, resolving foreign keys."""
+        relationship_fields = operation.diffsync_model._get_relationship_fields_dict()
+        operation.relationship_parameters = {}
+        for parameter_name, value in operation.parameters.items():
+            if self._is_relationship_parameter(operation.diffsync_model, parameter_name):
+                operation.relationship_parameters[parameter_name] = value
+                continue
+            operation.diffsync_model._handle_single_field(
+                parameter_name, operation.obj, value, relationship_fields, self.adapter
+            )
+        operation.diffsync_model._lookup_and_set_foreign_keys(
+            relationship_fields["foreign_keys"], operation.obj, self.adapter
+        )
+
+    @staticmethod
+    def _validate(obj: Model):
+        """Validate an object, leaving uniqueness to the database to avoid one query per object."""
+        obj.full_clean(validate_unique=False, validate_constraints=False)
+
+    def _flush_creates(self, diffsync_model) -> List[QueuedOperation]:
+        """Bulk create the queued objects of a model, returning the operations that were written."""
+        pending = self._creates.pop(diffsync_model, [])
+        written = []
+        # Objects with a foreign key to another object of the same model that is also being created (e.g. a location
+        # and its parent) can only be resolved once their counterpart exists, so we create such objects in rounds.
+        while pending:
+            ready, deferred = [], []
+            for operation in pending:
+                try:
+                    self._prepare(operation)
+                except (ObjectCrudException, ObjectDoesNotExist) as error:
+                    deferred.append((operation, error))
+                    continue
+                except _OBJECT_ERRORS as error:
+                    self._record_failure(diffsync_model, operation.unique_id, operation.action, error)
+                    continue
+                try:
+                    self._validate(operation.obj)
+                except ValidationError as error:
+                    self._record_failure(diffsync_model, operation.unique_id, operation.action, error)
+                    continue
+                ready.append(operation)
+            if not ready:
+                for operation, error in deferred:
+                    self._record_failure(diffsync_model, operation.unique_id, operation.action, error)
+                break
+            for batch in _batched(ready, self.get_batch_size(diffsync_model)):
+                written.extend(self._write_batch(diffsync_model, batch))
+            pending = [operation for operation, _ in deferred]
+        return written
+
+    def _flush_updates(self, diffsync_model) -> List[QueuedOperation]:
+        """Bulk update the queued objects of a model, returning the operations that were written."""
+        written = []
+        batch_size = self.get_batch_size(diffsync_model)
+        for batch in _batched(self._updates.pop(diffsync_model, []), batch_size):
+            objects = diffsync_model._model.objects.in_bulk([operation.pk for operation in batch])
+            ready = []
+            update_fields = set()
+            for operation in batch:
+                operation.obj = objects.get(operation.pk)
+                if operation.obj is None:
+                    self._record_failure(
+                        diffsync_model,
+                        operation.unique_id,
+                        operation.action,
+                        f"No such {diffsync_model._model._meta.verbose_name} instance with PK {operation.pk}",
+                    )
+                    continue
+                try:
+                    self._prepare(operation)
+                    self._validate(operation.obj)
+                except _OBJECT_ERRORS as error:
+                    self._record_failure(diffsync_model, operation.unique_id, operation.action, error)
+                    continue
+                update_fields.update(self._get_update_fields(diffsync_model, operation))
+                ready.append(operation)
+            written.extend(self._write_batch(diffsync_model, ready, update_fields=update_fields))
+        return written
+
+    def _get_update_fields(self, diffsync_model, operation: QueuedOperation) -> set:
+        """Return the names of the concrete fields that need to be written for an update operation."""
+        model_meta = diffsync_model._model._meta
+        update_fields = set()
+        for parameter_name in operation.parameters:
+            if parameter_name in operation.relationship_parameters:
+                continue
+            if isinstance(diffsync_model.get_attr_annotation(parameter_name), CustomFieldAnnotation):
+                update_fields.add("_custom_field_data")
+                continue
+            try:
+                django_field = model_meta.get_field(parameter_name.split("__", maxsplit=1)[0])
+            except FieldDoesNotExist:
+                django_field = None
+            if isinstance(django_field, GenericForeignKey):
+                update_fields.update((django_field.ct_field, django_field.fk_field))
+            elif django_field is not None and django_field.concrete:
+                update_fields.add(django_field.name)
+            else:
+                # Parameters such as property setters can touch any field, so all of them need to be written.
+                update_fields = {field.name for field in model_meta.concrete_fields if not field.primary_key}
+                break
+        if update_fields and any(model_field.name == "last_updated" for model_field in model_meta.concrete_fields):
+            operation.obj.last_updated = timezone.now()
+            update_fields.add("last_updated")
+        return update_fields
+
+    def _write_batch(self, diffsync_model, batch: List[QueuedOperation], update_fields=None) -> List[QueuedOperation]:
+        """Write a batch of objects, falling back to saving them one by one if the batch fails."""
+        if not batch:
+            return []
+        objects = [operation.obj for operation in batch]
+        try:
+            with transaction.atomic():
+                if update_fields is None:
+                    diffsync_model._model.objects.bulk_create(objects)
+                elif update_fields:
+                    diffsync_model._model.objects.bulk_update(objects, fields=sorted(update_fields))
+            return batch
+        except DatabaseError:
+            pass
+
+        written = []
+        for operation in batch:
+            try:
+                with transaction.atomic():
+                    operation.obj.save()
+            except (DatabaseError, ValidationError, ValueError) as error:
+                self._record_failure(diffsync_model, operation.unique_id, operation.action, error)
+                continue
+            written.append(operation)
+        return written
+
+    def _apply_relationships(self, operations: List[QueuedOperation]):
+        """Apply many-to-many fields and custom relationships in bulk for objects that have been written."""
+        # Example: {(Interface, "ip_addresses"): {<Interface>: [<IPAddress 1>, <IPAddress 2>]}}
+        many_to_many = defaultdict(dict)
+        # Example: {(<Relationship>, RelationshipSideEnum.SOURCE): {<UUID>: {<UUID 1>, <UUID 2>}}}
+        associations = defaultdict(lambda: defaultdict(set))
+        for operation in operations:
+            if not operation.relationship_parameters:
+                continue
+            diffsync_model = operation.diffsync_model
+            relationship_fields = diffsync_model._get_relationship_fields_dict()
+            try:
+                for parameter_name, value in operation.relationship_parameters.items():
+                    diffsync_model._handle_single_field(
+                        parameter_name, operation.obj, value, relationship_fields, self.adapter
+                    )
+                peers = self._resolve_custom_relationship_foreign_keys(
+                    relationship_fields["custom_relationship_foreign_keys"]
+                )
+            except _OBJECT_ERRORS as error:
+                self._record_failure(diffsync_model, operation.unique_id, operation.action, error)
+                continue
+            for dictionary in relationship_fields["custom_relationship_many_to_many_fields"].values():
+                annotation = dictionary["annotation"]
+                relationship = self.adapter.get_from_orm_cache({"label": annotation.name}, Relationship)
+                peers.append((relationship, annotation.side, [related.id for related in dictionary["objects"]]))
+            for relationship, side, peer_ids in peers:
+                associations[(relationship, side)][operation.obj.id].update(peer_ids)
+            for field_name, related_objects in relationship_fields["many_to_many_fields"].items():
+                many_to_many[(diffsync_model, field_name)][operation.obj] = related_objects
+
+        for (diffsync_model, field_name), related_objects_by_object in many_to_many.items():
+            self._set_many_to_many_field(diffsync_model, field_name, related_objects_by_object)
+        for (relationship, side), peer_ids_by_object in associations.items():
+            self._set_relationship_associations(relationship, side, peer_ids_by_object)
+
+    def _resolve_custom_relationship_foreign_keys(self, custom_relationship_foreign_keys) -> list:
+        """Resolve the peer objects of custom relationship foreign keys into `(relationship, side, [id])` tuples."""
+        resolved = []
+        for related_model_dict in custom_relationship_foreign_keys.values():
+            annotation = related_model_dict.pop("_annotation")
+            try:
+                relationship = self.adapter.get_from_orm_cache({"label": annotation.name}, Relationship)
+            except Relationship.DoesNotExist as error:
+                raise ObjectCrudException(f"No such relationship with label '{annotation.name}'") from error
+            if annotation.side == RelationshipSideEnum.SOURCE:
+                related_model_class = relationship.destination_type.model_class()
+            else:
+                related_model_class = relationship.source_type.model_class()
+            try:
+                related_object = self.adapter.get_from_orm_cache(related_model_dict, related_model_class)
+            except related_model_class.DoesNotExist as error:
+                raise ObjectCrudException(
+                    f"Couldn't resolve custom relationship {relationship.name}, no such {related_model_class._meta.verbose_name} object with parameters {related_model_dict}."
+                ) from error
+            resolved.append((relationship, annotation.side, [related_object.id]))
+        return resolved
+
+    def _set_many_to_many_field(self, diffsync_model, field_name: str, related_objects_by_object: Dict[Model, list]):
+        """Replace the contents of a many-to-many field for many objects at once."""
+        django_field = diffsync_model._model._meta.get_field(field_name)
+        through = getattr(django_field.remote_field, "through", None)
+        # Only auto-created through tables are written directly. Custom through models (and reverse relations or
+        # generic ones like tags) may carry additional fields or logic, so they go through the related manager.
+        if not isinstance(django_field, ManyToManyField) or not through._meta.auto_created:
+            for obj, related_objects in related_objects_by_object.items():
+                try:
+                    with transaction.atomic():
+                        getattr(obj, field_name).set(related_objects)
+                except (DatabaseError, ValidationError, ValueError) as error:
+                    self._record_failure(diffsync_model, str(obj.pk), SyncLogEntryActionChoices.ACTION_UPDATE, error)
+            return
+
+        source_attname = through._meta.get_field(django_field.m2m_field_name()).attname
+        target_attname = through._meta.get_field(django_field.m2m_reverse_field_name()).attname
+        desired = {
+            (obj.pk, related_object.pk)
+            for obj, related_objects in related_objects_by_object.items()
+            for related_object in related_objects
+        }
+        batch_size = self.get_batch_size(diffsync_model)
+        try:
+            with transaction.atomic():
+                for batch in _batched([obj.pk for obj in related_objects_by_object], batch_size):
+                    existing = {
+                        (source_id, target_id): pk
+                        for pk, source_id, target_id in through.objects.filter(
+                            **{f"{source_attname}__in": batch}
+                        ).values_list("pk", source_attname, target_attname)
+                    }
+                    through.objects.filter(pk__in=[pk for key, pk in existing.items() if key not in desired]).delete()
+                    desired.difference_update(existing)
+                through.objects.bulk_create(
+                    [
+                        through(**{source_attname: source_id, target_attname: target_id})
+                        for source_id, target_id in desired
+                    ],
+                    batch_size=batch_size,
+                )
+        except DatabaseError as error:
+            self._record_failure(diffsync_model, field_name, SyncLogEntryActionChoices.ACTION_UPDATE, error)
+
+    def _set_relationship_associations(self, relationship, side, peer_ids_by_object: Dict[UUID, set]):
+        """Replace the custom relationship associations of many objects on one side of a relationship at once."""
+        if side == RelationshipSideEnum.SOURCE:
+            own_attname, peer_attname = "source_id", "destination_id"
+        else:
+            own_attname, peer_attname = "destination_id", "source_id"
+        parameters = {
+            "relationship": relationship,
+            "source_type": relationship.source_type,
+            "destination_type": relationship.destination_type,
+        }
+        desired = {(obj_id, peer_id) for obj_id, peer_ids in peer_ids_by_object.items() for peer_id in peer_ids}
+        try:
+            with transaction.atomic():
+                for batch in _batched(peer_ids_by_object, self.adapter.bulk_batch_size):
+                    existing = {
+                        (obj_id, peer_id): pk
+                        for pk, obj_id, peer_id in RelationshipAssociation.objects.filter(
+                            **parameters, **{f"{own_attname}__in": batch}
+                        ).values_list("pk", own_attname, peer_attname)
+                    }
+                    RelationshipAssociation.objects.filter(
+                        pk__in=[pk for key, pk in existing.items() if key not in desired]
+                    ).delete()
+                    desired.difference_update(existing)
+                RelationshipAssociation.objects.bulk_create(
+                    [
+                        RelationshipAssociation(**parameters, **{own_attname: obj_id, peer_attname: peer_id})
+                        for obj_id, peer_id in desired
+                    ],
+                    batch_size=self.adapter.bulk_batch_size,
+                )
+        except DatabaseError as error:
+            self.adapter.job.logger.error(
+                f"Bulk update of relationship '{relationship.label}' associations failed: {error}"
+            )
+
+    def _flush_deletes(self, diffsync_model):
+        """Delete the queued objects of a model in batches, falling back to one by one if a batch is protected."""
+        queryset = diffsync_model._model.objects.all()
+        unique_ids = self._deletes.pop(diffsync_model, {})
+        for batch in _batched(unique_ids, self.get_batch_size(diffsync_model)):
+            try:
+                with transaction.atomic():
+                    queryset.filter(pk__in=batch).delete()
+                continue
+            except (ProtectedError, DatabaseError):
+                pass
+            for pk in batch:
+                try:
+                    with transaction.atomic():
+                        queryset.filter(pk=pk).delete()
+                except ProtectedError:
+                    self._record_failure(
+                        diffsync_model,
+                        unique_ids[pk],
+                        SyncLogEntryActionChoices.ACTION_DELETE,
+                        "it is referenced by another object",
+                    )
+                except DatabaseError as error:
+                    self._record_failure(diffsync_model, unique_ids[pk], SyncLogEntryActionChoices.ACTION_DELETE, error)
@@ -5,15 +5,17 @@
 
 from collections import defaultdict
 from datetime import datetime
+from typing import ClassVar, Optional
 
 from diffsync import DiffSyncModel
 from diffsync.exceptions import ObjectCrudException, ObjectNotCreated, ObjectNotDeleted, ObjectNotUpdated
 from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import MultipleObjectsReturned, ValidationError
-from django.db.models import ProtectedError, QuerySet
+from django.core.exceptions import FieldDoesNotExist, MultipleObjectsReturned, ValidationError
+from django.db.models import Prefetch, ProtectedError, QuerySet
 from nautobot.extras.choices import RelationshipTypeChoices
 from nautobot.extras.models import Relationship, RelationshipAssociation
 from nautobot.extras.models.metadata import ObjectMetadata
+from typing_extensions import get_type_hints
 
 from nautobot_ssot.contrib.base import BaseNautobotModel
 from nautobot_ssot.contrib.types import (
@@ -22,6 +24,8 @@ from nautobot_ssot.contrib.types import (
     RelationshipSideEnum,
 )
 from nautobot_ssot.utils.diffsync import DiffSyncModelUtilityMixin
+from nautobot_ssot.utils.orm import add_prefetch_lookups
+from nautobot_ssot.utils.typing import get_inner_type
 
 
 class NautobotModel(DiffSyncModel, DiffSyncModelUtilityMixin, BaseNautobotModel):
@@ -35,20 +39,67 @@ class NautobotModel(DiffSyncModel, DiffSyncModelUtilityMixin, BaseNautobotModel)
     model class.
     """
 
+    # Whether `NautobotAdapter` may load this model from `values_list` rows rather than model instances, provided all
+    # of its parameters are plain fields, custom fields or foreign key lookups of plain fields.
+    _load_from_values: ClassVar[bool] = True
+    # Whether `NautobotAdapter` may construct this model from database values without validation, overriding the
+    # adapter's `trusted_data` flag unless left at `None`.
+    _trusted_data: ClassVar[Optional[bool]] = None
+    # Number of rows `NautobotAdapter` fetches at a time when loading this model, overriding the adapter's
+    # `load_chunk_size` unless left at `None`.
+    _load_chunk_size: ClassVar[Optional[int]] = None
+
     @classmethod
     def _get_queryset(cls) -> QuerySet:
         """Get the queryset used to load the models data from Nautobot."""
-        available_fields = {field.name for field in cls._model._meta.get_fields()}
-        parameter_names = [
-            parameter for parameter in cls.get_synced_attributes() if parameter.split("__")[0] in available_fields
-        ]
-        # Here we identify any foreign keys (i.e. fields with '__' in them) so that we can load them directly in the
-        # first query if this function hasn't been overridden.
-        prefetch_related_parameters = [
-            "__".join(parameter.split("__")[:-1]) for parameter in parameter_names if "__" in parameter
-        ]
-        qs = cls.get_queryset()
-        return qs.prefetch_related(*prefetch_related_parameters)
+        return add_prefetch_lookups(cls.get_queryset(), cls._get_prefetch_lookups())
+
+    @classmethod
+    def _get_prefetch_lookups(cls) -> list:
+        """Get the lookups to prefetch in order to load the synced attributes of many objects in few queries."""
+        available_fields = {field.name: field for field in cls._model._meta.get_fields()}
+        lookups = []
+        for parameter in cls.get_synced_attributes():
+            django_field = available_fields.get(parameter.split("__")[0])
+            if django_field is None:
+                continue
+            # Here we identify any foreign keys (i.e. fields with '__' in them) so that we can load them directly in
+            # the first query if this function hasn't been overridden.
+            if "__" in parameter:
+                lookups.append("__".join(parameter.split("__")[:-1]))
+            # One- and many-to-many fields are prefetched along with the foreign keys of their typed dictionaries.
+            elif (django_field.many_to_many or django_field.one_to_many) and not cls.get_attr_annotation(parameter):
+                lookups.extend(cls._get_to_many_prefetch_lookups(parameter, django_field.related_model))
+        return lookups
+
+    @classmethod
+    def _get_to_many_prefetch_lookups(cls, parameter_name, related_model) -> list:
+        """Get the lookups to prefetch a to-many field, joining the foreign keys looked up by its typed dictionary."""
+        try:
+            typed_dict_keys = get_type_hints(get_inner_type(cls, parameter_name))
+        except (AttributeError, TypeError):
+            return [parameter_name]
+        select_related = []
+        nested_lookups = []
+        for key in typed_dict_keys:
+            if "__" not in key:
+                continue
+            path = key.split("__")[:-1]
+            model_class = related_model
+            try:
+                for relation_name in path:
+                    relation = model_class._meta.get_field(relation_name)
+                    if not (relation.concrete and (relation.many_to_one or relation.one_to_one)):
+                        raise FieldDoesNotExist
+                    model_class = relation.related_model
+                select_related.append("__".join(path))
+            except FieldDoesNotExist:
+                # Lookups that can't be joined, e.g. through generic foreign keys, are prefetched separately instead.
+                nested_lookups.append("__".join([parameter_name, *path]))
+        if not select_related:
+            return [parameter_name, *nested_lookups]
+        queryset = related_model._default_manager.select_related(*select_related)
+        return [Prefetch(parameter_name, queryset=queryset), *nested_lookups]
 
     @classmethod
     def get_queryset(cls) -> QuerySet:
@@ -70,6 +121,9 @@ class NautobotModel(DiffSyncModel, DiffSyncModelUtilityMixin, BaseNautobotModel)
 
     def update(self, attrs):
         """Update the ORM object corresponding to this diffsync object."""
+        if getattr(self.adapter, "bulk_mode", False):
+            self.adapter.bulk_queue.queue_update(self.__class__, self.get_unique_id(), self.pk, attrs)
+            return super().update(attrs)
         try:
             obj = self.get_from_db()
             self._update_obj_with_parameters(obj, attrs, self.adapter)
@@ -81,6 +135,9 @@ class NautobotModel(DiffSyncModel, DiffSyncModelUtilityMixin, BaseNautobotModel)
 
     def delete(self):
         """Delete the ORM object corresponding to this diffsync object."""
+        if getattr(self.adapter, "bulk_mode", False):
+            self.adapter.bulk_queue.queue_delete(self.__class__, self.get_unique_id(), self.pk)
+            return super().delete()
         try:
             obj = self.get_from_db()
         except ObjectCrudException as error:
@@ -99,6 +156,11 @@ class NautobotModel(DiffSyncModel, DiffSyncModelUtilityMixin, BaseNautobotModel)
         parameters = ids.copy()
         parameters.update(attrs)
 
+        # In bulk mode, the object is written by the adapter's bulk queue once the sync is complete.
+        if getattr(adapter, "bulk_mode", False):
+            adapter.bulk_queue.queue_create(cls, cls.create_unique_id(**ids), parameters)
+            return super().create(adapter, ids, attrs)
+
         # This is in fact callable, because it is a model
         obj = cls._model()  # pylint: disable=not-callable
 
@@ -116,7 +178,7 @@ class NautobotModel(DiffSyncModel, DiffSyncModelUtilityMixin, BaseNautobotModel)
         return super().create(adapter, ids, attrs)
 
     @classmethod
-    def _handle_single_field(cls, field, obj, value, relationship_fields, adapter):  # pylint: disable=too-many-arguments,too-many-locals, too-many-branches
+    def _handle_single_field(cls, field, obj, value, relationship_fields, adapter):  # pylint: disable=too-many-arguments
         """Set a single field on a Django object to a given value, or, for relationship fields, prepare setting.
 
         :param field: The name of the field to set.
@@ -126,13 +188,48 @@ class NautobotModel(DiffSyncModel, DiffSyncModelUtilityMixin, BaseNautobotModel)
             This is mutated over the course of this function.
         :param adapter: The related diffsync adapter used for looking up things in the cache.
         """
+        cls._get_field_setter(field)(obj, value, relationship_fields, adapter)
+
+    @classmethod
+    def _get_field_setter(cls, field):
+        """Get the function that `_handle_single_field` uses to set a given field, compiling it on first use.
+
+        Annotations and Django fields are resolved once per process and field rather than once per object and field.
+        The compiled setters are kept on each model class for the lifetime of the process, see `clear_field_setters`.
+
+        :param field: The name of the field to set.
+        :return: A function taking the same arguments as `_handle_single_field` except for the field name.
+        """
+        # Looked up in the class' own namespace, so that subclasses don't share the setters of their parents.
+        setters = cls.__dict__.get("_field_setters")
+        if setters is None:
+            setters = {}
+            cls._field_setters = setters
+        setter = setters.get(field)
+        if setter is None:
+            setter = setters[field] = cls._compile_field_setter(field)
+        return setter
+
+    @classmethod
+    def clear_field_setters(cls):
+        """Drop the compiled field setters of this model class, e.g. after changing its annotations in tests."""
+        cls.__dict__.get("_field_setters", {}).clear()
+
+    @classmethod
+    def _compile_field_setter(cls, field):
+        """Compile the function that `_handle_single_field` uses to set a given field."""
+        # pylint: disable=unused-argument
         cls._check_field(field)
 
         # Handle custom fields. See CustomFieldAnnotation docstring for more details.
         annotation = cls.get_attr_annotation(field)
         if isinstance(annotation, CustomFieldAnnotation):
-            obj.cf[annotation.key] = value
-            return
+            custom_field_key = annotation.key
+
+            def set_custom_field(obj, value, relationship_fields, adapter):
+                obj.cf[custom_field_key] = value
+
+            return set_custom_field
 
         custom_relationship_annotation = annotation if isinstance(annotation, CustomRelationshipAnnotation) else None
 
@@ -149,68 +246,130 @@ class NautobotModel(DiffSyncModel, DiffSyncModelUtilityMixin, BaseNautobotModel)
             related_model, lookup = field.split("__", maxsplit=1)
             # Custom relationship foreign keys
             if custom_relationship_annotation:
-                relationship_fields["custom_relationship_foreign_keys"][related_model][lookup] = value
-                relationship_fields["custom_relationship_foreign_keys"][related_model]["_annotation"] = (
-                    custom_relationship_annotation
-                )
+
+                def set_custom_relationship_foreign_key(obj, value, relationship_fields, adapter):
+                    relationship_fields["custom_relationship_foreign_keys"][related_model][lookup] = value
+                    relationship_fields["custom_relationship_foreign_keys"][related_model]["_annotation"] = (
+                        custom_relationship_annotation
+                    )
+
+                return set_custom_relationship_foreign_key
+
             # Normal foreign keys
-            else:
-                django_field = cls._model._meta.get_field(related_model)
+            related_model_class = cls._model._meta.get_field(related_model).related_model
+
+            def set_foreign_key(obj, value, relationship_fields, adapter):
                 relationship_fields["foreign_keys"][related_model][lookup] = value
                 # Add a special key to the dictionary to point to the related model's class
-                relationship_fields["foreign_keys"][related_model]["_model_class"] = django_field.related_model
-            return
+                relationship_fields["foreign_keys"][related_model]["_model_class"] = related_model_class
+
+            return set_foreign_key
 
         # Prepare handling of custom relationship many-to-many fields.
         if custom_relationship_annotation:
-            relationship = adapter.get_from_orm_cache({"label": custom_relationship_annotation.name}, Relationship)
-            if custom_relationship_annotation.side == RelationshipSideEnum.DESTINATION:
-                related_object_content_type = relationship.source_type
-            else:
-                related_object_content_type = relationship.destination_type
-            related_model_class = related_object_content_type.model_class()
-            if (
-                relationship.type == RelationshipTypeChoices.TYPE_ONE_TO_MANY
-                and custom_relationship_annotation.side == RelationshipSideEnum.DESTINATION
-            ):
-                relationship_fields["custom_relationship_foreign_keys"][field] = {
-                    **value,
-                    "_annotation": custom_relationship_annotation,
-                }
-            else:
-                relationship_fields["custom_relationship_many_to_many_fields"][field] = {
-                    "annotation": custom_relationship_annotation,
-                    "objects": [adapter.get_from_orm_cache(parameters, related_model_class) for parameters in value],
-                }
 
-            return
+            def set_custom_relationship_to_many_field(obj, value, relationship_fields, adapter):
+                cls._prepare_custom_relationship_to_many_field(
+                    field, custom_relationship_annotation, value, relationship_fields, adapter
+                )
+
+            return set_custom_relationship_to_many_field
 
         django_field = cls._model._meta.get_field(field)
 
         # Prepare handling of many-to-many fields. If we are dealing with a many-to-many field,
         # we get all the related objects here to later set them once the object has been saved.
         if django_field.many_to_many or django_field.one_to_many:
-            try:
-                relationship_fields["many_to_many_fields"][field] = [
-                    adapter.get_from_orm_cache(parameters, django_field.related_model) for parameters in value
-                ]
-            except django_field.related_model.DoesNotExist as error:
-                raise ObjectCrudException(
-                    f"Unable to populate many to many relationship '{django_field.name}' with parameters {value}, at least one related object not found."
-                ) from error
-            except MultipleObjectsReturned as error:
-                raise ObjectCrudException(
-                    f"Unable to populate many to many relationship '{django_field.name}' with parameters {value}, at least one related object found twice."
-                ) from error
-            return
+
+            def set_many_to_many_field(obj, value, relationship_fields, adapter):
+                try:
+                    relationship_fields["many_to_many_fields"][field] = [
+                        adapter.get_from_orm_cache(parameters, django_field.related_model) for parameters in value
+                    ]
+                except django_field.related_model.DoesNotExist as error:
+                    raise ObjectCrudException(
+                        f"Unable to populate many to many relationship '{django_field.name}' with parameters {value}, at least one related object not found."
+                    ) from error
+                except MultipleObjectsReturned as error:
+                    raise ObjectCrudException(
+                        f"Unable to populate many to many relationship '{django_field.name}' with parameters {value}, at least one related object found twice."
+                    ) from error
+
+            return set_many_to_many_field
 
         # As the default case, just set the attribute directly
-        setattr(obj, field, value)
+        def set_attribute(obj, value, relationship_fields, adapter):
+            setattr(obj, field, value)
+
+        return set_attribute
 
     @classmethod
-    def _update_obj_with_parameters(cls, obj, parameters, adapter):
-        """Update a given Nautobot ORM object with the given parameters."""
-        relationship_fields = {
+    def _prepare_custom_relationship_to_many_field(  # pylint: disable=too-many-arguments
+        cls, field, annotation, value, relationship_fields, adapter
+    ):
+        """Prepare setting a one- or many-to-many custom relationship field once the object has been saved."""
+        relationship = adapter.get_from_orm_cache({"label": annotation.name}, Relationship)
+        if annotation.side == RelationshipSideEnum.DESTINATION:
+            related_object_content_type = relationship.source_type
+        else:
+            related_object_content_type = relationship.destination_type
+        related_model_class = related_object_content_type.model_class()
+        if (
+            relationship.type == RelationshipTypeChoices.TYPE_ONE_TO_MANY
+            and annotation.side == RelationshipSideEnum.DESTINATION
+        ):
+            relationship_fields["custom_relationship_foreign_keys"][field] = {
+                **value,
+                "_annotation": annotation,
+            }
+        else:
+            relationship_fields["custom_relationship_many_to_many_fields"][field] = {
+                "annotation": annotation,
+                "objects": [adapter.get_from_orm_cache(parameters, related_model_class) for parameters in value],
+            }
+
+    @classmethod
+    def _get_related_object_parameters(cls, parameters):
+        """Get the parameters that will be used to look up related objects when writing the given parameters.
+
+        This mirrors the handling of foreign keys and many-to-many fields in `_handle_single_field` without touching
+        the database, so that `NautobotAdapter` can prefetch the related objects of many operations at once.
+
+        :param parameters: The parameters of a create or update operation.
+        :return: A list of `(model_class, lookup_parameters)` tuples.
+        """
+        related_object_parameters = []
+        # Example: {"tenant": {"name": "Tenant 1", "group__name": "Group 1"}}
+        foreign_keys = defaultdict(dict)
+        for field, value in parameters.items():
+            # Custom fields and custom relationships are looked up differently.
+            if field not in cls.model_fields or cls.get_attr_annotation(field):  # pylint: disable=unsupported-membership-test
+                continue
+            if "__" in field:
+                related_model, lookup = field.split("__", maxsplit=1)
+                foreign_keys[related_model][lookup] = value
+                continue
+            try:
+                django_field = cls._model._meta.get_field(field)
+            except FieldDoesNotExist:
+                continue
+            if (django_field.many_to_many or django_field.one_to_many) and value:
+                related_object_parameters.extend((django_field.related_model, lookup) for lookup in value)
+
+        for related_model, lookup in foreign_keys.items():
+            try:
+                model_class = cls._model._meta.get_field(related_model).related_model
+            except FieldDoesNotExist:
+                continue
+            # Generic foreign keys don't point to a single model, and foreign keys without values are set to `None`.
+            if model_class and any(lookup.values()):
+                related_object_parameters.append((model_class, lookup))
+        return related_object_parameters
+
+    @staticmethod
+    def _get_relationship_fields_dict():
+        """Get the helper dictionary that `_handle_single_field` fills with information on relationship fields."""
+        return {
             # Example: {"group": {"name": "Group Name", "_model_class": TenantGroup}}
             "foreign_keys": defaultdict(dict),
             # Example: {"tags": [Tag-1, Tag-2]}
@@ -220,6 +379,11 @@ class NautobotModel(DiffSyncModel, DiffSyncModelUtilityMixin, BaseNautobotModel)
             # Example: TODO
             "custom_relationship_many_to_many_fields": defaultdict(dict),
         }
+
+    @classmethod
+    def _update_obj_with_parameters(cls, obj, parameters, adapter):
+        """Update a given Nautobot ORM object with the given parameters."""
+        relationship_fields = cls._get_relationship_fields_dict()
         for field, value in parameters.items():
             cls._handle_single_field(field, obj, value, relationship_fields, adapter)
 
@@ -25,7 +25,7 @@ class SyncFilterSet(BaseFilterSet):  # pylint: disable=too-many-ancestors
         model = models.Sync
 
         # add any fields from the model that you would like to filter your searches by using those
-        fields = ["dry_run", "job_result"]  # pylint: disable=nb-use-fields-all
+        fields = ["dry_run", "job_result", "parent", "shard"]  # pylint: disable=nb-use-fields-all
 
 
 class SyncLogEntryFilterSet(NautobotFilterSet):  # pylint: disable=too-many-ancestors
@@ -288,8 +288,7 @@ class IpFabricDataSource(DataSource):
         if debug_mode:
             self.logger.debug("Diff: %s", diff.dict())
 
-        self.sync.diff = diff.dict()
-        self.sync.save()
+        self.sync.store_diff(diff.dict())
         create = diff.summary().get("create")
         update = diff.summary().get("update")
         delete = diff.summary().get("delete")
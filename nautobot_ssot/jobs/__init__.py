@@ -11,6 +11,7 @@ from nautobot_ssot.exceptions import JobException
 from nautobot_ssot.integrations.utils import each_enabled_integration_module
 from nautobot_ssot.jobs.base import DataSource, DataTarget
 from nautobot_ssot.jobs.examples import ExampleDataSource, ExampleDataTarget
+from nautobot_ssot.jobs.maintenance import PruneSyncHistory
 
 logger = logging.getLogger("nautobot.ssot")
 
@@ -31,6 +32,7 @@ def _add_integrations():
 
 
 _add_integrations()
+jobs.append(PruneSyncHistory)
 register_jobs(*jobs)
 
 
@@ -1,34 +1,44 @@
 # pylint: disable=protected-access
 """Base Job classes for sync workers."""
 
+import io
 import logging
+import pickle
 import threading
-import traceback
 import tracemalloc
-from collections import namedtuple
+from collections import Counter, defaultdict, namedtuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Iterable, Optional
+from typing import Any, Dict, Iterable, Optional
 
+import billiard
 import structlog
 from celery.utils.log import get_logger
 
 # pylint-django doesn't understand classproperty, and complains unnecessarily. We disable this specific warning:
 # pylint: disable=no-self-argument
+from diffsync.diff import Diff
 from diffsync.enum import DiffSyncFlags
+from diffsync.store.local import LocalStore
+from django import forms
 from django.conf import settings
 from django.db import connections
 from django.db.utils import OperationalError
 from django.templatetags.static import static
 from django.utils import timezone
 from django.utils.functional import classproperty
-from nautobot.extras.jobs import BooleanVar, DryRunVar, Job
-from nautobot.extras.models import JobLogEntry, JobResult
+from nautobot.extras.jobs import BooleanVar, DryRunVar, Job, StringVar
+from nautobot.extras.models import JobResult
 
 from nautobot_ssot.choices import SyncLogEntryActionChoices
 from nautobot_ssot.contrib.adapter import NautobotAdapter
 from nautobot_ssot.models import BaseModel, Sync, SyncLogEntry
+from nautobot_ssot.utils.cache import ORMCache
+from nautobot_ssot.utils.diffsync import calculate_diff_in_parallel, sync_in_parallel
+from nautobot_ssot.utils.parallel_load import JobLogEntryWriter, ThreadLogHandler, format_log_message
+from nautobot_ssot.utils.store import DiskStore
+from nautobot_ssot.utils.sync_log import SyncLogEntryBuffer
 
 DataMapping = namedtuple("DataMapping", ["source_name", "source_url", "target_name", "target_url"])
 """Entry in the list returned by a job's data_mappings() API.
@@ -44,59 +54,6 @@ and the other system acting as data source/target.
 """
 
 
-class ThreadLogHandler(logging.Handler):
-    """Handler that collects log records for later processing in parallel adapter loading."""
-
-    def __init__(self, job_logger_name, thread_id):
-        """Initialize the thread log handler.
-
-        Args:
-            job_logger_name: Name of the job logger to capture logs from.
-            thread_id: ID of the thread that owns this handler.
-        """
-        super().__init__()
-        self.records = []
-        self.job_logger_name = job_logger_name
-        self.thread_id = thread_id  # Store the thread ID that owns this handler
-        # List of logger names to exclude (noisy third-party libraries)
-        self.excluded_loggers = [
-            "urllib3",
-            "requests",
-            "httpcore",
-            "httpx",
-            "asyncio",
-            "django.db.backends",  # SQL query logs
-        ]
-
-    def emit(self, record):
-        """Store the log record if it's relevant to the job and from this thread."""
-        # Only capture logs from the thread that owns this handler
-        current_thread_id = threading.get_ident()
-        if current_thread_id != self.thread_id:
-            return  # This log is from a different thread, ignore it
-
-        # Skip DEBUG level logs from excluded loggers
-        if record.levelno == logging.DEBUG:
-            logger_name = record.name
-            # Check if this logger is in our exclusion list
-            for excluded in self.excluded_loggers:
-                if logger_name.startswith(excluded):
-                    return  # Skip this log record
-
-        # Capture logs from:
-        # 1. The job logger (exact match)
-        # 2. Nautobot loggers (any level)
-        # 3. Nautobot SSOT loggers (any level)
-        # 4. Any INFO level or above logs (to catch important messages from other sources)
-        if (
-            record.name == self.job_logger_name
-            or record.name.startswith("nautobot")
-            or record.name.startswith("nautobot_ssot")
-            or record.levelno >= logging.INFO
-        ):
-            self.records.append(record)
-
-
 class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
     """Common base class for data synchronization jobs.
 
@@ -122,6 +79,84 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         description="Load source and target adapters in parallel for improved performance.",
         default=False,
     )
+    parallel_diff = BooleanVar(
+        description=(
+            "Calculate the diffs of the top-level models in parallel threads. Only faster where diffing releases the "
+            "GIL, such as on free-threaded Python builds."
+        ),
+        default=False,
+    )
+    parallel_sync = BooleanVar(
+        description="Sync independent objects of the diff in parallel for improved performance.",
+        default=False,
+    )
+    summarize_unchanged_records = BooleanVar(
+        description="Record the number of unchanged records per model instead of a sync log entry for each of them.",
+        default=False,
+    )
+    disk_backed_store = BooleanVar(
+        description="Keep the loaded data of the adapters in a temporary database on disk to reduce memory usage.",
+        default=False,
+    )
+    sharded_execution = BooleanVar(
+        description="Split the sync into shards that are loaded, diffed and synced by separate job runs in parallel.",
+        default=False,
+    )
+    # Set on the job runs dispatched for each shard when `sharded_execution` is set
+    shard = StringVar(required=False, default="", widget=forms.HiddenInput())
+    parent_sync = StringVar(required=False, default="", widget=forms.HiddenInput())
+
+    # While the job runs, SyncLogEntry records are buffered and written in bulk once `sync_log_flush_size` of them
+    # have accumulated, or when a record is logged `sync_log_flush_interval` seconds after the previous write.
+    sync_log_flush_size = 1000
+    sync_log_flush_interval = 5.0
+    # When `summarize_unchanged_records` is set, the first `unchanged_records_sample_size` unchanged records of each
+    # model are still logged individually as a sample.
+    unchanged_records_sample_size = 0
+    # Maximum number of threads calculating diffs when `parallel_diff` is set, `None` for the `ThreadPoolExecutor`
+    # default.
+    parallel_diff_max_workers = None
+    # Diff class to calculate the diff with, serially or in parallel.
+    diff_class = Diff
+    # When `parallel_loading` is set, load the adapters in forked processes rather than threads, so that CPU-bound
+    # loading isn't serialized by the GIL. See `ProcessAdapterLoader` for the requirements on the adapters.
+    parallel_loading_use_processes = False
+    # Maximum number of threads syncing objects when `parallel_sync` is set, and the top-level model types whose
+    # objects depend on each other (such as nested locations) and must therefore still be synced one after another.
+    parallel_sync_max_workers = 4
+    parallel_sync_serial_types = ()
+    # Name of the data that `get_shards()` splits the sync by when `sharded_execution` is set (such as "location"),
+    # and the Celery queue that the job runs of the shards are sent to, `None` for the default queue.
+    shard_key = None
+    shard_task_queue = None
+    # When `disk_backed_store` is set, number of most recently used objects that each adapter keeps in memory, and the
+    # directory of the database files, `None` for the system's temporary directory. See `DiskStore`.
+    disk_store_cache_size = 10000
+    disk_store_directory = None
+
+    def get_shards(self):
+        """Method to return the values of `shard_key` that the sync is split by when `sharded_execution` is set.
+
+        A separate job run is dispatched for each of the returned values, which is available to it as `self.shard`.
+        Its adapters must then only load the data of that shard, so that the shards can be synced independently.
+        The `sharded_execution` option is only offered by jobs that implement this method.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def supports_sharded_execution(cls):
+        """Whether this job implements `get_shards()`, and can therefore be run with `sharded_execution`."""
+        return cls.get_shards is not DataSyncBaseJob.get_shards
+
+    def get_adapter_store(self):
+        """Get the `internal_storage_engine` to instantiate the adapters of this job with.
+
+        This is a new `DiskStore` when `disk_backed_store` is set, and DiffSync's in-memory `LocalStore` otherwise.
+        `NautobotAdapter` uses it by default, other adapters need to be passed it explicitly.
+        """
+        if self.disk_backed_store:
+            return DiskStore(cache_size=self.disk_store_cache_size, directory=self.disk_store_directory)
+        return LocalStore
 
     def load_source_adapter(self):
         """Method to instantiate and load the SOURCE adapter into `self.source_adapter`.
@@ -147,16 +182,25 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         This is a generic implementation that you could overwrite completely in your custom logic.
         """
         if self.source_adapter is not None and self.target_adapter is not None:
-            self.diff = self.source_adapter.diff_to(self.target_adapter, flags=self.diffsync_flags)
+            if self.parallel_diff:
+                self.diff = calculate_diff_in_parallel(
+                    self.source_adapter,
+                    self.target_adapter,
+                    flags=self.diffsync_flags,
+                    max_workers=self.parallel_diff_max_workers,
+                    diff_class=self.diff_class,
+                )
+            else:
+                self.diff = self.source_adapter.diff_to(
+                    self.target_adapter, diff_class=self.diff_class, flags=self.diffsync_flags
+                )
             self.sync.diff = {}
             self.sync.summary = self.diff.summary()
             self.sync.save()
             try:
-                self.sync.diff = self.diff.dict()
-                self.sync.save()
+                self.sync.store_diff(self.diff.dict())
             except OperationalError:
                 self.logger.warning("Unable to save JSON diff to the database; likely the diff is too large.")
-                self.sync.refresh_from_db()
             self.logger.info(self.diff.summary())
         else:
             self.logger.warning("Not both adapters were properly initialized prior to diff calculation.")
@@ -167,163 +211,128 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         This is a generic implementation that you could overwrite completely in your custom logic.
         """
         if self.source_adapter is not None and self.target_adapter is not None:
-            self.source_adapter.sync_to(self.target_adapter, flags=self.diffsync_flags)
+            if self.parallel_sync:
+                diff = self.diff
+                if diff is None:
+                    diff = self.source_adapter.diff_to(
+                        self.target_adapter, diff_class=self.diff_class, flags=self.diffsync_flags
+                    )
+                sync_in_parallel(
+                    self.source_adapter,
+                    self.target_adapter,
+                    diff,
+                    flags=self.diffsync_flags,
+                    max_workers=self.parallel_sync_max_workers,
+                    serial_types=self.parallel_sync_serial_types,
+                )
+            else:
+                self.source_adapter.sync_to(self.target_adapter, flags=self.diffsync_flags)
         else:
             self.logger.warning("Not both adapters were properly initialized prior to synchronization.")
 
-    def _load_adapter_parallel(self, adapter_type):
-        """Load an adapter in a separate thread using ThreadedAdapterLoader.
+    def _get_adapter_loader(self, adapter_type, log_writer=None):
+        """Get the loader of an adapter, loading it in a separate process if `parallel_loading_use_processes` is set.
 
         Args:
             adapter_type: Either "source" or "target" to specify which adapter to load.
+            log_writer: Writer to stream the captured log messages to as they are logged.
 
         Returns:
-            tuple: (adapter_type, adapter, error, log_records, duration)
+            ThreadedAdapterLoader: Loader of the adapter.
         """
-        loader = ThreadedAdapterLoader(
+        loader_class = ProcessAdapterLoader if self.parallel_loading_use_processes else ThreadedAdapterLoader
+        return loader_class(
             adapter=adapter_type,
             job=self,
             job_result=self.job_result,
             log_level=logging.DEBUG,
+            log_writer=log_writer,
         )
 
+    def _load_adapter_parallel(self, adapter_type, log_writer=None, loader=None):
+        """Load an adapter in a separate thread using ThreadedAdapterLoader.
+
+        Args:
+            adapter_type: Either "source" or "target" to specify which adapter to load.
+            log_writer: Writer to stream the captured log messages to as they are logged.
+            loader: Loader to load the adapter with, e.g. an already started `ProcessAdapterLoader`, or `None` to
+                get one from `_get_adapter_loader`.
+
+        Returns:
+            tuple: (adapter_type, adapter, error, log_records, duration), where log_records are the captured log
+                records that haven't been passed to `log_writer`
+        """
+        if loader is None:
+            loader = self._get_adapter_loader(adapter_type, log_writer=log_writer)
+
         try:
             adapter = loader.load()
-            return (adapter_type, adapter, None, loader.log_handler.records, loader.duration)
+            return (adapter_type, adapter, None, loader.log_records, loader.duration)
         except Exception as error:  # pylint: disable=broad-except
-            return (adapter_type, None, error, loader.log_handler.records, loader.duration)
+            return (adapter_type, None, error, loader.log_records, loader.duration)
 
-    def _load_source_adapter_parallel(self):
+    def _load_source_adapter_parallel(self, log_writer=None, loader=None):
         """Load source adapter in a separate thread.
 
         Returns:
             tuple: (adapter_type, adapter, error, log_records, duration)
         """
-        return self._load_adapter_parallel("source")
+        return self._load_adapter_parallel("source", log_writer=log_writer, loader=loader)
 
-    def _load_target_adapter_parallel(self):
+    def _load_target_adapter_parallel(self, log_writer=None, loader=None):
         """Load target adapter in a separate thread.
 
         Returns:
             tuple: (adapter_type, adapter, error, log_records, duration)
         """
-        return self._load_adapter_parallel("target")
+        return self._load_adapter_parallel("target", log_writer=log_writer, loader=loader)
 
-    def _load_adapters_parallel(self):  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+    def _load_adapters_parallel(self):  # pylint: disable=too-many-locals
         """Load source and target adapters in parallel using ThreadPoolExecutor.
 
+        Log messages of the loading threads are written to the job result by a `JobLogEntryWriter` while loading.
+        When loading in separate processes, both processes are forked from the job's thread before the writer's and
+        the loading threads are started, see `ProcessAdapterLoader.start`.
+
         Returns:
             tuple: (source_adapter, target_adapter, source_duration, target_duration) after both have been loaded
         """
-        source_adapter = None
-        target_adapter = None
-        source_error = None
-        target_error = None
-
-        # Store reference needed for logger setup in threads
-        job_result = self.job_result
-
-        source_log_records = []
-        target_log_records = []
-        source_duration = None
-        target_duration = None
-
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            # Submit both adapter loading tasks
-            future_to_adapter = {
-                executor.submit(self._load_source_adapter_parallel): "source",
-                executor.submit(self._load_target_adapter_parallel): "target",
-            }
+        adapters = {"source": None, "target": None}
+        errors = {"source": None, "target": None}
+        durations = {"source": None, "target": None}
 
-            # Wait for both to complete
-            for future in as_completed(future_to_adapter):
-                adapter_type, adapter, error, log_records, duration = future.result()
-                if error:
-                    if adapter_type == "source":
-                        source_error = error
-                        source_log_records = log_records
-                        source_duration = duration
-                    else:
-                        target_error = error
-                        target_log_records = log_records
-                        target_duration = duration
-                else:
-                    if adapter_type == "source":
-                        source_adapter = adapter
-                        self.source_adapter = adapter  # Ensure it's set on self
-                        source_log_records = log_records
-                        source_duration = duration
-                    else:
-                        target_adapter = adapter
-                        self.target_adapter = adapter  # Ensure it's set on self
-                        target_log_records = log_records
-                        target_duration = duration
-
-        # Create JobLogEntry objects for all captured log messages
-        # This ensures logs from threads are visible in the Job Results
-        # Merge source and target logs by timestamp to show interleaved execution
-
-        def create_job_log_entry(record, adapter_type):
-            """Create a single JobLogEntry object from a log record."""
-            # Map logging levels to appropriate log levels for JobLogEntry
-            if record.levelno >= logging.ERROR:
-                log_level = "error"
-            elif record.levelno >= logging.WARNING:
-                log_level = "warning"
-            elif record.levelno >= logging.INFO:
-                log_level = "info"
-            else:
-                log_level = "debug"
-
-            # Format the message
-            message = record.getMessage()
-            if record.exc_info:
-                # Include exception information if present
-                message += "\n" + "".join(traceback.format_exception(*record.exc_info))
-
-            # Use the custom grouping from the log record's extra dict if present,
-            # falling back to adapter_type ("source"/"target") when not set.
-            custom_grouping = record.__dict__.get("grouping")
-            if custom_grouping:
-                grouping = f"{custom_grouping} ({adapter_type})"
-            else:
-                grouping = adapter_type
-
-            # Note: JobLogEntry fields may vary by Nautobot version, using common fields
-            JobLogEntry.objects.create(
-                job_result=job_result,
-                log_level=log_level,
-                message=message,
-                grouping=grouping,
-            )
+        loaders = {"source": None, "target": None}
+        if self.parallel_loading_use_processes:
+            for adapter_type in loaders:
+                loaders[adapter_type] = self._get_adapter_loader(adapter_type).start()
 
-        # Merge source and target logs by timestamp to show interleaved execution
-        # Tag each record with its adapter type before merging
-        all_log_records = []
-        for record in source_log_records:
-            all_log_records.append((record.created, "source", record))
-        for record in target_log_records:
-            all_log_records.append((record.created, "target", record))
-
-        # Remove duplicates based on message and timestamp
-        seen_messages = set()
-        unique_records = []
-        for timestamp, adapter_type, record in all_log_records:
-            # Create a unique key for the message
-            message_key = (record.getMessage(), timestamp)
-            if message_key not in seen_messages:
-                seen_messages.add(message_key)
-                unique_records.append((timestamp, adapter_type, record))
-
-        # Sort by timestamp to show chronological order (interleaved execution)
-        unique_records.sort(key=lambda x: x[0])
-
-        # Create JobLogEntry objects in chronological order
-        for timestamp, adapter_type, record in unique_records:
-            create_job_log_entry(record, adapter_type)
+        log_writer = JobLogEntryWriter(self.job_result).start()
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Submit both adapter loading tasks
+                futures = [
+                    executor.submit(self._load_source_adapter_parallel, log_writer, loaders["source"]),
+                    executor.submit(self._load_target_adapter_parallel, log_writer, loaders["target"]),
+                ]
+
+                # Wait for both to complete
+                for future in as_completed(futures):
+                    adapter_type, adapter, error, log_records, duration = future.result()
+                    adapters[adapter_type] = adapter
+                    errors[adapter_type] = error
+                    durations[adapter_type] = duration
+                    if adapter is not None:
+                        setattr(self, f"{adapter_type}_adapter", adapter)  # Ensure it's set on self
+                    # Records that couldn't be streamed, e.g. those of adapters loaded in a separate process.
+                    for record in log_records:
+                        log_writer.write(record, adapter_type)
+        finally:
+            log_writer.close()
+
+        source_adapter, target_adapter = adapters["source"], adapters["target"]
+        source_duration, target_duration = durations["source"], durations["target"]
 
         # Log timing messages for each adapter to match sequential loading format
-        # Create JobLogEntry objects explicitly to ensure they're stored in the database
         if source_adapter is not None and source_duration is not None:
             # Log using logger to match sequential loading behavior
             message = f"Source Load Time from {source_adapter}: {source_duration}"
@@ -335,10 +344,10 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
             self.logger.info(message)
 
         # Raise errors if any occurred
-        if source_error:
-            raise source_error
-        if target_error:
-            raise target_error
+        if errors["source"]:
+            raise errors["source"]
+        if errors["target"]:
+            raise errors["target"]
 
         return source_adapter, target_adapter, source_duration, target_duration
 
@@ -493,6 +502,26 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
             if memory_profiling:
                 record_memory_trace("sync")
 
+        self.record_cache_statistics()
+
+    def record_cache_statistics(self):
+        """Store the statistics of the adapters' ORM caches, if any, on the Sync record.
+
+        The statistics of disk-backed adapter stores are logged, to compare them with the memory usage of the sync.
+        """
+        cache_statistics = {}
+        for adapter_type in ("source", "target"):
+            adapter = getattr(self, f"{adapter_type}_adapter", None)
+            cache = getattr(adapter, "cache", None)
+            if isinstance(cache, ORMCache):
+                cache_statistics[adapter_type] = cache.statistics()
+            store = getattr(adapter, "store", None)
+            if isinstance(store, DiskStore):
+                self.logger.info("Disk-backed store of the %s adapter: %s", adapter_type, store.statistics())
+        if cache_statistics:
+            self.sync.cache_statistics = cache_statistics
+            self.sync.save()
+
     def lookup_object(  # pylint: disable=unused-argument
         self,
         model_name,
@@ -511,6 +540,23 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         """
         return None
 
+    def lookup_objects(self, model_name, unique_ids) -> Dict[str, Optional[BaseModel]]:
+        """Look up the Nautobot records, if any, identified by a model name and several unique IDs.
+
+        While the job runs, the synced objects of buffered SyncLogEntry records are resolved in bulk when the buffer
+        is flushed, with one call to this method per model name. The default implementation calls `lookup_object` for
+        each unique ID; override it to look up all of them with a single query.
+
+        Args:
+            model_name (str): DiffSyncModel class name or similar class/model label.
+            unique_ids (list[str]): DiffSyncModel unique_ids or similar unique identifiers.
+
+        Returns:
+            Dict[str, Optional[BaseModel]]: Nautobot model instance or None, keyed by unique ID. Missing keys are
+                treated as None.
+        """
+        return {unique_id: self.lookup_object(model_name, unique_id) for unique_id in unique_ids}
+
     @classmethod
     def data_mappings(cls) -> Iterable[DataMapping]:
         """List the data mappings involved in this sync job."""
@@ -538,7 +584,7 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         if synced_object and not object_repr:
             object_repr = repr(synced_object)
 
-        SyncLogEntry.objects.create(
+        entry = SyncLogEntry(
             sync=self.sync,
             action=action,
             status=status,
@@ -547,24 +593,68 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
             synced_object=synced_object,
             object_repr=object_repr,
         )
+        self._save_sync_log_entry(entry)
+
+    def _save_sync_log_entry(self, entry, lookup=None):
+        """Buffer or save a SyncLogEntry, resolving its synced object from the `(model_name, unique_id)` lookup."""
+        if self.sync_log_buffer is not None:
+            self.sync_log_buffer.add(entry, lookup)
+            return
+        if lookup is not None:
+            self._resolve_synced_objects([(entry, lookup)])
+        entry.save()
+        entry.sync.add_log_counts([entry])
+
+    def _resolve_synced_objects(self, pending_lookups):
+        """Set the synced object of SyncLogEntry records, looking up the objects of each model in one batch.
+
+        Args:
+            pending_lookups (list): `(entry, (model_name, unique_id))` tuples.
+        """
+        unique_ids_by_model = defaultdict(dict)
+        for _, (model_name, unique_id) in pending_lookups:
+            unique_ids_by_model[model_name][unique_id] = None
+        synced_objects = {
+            model_name: self.lookup_objects(model_name, list(unique_ids))
+            for model_name, unique_ids in unique_ids_by_model.items()
+        }
+        for entry, (model_name, unique_id) in pending_lookups:
+            synced_object = synced_objects[model_name].get(unique_id)
+            entry.synced_object = synced_object
+            entry.object_repr = repr(synced_object) if synced_object else f"{model_name} {unique_id}"
+
+    def record_unchanged_summary(self):
+        """Store the number of unchanged records per model on the Sync, if these were summarized."""
+        if self.summarize_unchanged_records:
+            self.sync.unchanged_summary = dict(self.unchanged_records)
+            self.sync.save()
+
+    def flush_sync_log(self):
+        """Write any buffered SyncLogEntry records to the database."""
+        if self.sync_log_buffer is not None:
+            self.sync_log_buffer.flush()
 
     def _structlog_to_sync_log_entry(self, _logger, _log_method, event_dict):
         """Capture certain structlog messages from DiffSync into the Nautobot database."""
         if all(key in event_dict for key in ("src", "dst", "action", "model", "unique_id", "diffs", "status")):
+            if not event_dict["action"] and self.summarize_unchanged_records:
+                # DiffSync may log from several threads when `parallel_sync` is set.
+                with self._unchanged_records_lock:
+                    self.unchanged_records[event_dict["model"]] += 1
+                    count = self.unchanged_records[event_dict["model"]]
+                if count > self.unchanged_records_sample_size:
+                    return event_dict
             # The DiffSync log gives us a model name (string) and unique_id (string).
-            # Try to look up the actual Nautobot object that this describes.
-            synced_object = self.lookup_object(  # pylint: disable=assignment-from-none
-                event_dict["model"], event_dict["unique_id"]
-            )
-            object_repr = repr(synced_object) if synced_object else f"{event_dict['model']} {event_dict['unique_id']}"
-            self.sync_log(
+            # The actual Nautobot object that this describes is looked up when the entry is written.
+            entry = SyncLogEntry(
+                sync=self.sync,
                 action=event_dict["action"] or SyncLogEntryActionChoices.ACTION_NO_CHANGE,
                 diff=event_dict["diffs"] if event_dict["action"] else None,
                 status=event_dict["status"],
                 message=event_dict["event"],
-                synced_object=synced_object,
-                object_repr=object_repr,
+                object_repr=f"{event_dict['model']} {event_dict['unique_id']}",
             )
+            self._save_sync_log_entry(entry, lookup=(event_dict["model"], event_dict["unique_id"]))
 
         return event_dict
 
@@ -583,6 +673,24 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
 
         if hasattr(cls, "parallel_loading"):
             got_vars["parallel_loading"] = cls.parallel_loading
+
+        if hasattr(cls, "parallel_diff"):
+            got_vars["parallel_diff"] = cls.parallel_diff
+
+        if hasattr(cls, "parallel_sync"):
+            got_vars["parallel_sync"] = cls.parallel_sync
+
+        if hasattr(cls, "summarize_unchanged_records"):
+            got_vars["summarize_unchanged_records"] = cls.summarize_unchanged_records
+
+        if hasattr(cls, "disk_backed_store"):
+            got_vars["disk_backed_store"] = cls.disk_backed_store
+
+        for name in ("sharded_execution", "shard", "parent_sync"):
+            if not cls.supports_sharded_execution():
+                got_vars.pop(name, None)
+            elif hasattr(cls, name):
+                got_vars[name] = getattr(cls, name)
         return got_vars
 
     def __init__(self):
@@ -592,6 +700,14 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         self.diff = None
         self.source_adapter = None
         self.target_adapter = None
+        self.sync_log_buffer = None
+        self.parallel_diff = False
+        self.parallel_sync = False
+        self.disk_backed_store = False
+        self.sharded_execution = False
+        self.shard = None
+        self.unchanged_records = Counter()
+        self._unchanged_records_lock = threading.Lock()
         # Default diffsync flags. You can overwrite them at any time.
         self.diffsync_flags = DiffSyncFlags.CONTINUE_ON_FAILURE | DiffSyncFlags.LOG_UNCHANGED_RECORDS
 
@@ -633,6 +749,15 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         self.dryrun = kwargs.get("dryrun", True)
         self.memory_profiling = kwargs.get("memory_profiling", False)
         self.parallel_loading = kwargs.get("parallel_loading", False)
+        self.parallel_diff = kwargs.get("parallel_diff", False)
+        self.parallel_sync = kwargs.get("parallel_sync", False)
+        self.summarize_unchanged_records = kwargs.get("summarize_unchanged_records", False)
+        self.disk_backed_store = kwargs.get("disk_backed_store", False)
+        self.sharded_execution = kwargs.get("sharded_execution", False)
+        self.shard = kwargs.get("shard") or None
+        if self.sharded_execution and self.shard is None and not self.supports_sharded_execution():
+            raise ValueError(f"{type(self).__name__} doesn't implement get_shards(), required for sharded execution.")
+        self.unchanged_records = Counter()
         self.sync = Sync.objects.create(
             source=self.data_source,
             target=self.data_target,
@@ -640,7 +765,12 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
             job_result=self.job_result,
             start_time=timezone.now(),
             diff={},
+            parent_id=kwargs.get("parent_sync") or None,
+            shard=self.shard or "",
         )
+        if self.sharded_execution and self.shard is None:
+            self.dispatch_shards(kwargs)
+            return
 
         # Add _structlog_to_sync_log_entry as a processor for structlog calls from DiffSync
         structlog.configure(
@@ -653,7 +783,80 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
             wrapper_class=structlog.stdlib.BoundLogger,
             cache_logger_on_first_use=True,
         )
-        self.sync_data(self.memory_profiling)
+        self.sync_log_buffer = SyncLogEntryBuffer(
+            flush_size=self.sync_log_flush_size,
+            flush_interval=self.sync_log_flush_interval,
+            resolve_synced_objects=self._resolve_synced_objects,
+        )
+        try:
+            self.sync_data(self.memory_profiling)
+        except BaseException:
+            # Don't let a failure to write the log entries mask the original error.
+            try:
+                self.flush_sync_log()
+                self.record_unchanged_summary()
+                self.sync.refresh_log_counts()
+            except Exception:  # pylint: disable=broad-except
+                self.logger.exception("Unable to write %s buffered sync log entries.", len(self.sync_log_buffer))
+            self.close_adapter_stores()
+            if self.sync.parent_id:
+                self._aggregate_into_parent_sync()
+            raise
+        finally:
+            buffer, self.sync_log_buffer = self.sync_log_buffer, None
+        try:
+            buffer.flush()
+            self.record_unchanged_summary()
+            self.sync.refresh_log_counts()
+        finally:
+            # Only once the last log entries are written, as resolving their synced objects may use the adapters.
+            self.close_adapter_stores()
+        if self.sync.parent_id:
+            self._aggregate_into_parent_sync()
+
+    def close_adapter_stores(self):
+        """Close the disk-backed stores of the adapters, if any, deleting their databases."""
+        for adapter in (self.source_adapter, self.target_adapter):
+            store = getattr(adapter, "store", None)
+            if isinstance(store, DiskStore):
+                store.close()
+
+    def dispatch_shards(self, kwargs):
+        """Dispatch a job run for each shard returned by `get_shards()`, with the Sync of this run as their parent.
+
+        The shards run independently on any available Celery workers, so that the failure of a shard doesn't affect
+        the others. This run doesn't wait for them, instead each shard aggregates its results into the parent Sync
+        once it is done. The number of shards is recorded on the parent Sync, which shows how many of them are
+        still pending or have failed.
+        """
+        shards = [str(shard) for shard in self.get_shards()]
+        self.sync.shard_count = len(shards)
+        self.sync.save(update_fields=["shard_count"])
+        self.logger.info("Dispatching %s shards by %s.", len(shards), self.shard_key or "shard")
+        for shard in shards:
+            job_result = JobResult.enqueue_job(
+                self.job_model,
+                self.user,
+                task_queue=self.shard_task_queue,
+                **self.serialize_data({**kwargs, "shard": shard, "parent_sync": str(self.sync.pk)}),
+            )
+            self.logger.info(
+                "Dispatched shard %s as job result %s.",
+                shard,
+                job_result.pk,
+                extra={"grouping": "shards", "object": job_result},
+            )
+        self.logger.info(
+            "The results of the shards are added to this sync as they complete, see its shards for their status.",
+            extra={"object": self.sync},
+        )
+
+    def _aggregate_into_parent_sync(self):
+        """Update the results of the parent Sync with those of this shard, without failing the shard on error."""
+        try:
+            self.sync.parent.aggregate_shards()
+        except Exception:  # pylint: disable=broad-except
+            self.logger.exception("Unable to aggregate the results of shard %s into its parent sync.", self.shard)
 
 
 # pylint: disable=abstract-method
@@ -698,6 +901,7 @@ class ThreadedAdapterLoader:  # pylint: disable=too-many-instance-attributes
 
     # Logging
     log_level: int = field(default=logging.DEBUG)
+    log_writer: Optional[JobLogEntryWriter] = field(default=None, repr=False)
     log_handler: ThreadLogHandler = field(init=False, repr=False)
     job_logger: logging.Logger = field(init=False, repr=False)
     nautobot_logger: logging.Logger = field(init=False, repr=False)
@@ -717,6 +921,11 @@ class ThreadedAdapterLoader:  # pylint: disable=too-many-instance-attributes
         self.root_logger = None
         self.thread_id = None
 
+    @property
+    def log_records(self):
+        """Log records captured while loading the adapter."""
+        return self.log_handler.records if self.log_handler else []
+
     def set_loggers(self):
         """Set up the loggers."""
         # Get the job's logger name
@@ -725,7 +934,7 @@ class ThreadedAdapterLoader:  # pylint: disable=too-many-instance-attributes
         logger_name = f"nautobot.extras.jobs.run_job[{self.job_result.id}]"
 
         # Set up a custom handler to capture log messages from the job logger
-        self.log_handler = ThreadLogHandler(logger_name, self.thread_id)
+        self.log_handler = ThreadLogHandler(logger_name, self.thread_id, writer=self.log_writer, grouping=self.adapter)
         self.log_handler.setLevel(self.log_level)
 
         # Add handler to the job-specific logger
@@ -796,3 +1005,163 @@ class ThreadedAdapterLoader:  # pylint: disable=too-many-instance-attributes
             connections.close_all()
 
         return adapter
+
+
+class _JobPickler(pickle.Pickler):
+    """Pickler replacing references to a job and its attributes with persistent IDs, see `_JobUnpickler`."""
+
+    def __init__(self, file, shared_objects):
+        """Initialize the pickler with a mapping of `id()` to `(persistent_id, object)` of the objects to replace."""
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.shared_objects = shared_objects
+
+    def persistent_id(self, obj):  # pylint: disable=inconsistent-return-statements
+        """Return the persistent ID of a shared object."""
+        shared = self.shared_objects.get(id(obj))
+        if shared is not None:
+            return shared[0]
+
+
+class _JobUnpickler(pickle.Unpickler):
+    """Unpickler resolving the persistent IDs of a `_JobPickler` to a job and its attributes."""
+
+    def __init__(self, file, job):
+        """Initialize the unpickler with the job to resolve persistent IDs to."""
+        super().__init__(file)
+        self.job = job
+
+    def persistent_load(self, pid):
+        """Resolve a persistent ID to the job or one of its attributes."""
+        _, name = pid
+        return self.job if name is None else getattr(self.job, name)
+
+
+@dataclass
+class ProcessAdapterLoader(ThreadedAdapterLoader):
+    """Adapter loader running the job's `load_<adapter>_adapter` method in a forked process.
+
+    This allows CPU-bound loading, such as building many DiffSync models, to run in parallel despite the GIL. The
+    loaded adapter is pickled and sent back to the job's process, where references to the job and to its attributes
+    (e.g. `job_result` or `sync`) are restored to the original objects rather than copies. This requires:
+
+    - the adapter and its models to be picklable, i.e. their classes must be importable module-level classes, and
+    - loading not to rely on side effects other than setting the adapter, as any other changes made to the job in
+      the forked process are lost.
+
+    The `fork` start method is used, which is only available on POSIX systems. Processes are started with `billiard`,
+    which, unlike `multiprocessing`, allows daemonic Celery worker processes to have children.
+    """
+
+    _log_records: list = field(default_factory=list, init=False, repr=False)
+    _process: Any = field(default=None, init=False, repr=False)
+    _receiver: Any = field(default=None, init=False, repr=False)
+
+    @property
+    def log_records(self):
+        """Log records captured in the loading process."""
+        return self._log_records
+
+    @staticmethod
+    def _portable_log_record(record):
+        """Get a picklable copy of a log record, with its arguments and exception formatted into its message."""
+        portable_record = logging.makeLogRecord(
+            {
+                "name": record.name,
+                "levelno": record.levelno,
+                "levelname": record.levelname,
+                "msg": format_log_message(record),
+                "created": record.created,
+            }
+        )
+        if record.__dict__.get("grouping"):
+            portable_record.grouping = record.__dict__["grouping"]
+        return portable_record
+
+    def _load_in_child(self, sender):
+        """Load the adapter and send it back along with the captured logs, in the forked process."""
+        # Objects that also exist in the job's process, which are therefore not pickled.
+        shared_objects = {id(self.job): (("job", None), self.job)}
+        for name, value in vars(self.job).items():
+            if name not in ("source_adapter", "target_adapter") and not isinstance(
+                value, (str, bytes, int, float, bool, type(None))
+            ):
+                shared_objects[id(value)] = (("job", name), value)
+
+        # The writer's thread doesn't exist in this process, the records are written once they are sent back.
+        self.log_writer = None
+        result = {"adapter": None, "error": None}
+        try:
+            result["adapter"] = super().load()
+        except Exception as error:  # pylint: disable=broad-except
+            result["error"] = error
+        result["duration"] = self.duration
+        result["log_records"] = [self._portable_log_record(record) for record in self.log_records]
+
+        buffer = io.BytesIO()
+        try:
+            _JobPickler(buffer, shared_objects).dump(result)
+        except Exception as error:  # pylint: disable=broad-except
+            if result["error"] is None:
+                error = RuntimeError(f"Unable to send the loaded {self.adapter} adapter to the job's process: {error}")
+            else:
+                error = RuntimeError(f"{type(result['error']).__name__}: {result['error']}")
+            result.update({"adapter": None, "error": error})
+            buffer = io.BytesIO()
+            _JobPickler(buffer, shared_objects).dump(result)
+        sender.send_bytes(buffer.getbuffer())
+        sender.close()
+
+    def start(self):
+        """Fork the process loading the adapter.
+
+        Only the calling thread exists in the forked process, but it inherits the locks of all other threads in their
+        current state, e.g. a logging handler's lock held by the `JobLogEntryWriter` thread, which would never be
+        released. Call this from the job's thread before starting any other thread, such as the other adapter's
+        loading thread or the writer's, rather than from a loading thread.
+
+        Returns:
+            ProcessAdapterLoader: This loader, to wait for the loaded adapter with `load`.
+        """
+        # Don't let the forked process inherit the job's database connections.
+        connections.close_all()
+
+        context = billiard.get_context("fork")
+        self._receiver, sender = context.Pipe(duplex=False)
+        self._process = context.Process(
+            target=self._load_in_child, args=(sender,), name=f"ssot-{self.adapter}-loader", daemon=True
+        )
+        self._process.start()
+        sender.close()
+        return self
+
+    def load(self):
+        """Wait for the forked process to load the adapter and return the adapter instance.
+
+        The process is started first unless `start` has been called already.
+
+        Returns:
+            The loaded adapter instance.
+
+        Raises:
+            Exception: If adapter loading fails (preserves original exception type where possible).
+        """
+        if self._process is None:
+            self.start()
+        try:
+            data = self._receiver.recv_bytes()
+        except EOFError:
+            data = None
+        finally:
+            self._receiver.close()
+            self._process.join()
+
+        if data is None:
+            raise RuntimeError(
+                f"Process loading the {self.adapter} adapter exited with code {self._process.exitcode}."
+            )
+        result = _JobUnpickler(io.BytesIO(data), self.job).load()
+        self.duration = result["duration"]
+        self._log_records = result["log_records"]
+        if result["error"] is not None:
+            raise result["error"]
+        return result["adapter"]
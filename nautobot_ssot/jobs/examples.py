@@ -1058,6 +1058,12 @@ class ExampleDataSource(DataSource):  # pylint: disable=too-many-instance-attrib
                 pass
         return None
 
+    def lookup_objects(self, model_name, unique_ids):
+        """Look up Nautobot objects in bulk based on the DiffSync model name and unique IDs."""
+        if model_name == "tenant":
+            return Tenant.objects.in_bulk(unique_ids, field_name="name")
+        return super().lookup_objects(model_name, unique_ids)
+
 
 class ExampleDataTarget(DataTarget):
     """Sync Region and Site data from the local Nautobot instance to a remote Nautobot instance."""
@@ -1163,3 +1169,9 @@ class ExampleDataTarget(DataTarget):
             except Tenant.DoesNotExist:
                 pass
         return None
+
+    def lookup_objects(self, model_name, unique_ids):
+        """Look up Nautobot objects in bulk based on the DiffSync model name and unique IDs."""
+        if model_name == "tenant":
+            return Tenant.objects.in_bulk(unique_ids, field_name="name")
+        return super().lookup_objects(model_name, unique_ids)
@@ -0,0 +1,58 @@
+"""Maintenance jobs for the SSoT app."""
+
+from nautobot.extras.jobs import DryRunVar, IntegerVar, Job
+
+from nautobot_ssot.utils.retention import prune_sync_history
+
+
+class PruneSyncHistory(Job):
+    """Delete old syncs, along with their log entries and diffs, in bounded batches."""
+
+    retention_days = IntegerVar(
+        description="Delete syncs that started more than this many days ago.",
+        default=90,
+        min_value=0,
+    )
+    keep_last = IntegerVar(
+        description="Keep this many of the most recent syncs of each job, regardless of their age.",
+        default=10,
+        min_value=0,
+    )
+    diff_retention_days = IntegerVar(
+        description="Drop the diffs, but keep the logs, of syncs that started more than this many days ago.",
+        required=False,
+        min_value=0,
+    )
+    batch_size = IntegerVar(
+        description="Maximum number of records to delete per query.",
+        default=1000,
+        min_value=1,
+    )
+    dryrun = DryRunVar(description="Only report how many records would be deleted.", default=True)
+
+    class Meta:
+        """Metaclass attributes of PruneSyncHistory."""
+
+        name = "Prune SSoT Sync History"
+        description = "Delete old syncs, along with their log entries and diffs, in bounded batches."
+        has_sensitive_variables = False
+
+    def run(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        """Prune the sync history according to the job variables."""
+        dryrun = kwargs.get("dryrun", True)
+        result = prune_sync_history(
+            retention_days=kwargs.get("retention_days", 90),
+            keep_last=kwargs.get("keep_last", 10),
+            diff_retention_days=kwargs.get("diff_retention_days"),
+            batch_size=kwargs.get("batch_size", 1000),
+            dry_run=dryrun,
+        )
+        self.logger.info(
+            "%s %s syncs with %s log entries and %s the diffs of %s other syncs.",
+            "Would delete" if dryrun else "Deleted",
+            result.syncs,
+            result.log_entries,
+            "drop" if dryrun else "dropped",
+            result.diffs,
+        )
+        return {"syncs": result.syncs, "log_entries": result.log_entries, "diffs": result.diffs}
@@ -0,0 +1,58 @@
+"""Django Management command to delete old SSoT sync history."""
+
+from django.core.management.base import BaseCommand
+
+from nautobot_ssot.utils.retention import prune_sync_history
+
+
+class Command(BaseCommand):
+    """MGMT command to delete old syncs, along with their log entries and diffs, in bounded batches."""
+
+    help = "Delete SSoT syncs older than a retention period, along with their log entries and diffs."
+
+    def add_arguments(self, parser):  # noqa: D102
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=90,
+            help="Delete syncs that started more than this many days ago (default: 90).",
+        )
+        parser.add_argument(
+            "--keep-last",
+            type=int,
+            default=10,
+            help="Keep this many of the most recent syncs of each job, regardless of their age (default: 10).",
+        )
+        parser.add_argument(
+            "--diff-retention-days",
+            type=int,
+            default=None,
+            help="Drop the diffs, but keep the logs, of syncs that started more than this many days ago.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Maximum number of records to delete per query (default: 1000).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how many records would be deleted.",
+        )
+
+    def handle(self, *args, **options):  # noqa: D102
+        result = prune_sync_history(
+            retention_days=options["retention_days"],
+            keep_last=options["keep_last"],
+            diff_retention_days=options["diff_retention_days"],
+            batch_size=options["batch_size"],
+            dry_run=options["dry_run"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{'Would delete' if options['dry_run'] else 'Deleted'} {result.syncs} syncs with "
+                f"{result.log_entries} log entries and {'drop' if options['dry_run'] else 'dropped'} "
+                f"the diffs of {result.diffs} other syncs."
+            )
+        )
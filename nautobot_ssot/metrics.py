@@ -142,4 +142,34 @@ def metric_memory_usage():
     yield memory_gauge
 
 
-metrics = [metric_ssot_jobs, metric_syncs, metric_sync_operations, metric_memory_usage]
+def metric_orm_cache():
+    """Extracts the ORM cache statistics per model from each Job's last Sync.
+
+    Yields:
+        GaugeMetricFamily: Prometheus Metrics
+    """
+    cache_gauge = GaugeMetricFamily(
+        "nautobot_ssot_orm_cache_total",
+        "Nautobot SSoT ORM cache hits, misses, evictions and size by Job",
+        labels=["job", "adapter", "model", "counter"],
+    )
+
+    for job in Job.objects.all():
+        # Skip any jobs that aren't SSoT jobs
+        if job.job_class is None or not issubclass(job.job_class, (DataSource, DataTarget)):
+            continue
+        last_job_sync = Sync.objects.filter(job_result__job_model_id=job.id, cache_statistics__isnull=False).last()
+        if not last_job_sync:
+            continue
+        for adapter_type, statistics in last_job_sync.cache_statistics.items():
+            for model, counters in statistics.items():
+                for counter, value in counters.items():
+                    cache_gauge.add_metric(
+                        labels=[".".join(job.natural_key()), adapter_type, model, counter],
+                        value=value,
+                    )
+
+    yield cache_gauge
+
+
+metrics = [metric_ssot_jobs, metric_syncs, metric_sync_operations, metric_memory_usage, metric_orm_cache]
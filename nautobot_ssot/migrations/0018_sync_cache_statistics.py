@@ -0,0 +1,17 @@
+# Generated by Django 4.2.25 on 2026-10-16 20:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0017_ssotvsphereconfig_sync_vsphere_tags"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="cache_statistics",
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
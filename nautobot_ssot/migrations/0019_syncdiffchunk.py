@@ -0,0 +1,43 @@
+# Generated by Django 4.2.25 on 2026-10-16 21:10
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0018_sync_cache_statistics"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SyncDiffChunk",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("index", models.PositiveIntegerField()),
+                ("model_type", models.CharField(max_length=255)),
+                ("num_objects", models.PositiveIntegerField()),
+                ("data", models.BinaryField()),
+                (
+                    "sync",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="diff_chunks",
+                        related_query_name="diff_chunk",
+                        to="nautobot_ssot.sync",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["sync", "index"],
+                "unique_together": {("sync", "index")},
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.25 on 2026-10-16 22:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0019_syncdiffchunk"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="unchanged_summary",
+            field=models.JSONField(
+                blank=True,
+                help_text="Number of unchanged records per model, when these are not logged individually",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 4.2.25 on 2026-10-16 22:40
+
+from django.db import migrations, models
+
+ACTION_COUNTERS = {
+    "no-change": "num_unchanged",
+    "create": "num_created",
+    "update": "num_updated",
+    "delete": "num_deleted",
+}
+STATUS_COUNTERS = {
+    "success": "num_succeeded",
+    "failure": "num_failed",
+    "error": "num_errored",
+}
+
+
+def backfill_log_counters(apps, schema_editor):
+    """Calculate the log counters of existing syncs from their log entries."""
+    Sync = apps.get_model("nautobot_ssot", "Sync")
+    SyncLogEntry = apps.get_model("nautobot_ssot", "SyncLogEntry")
+
+    aggregates = {
+        counter: models.Count("pk", filter=models.Q(action=action)) for action, counter in ACTION_COUNTERS.items()
+    }
+    aggregates.update(
+        {counter: models.Count("pk", filter=models.Q(status=status)) for status, counter in STATUS_COUNTERS.items()}
+    )
+    counters = [*ACTION_COUNTERS.values(), *STATUS_COUNTERS.values()]
+    syncs = []
+    for row in SyncLogEntry.objects.order_by().values("sync").annotate(**aggregates).iterator():
+        syncs.append(Sync(pk=row["sync"], **{counter: row[counter] for counter in counters}))
+        if len(syncs) >= 1000:
+            Sync.objects.bulk_update(syncs, counters)
+            syncs = []
+    Sync.objects.bulk_update(syncs, counters)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0020_sync_unchanged_summary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="num_unchanged",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="num_created",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="num_updated",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="num_deleted",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="num_succeeded",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="num_failed",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="num_errored",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_log_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.25 on 2026-10-16 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0021_sync_log_counters"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="synclogentry",
+            index=models.Index(fields=["sync", "timestamp"], name="nautobot_ss_sync_id_da030a_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="synclogentry",
+            index=models.Index(fields=["sync", "status", "timestamp"], name="nautobot_ss_sync_id_004f7c_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="synclogentry",
+            index=models.Index(fields=["sync", "action", "status", "timestamp"], name="nautobot_ss_sync_id_a7f93f_idx"),
+        ),
+    ]
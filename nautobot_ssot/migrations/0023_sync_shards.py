@@ -0,0 +1,41 @@
+# Generated by Django 4.2.25 on 2026-10-16 23:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0022_synclogentry_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="parent",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Sync that this sync is a shard of",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="shards",
+                to="nautobot_ssot.sync",
+            ),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="shard",
+            field=models.CharField(
+                blank=True, default="", help_text="Shard key value of this sync's data", max_length=255
+            ),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="shard_count",
+            field=models.PositiveIntegerField(
+                blank=True,
+                help_text="Number of shards dispatched for this sync, if it was split into shards",
+                null=True,
+            ),
+        ),
+    ]
@@ -15,15 +15,22 @@ The interaction between these models and Nautobot's native JobResult model deser
     which have a different set of content requirements, but is used for high-level status reporting.
 
 JobResult 1<->1 Sync 1-->n SyncLogEntry
+
+In sharded execution, a parent Sync dispatches a job run per shard, each with its own JobResult and Sync:
+
+Sync 1-->n Sync (shards)
 """
 
+import json
+import zlib
+from collections.abc import Sequence
 from datetime import timedelta
 
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db import models
+from django.db import models, transaction
 from django.urls import reverse
 from django.utils.formats import date_format
 from django.utils.html import format_html
@@ -51,6 +58,26 @@ class DiffJSONEncoder(DjangoJSONEncoder):
         return super().default(o)
 
 
+# Maximum number of top-level diff objects per `SyncDiffChunk`.
+DIFF_CHUNK_SIZE = 500
+
+
+# Sync counter fields for the SyncLogEntry actions and statuses
+LOG_ACTION_COUNTERS = {
+    SyncLogEntryActionChoices.ACTION_NO_CHANGE: "num_unchanged",
+    SyncLogEntryActionChoices.ACTION_CREATE: "num_created",
+    SyncLogEntryActionChoices.ACTION_UPDATE: "num_updated",
+    SyncLogEntryActionChoices.ACTION_DELETE: "num_deleted",
+}
+LOG_STATUS_COUNTERS = {
+    SyncLogEntryStatusChoices.STATUS_SUCCESS: "num_succeeded",
+    SyncLogEntryStatusChoices.STATUS_FAILURE: "num_failed",
+    SyncLogEntryStatusChoices.STATUS_ERROR: "num_errored",
+}
+LOG_COUNTERS = [*LOG_ACTION_COUNTERS.values(), *LOG_STATUS_COUNTERS.values()]
+PHASE_TIMINGS = ["source_load_time", "target_load_time", "diff_time", "sync_time"]
+
+
 @extras_features(
     "custom_links",
 )
@@ -85,6 +112,33 @@ class Sync(BaseModel):  # pylint: disable=nb-string-field-blank-null
     )
     diff = models.JSONField(blank=True, encoder=DiffJSONEncoder)
     summary = models.JSONField(blank=True, null=True)
+    cache_statistics = models.JSONField(blank=True, null=True)
+    # Counters of the SyncLogEntry records of this sync, maintained as they are written
+    num_unchanged = models.PositiveIntegerField(default=0)
+    num_created = models.PositiveIntegerField(default=0)
+    num_updated = models.PositiveIntegerField(default=0)
+    num_deleted = models.PositiveIntegerField(default=0)
+    num_succeeded = models.PositiveIntegerField(default=0)
+    num_failed = models.PositiveIntegerField(default=0)
+    num_errored = models.PositiveIntegerField(default=0)
+    unchanged_summary = models.JSONField(
+        blank=True,
+        null=True,
+        help_text="Number of unchanged records per model, when these are not logged individually",
+    )
+
+    parent = models.ForeignKey(
+        to="self",
+        on_delete=models.CASCADE,
+        related_name="shards",
+        blank=True,
+        null=True,
+        help_text="Sync that this sync is a shard of",
+    )
+    shard = models.CharField(max_length=255, blank=True, default="", help_text="Shard key value of this sync's data")
+    shard_count = models.PositiveIntegerField(
+        blank=True, null=True, help_text="Number of shards dispatched for this sync, if it was split into shards"
+    )
 
     job_result = models.ForeignKey(to=JobResult, on_delete=models.CASCADE, blank=True, null=True)
     hide_in_diff_view = True
@@ -103,40 +157,160 @@ class Sync(BaseModel):  # pylint: disable=nb-string-field-blank-null
     @classmethod
     def annotated_queryset(cls):
         """Construct an efficient queryset for this model and related data."""
-        return (
-            cls.objects.defer("diff", "summary")
-            .select_related("job_result")
-            .annotate(
-                num_unchanged=models.Count(
-                    "log",
-                    filter=models.Q(log__action=SyncLogEntryActionChoices.ACTION_NO_CHANGE),
-                ),
-                num_created=models.Count(
-                    "log",
-                    filter=models.Q(log__action=SyncLogEntryActionChoices.ACTION_CREATE),
-                ),
-                num_updated=models.Count(
-                    "log",
-                    filter=models.Q(log__action=SyncLogEntryActionChoices.ACTION_UPDATE),
-                ),
-                num_deleted=models.Count(
-                    "log",
-                    filter=models.Q(log__action=SyncLogEntryActionChoices.ACTION_DELETE),
-                ),
-                num_succeeded=models.Count(
-                    "log",
-                    filter=models.Q(log__status=SyncLogEntryStatusChoices.STATUS_SUCCESS),
-                ),
-                num_failed=models.Count(
-                    "log",
-                    filter=models.Q(log__status=SyncLogEntryStatusChoices.STATUS_FAILURE),
-                ),
-                num_errored=models.Count(
-                    "log",
-                    filter=models.Q(log__status=SyncLogEntryStatusChoices.STATUS_ERROR),
-                ),
-            )
+        return cls.objects.defer("diff", "summary", "cache_statistics").select_related("job_result")
+
+    def add_log_counts(self, entries):
+        """Increment the log counters of this sync for new SyncLogEntry records.
+
+        The counters are incremented atomically in the database, and on this instance so that a later `save()` of it
+        does not overwrite them with stale values.
+        """
+        counts = {}
+        for entry in entries:
+            for counter in (LOG_ACTION_COUNTERS.get(entry.action), LOG_STATUS_COUNTERS.get(entry.status)):
+                if counter:
+                    counts[counter] = counts.get(counter, 0) + 1
+        if not counts:
+            return
+        Sync.objects.filter(pk=self.pk).update(**{counter: models.F(counter) + n for counter, n in counts.items()})
+        for counter, n in counts.items():
+            setattr(self, counter, getattr(self, counter) + n)
+
+    def refresh_log_counts(self):
+        """Recalculate the log counters of this sync from its SyncLogEntry records and its `unchanged_summary`."""
+        aggregates = {
+            counter: models.Count("pk", filter=models.Q(action=action))
+            for action, counter in LOG_ACTION_COUNTERS.items()
+        }
+        aggregates.update(
+            {
+                counter: models.Count("pk", filter=models.Q(status=status))
+                for status, counter in LOG_STATUS_COUNTERS.items()
+            }
         )
+        for counter, value in self.logs.aggregate(**aggregates).items():
+            setattr(self, counter, value)
+        if self.unchanged_summary:
+            # Summarized unchanged records are counted whether or not they were also logged as a sample.
+            self.num_unchanged = sum(self.unchanged_summary.values())
+        self.save(update_fields=LOG_COUNTERS)
+
+    def get_log_entries(self):
+        """Get the SyncLogEntry records of this sync, including those of its shards."""
+        if not self.shard_count:
+            # Filtering by equality keeps the `(sync, timestamp)` index usable for seeking through the entries.
+            return self.logs.all()
+        return SyncLogEntry.objects.filter(sync__in=Sync.objects.filter(models.Q(pk=self.pk) | models.Q(parent=self)))
+
+    def aggregate_shards(self):
+        """Recalculate the summary, timings and log counters of this sync from its shards.
+
+        Counts are summed up, while timings are the longest of any shard, as shards run concurrently. This is called
+        by each shard once it is done, with the row of this sync locked so that concurrently finishing shards don't
+        overwrite each other's results.
+        """
+        with transaction.atomic():
+            Sync.objects.select_for_update().filter(pk=self.pk).first()
+            shards = list(self.shards.defer("diff"))
+            summary = {}
+            unchanged_summary = {}
+            for shard in shards:
+                for key, value in (shard.summary or {}).items():
+                    summary[key] = summary.get(key, 0) + value
+                for key, value in (shard.unchanged_summary or {}).items():
+                    unchanged_summary[key] = unchanged_summary.get(key, 0) + value
+            self.summary = summary
+            self.unchanged_summary = unchanged_summary or None
+            for counter in LOG_COUNTERS:
+                setattr(self, counter, sum(getattr(shard, counter) for shard in shards))
+            if self.unchanged_summary:
+                self.num_unchanged = sum(self.unchanged_summary.values()) + sum(
+                    shard.num_unchanged for shard in shards if not shard.unchanged_summary
+                )
+            for timing in PHASE_TIMINGS:
+                timings = [getattr(shard, timing) for shard in shards if getattr(shard, timing) is not None]
+                setattr(self, timing, max(timings) if timings else None)
+            self.save(update_fields=["summary", "unchanged_summary", *LOG_COUNTERS, *PHASE_TIMINGS])
+
+    def get_shards_status(self):
+        """Count the shards of this sync that have completed, failed, or are still pending, i.e. queued or running.
+
+        Returns `None` if this sync wasn't split into shards. Shards that haven't started yet don't have a Sync, so
+        all of `shard_count` that haven't completed or failed are pending.
+        """
+        if self.shard_count is None:
+            return None
+        statuses = list(self.shards.values_list("job_result__status", flat=True))
+        completed = statuses.count(JobResultStatusChoices.STATUS_SUCCESS)
+        failed = sum(
+            status in (JobResultStatusChoices.STATUS_FAILURE, JobResultStatusChoices.STATUS_REVOKED)
+            for status in statuses
+        )
+        return {"completed": completed, "failed": failed, "pending": max(self.shard_count - completed - failed, 0)}
+
+    def get_shards_display(self):
+        """Display the state of the shards of this sync, if it was split into shards."""
+        status = self.get_shards_status()
+        if status is None:
+            return None
+        if status["failed"]:
+            css_class = "badge bg-danger"
+        elif status["pending"]:
+            css_class = "badge bg-warning"
+        else:
+            css_class = "badge bg-success"
+        return format_html(
+            '<span class="{}">{} of {} completed</span> {} failed, {} pending',
+            css_class,
+            status["completed"],
+            self.shard_count,
+            status["failed"],
+            status["pending"],
+        )
+
+    def store_diff(self, diff, chunk_size=DIFF_CHUNK_SIZE):
+        """Store a diff dictionary as compressed chunks, replacing any diff stored for this sync before.
+
+        Each chunk holds up to `chunk_size` top-level objects of a single model type, so that large diffs neither
+        exceed database limits nor have to be loaded at once for display.
+        """
+        chunks = []
+        for model_type, children in diff.items():
+            items = list(children.items())
+            for start in range(0, len(items), chunk_size):
+                chunk_items = dict(items[start : start + chunk_size])
+                chunks.append(
+                    SyncDiffChunk(
+                        sync=self,
+                        index=len(chunks),
+                        model_type=model_type,
+                        num_objects=len(chunk_items),
+                        data=SyncDiffChunk.compress(chunk_items),
+                    )
+                )
+        with transaction.atomic():
+            self.diff_chunks.all().delete()
+            SyncDiffChunk.objects.bulk_create(chunks, batch_size=100)
+
+    @property
+    def diff_items(self):
+        """The `(model_type, obj_id, obj_diff)` items of this sync's diff, loaded lazily from its chunks if stored so."""
+        if self.diff:
+            return [
+                (model_type, obj_id, obj_diff)
+                for model_type, children in self.diff.items()
+                for obj_id, obj_diff in children.items()
+            ]
+        return SyncDiffItems(self)
+
+    def get_diff(self):
+        """Get this sync's full diff dictionary, whether stored in `diff` or in chunks."""
+        if self.diff:
+            return self.diff
+        diff = {}
+        for model_type, data in self.diff_chunks.values_list("model_type", "data"):
+            diff.setdefault(model_type, {}).update(SyncDiffChunk.decompress(data))
+        return diff
 
     @property
     def duration(self):  # pylint: disable=inconsistent-return-statements
@@ -209,6 +383,99 @@ class Sync(BaseModel):  # pylint: disable=nb-string-field-blank-null
         )
 
 
+class SyncDiffChunk(BaseModel):
+    """A compressed chunk of the diff of a data sync, see `Sync.store_diff`."""
+
+    sync = models.ForeignKey(
+        to=Sync, on_delete=models.CASCADE, related_name="diff_chunks", related_query_name="diff_chunk"
+    )
+    index = models.PositiveIntegerField()
+    model_type = models.CharField(max_length=255)
+    num_objects = models.PositiveIntegerField()
+    # zlib-compressed JSON mapping the unique IDs of the chunk's objects to their diffs
+    data = models.BinaryField()
+
+    hide_in_diff_view = True
+
+    class Meta:
+        """Metaclass attributes of SyncDiffChunk."""
+
+        ordering = ["sync", "index"]
+        unique_together = [["sync", "index"]]
+
+    def __str__(self):
+        """String representation of a SyncDiffChunk instance."""
+        return f"{self.sync}: {self.model_type} ({self.num_objects})"
+
+    @staticmethod
+    def compress(chunk_items):
+        """Compress a dictionary of diff items for storage."""
+        return zlib.compress(json.dumps(chunk_items, cls=DiffJSONEncoder).encode())
+
+    @staticmethod
+    def decompress(data):
+        """Decompress a dictionary of diff items from storage."""
+        return json.loads(zlib.decompress(bytes(data)))
+
+
+class SyncDiffItems(Sequence):
+    """Lazy sequence of the `(model_type, obj_id, obj_diff)` items of a chunked diff.
+
+    Only the number of objects per chunk is queried up front, slicing loads just the chunks that overlap the slice.
+    This allows paginating over huge diffs, for example with Django's `Paginator`.
+    """
+
+    def __init__(self, sync):
+        """Initialize the sequence for the given sync."""
+        self.sync = sync
+        self._chunk_sizes = None
+
+    @property
+    def chunk_sizes(self):
+        """List of `(index, num_objects)` tuples of the sync's diff chunks."""
+        if self._chunk_sizes is None:
+            self._chunk_sizes = list(self.sync.diff_chunks.values_list("index", "num_objects"))
+        return self._chunk_sizes
+
+    def __len__(self):
+        """Total number of top-level objects in the diff."""
+        return sum(num_objects for _, num_objects in self.chunk_sizes)
+
+    def __getitem__(self, key):
+        """Get an item or a slice of items, loading only the chunks needed."""
+        if isinstance(key, int):
+            length = len(self)
+            if key < 0:
+                key += length
+            if not 0 <= key < length:
+                raise IndexError("SyncDiffItems index out of range")
+            return self[key : key + 1][0]
+        start, stop, step = key.indices(len(self))
+        if step != 1:
+            return self[start:stop][::step]
+
+        chunk_indices = []
+        offset = 0
+        first_chunk_offset = 0
+        for index, num_objects in self.chunk_sizes:
+            if offset + num_objects > start and offset < stop:
+                if not chunk_indices:
+                    first_chunk_offset = offset
+                chunk_indices.append(index)
+            offset += num_objects
+        items = []
+        for model_type, data in self.sync.diff_chunks.filter(index__in=chunk_indices).values_list("model_type", "data"):
+            items.extend((model_type, obj_id, obj_diff) for obj_id, obj_diff in SyncDiffChunk.decompress(data).items())
+        return items[start - first_chunk_offset : stop - first_chunk_offset]
+
+    def __iter__(self):
+        """Iterate over all items, decompressing one chunk at a time."""
+        chunks = self.sync.diff_chunks.order_by("index").values_list("model_type", "data")
+        for model_type, data in chunks.iterator(chunk_size=10):
+            for obj_id, obj_diff in SyncDiffChunk.decompress(data).items():
+                yield model_type, obj_id, obj_diff
+
+
 class SyncLogEntry(BaseModel):  # pylint: disable=nb-string-field-blank-null
     """Record of a single event during a data sync operation.
 
@@ -251,6 +518,11 @@ class SyncLogEntry(BaseModel):  # pylint: disable=nb-string-field-blank-null
 
         verbose_name_plural = "sync log entries"
         ordering = ["sync", "timestamp"]
+        indexes = [
+            models.Index(fields=["sync", "timestamp"]),
+            models.Index(fields=["sync", "status", "timestamp"]),
+            models.Index(fields=["sync", "action", "status", "timestamp"]),
+        ]
 
     def get_action_class(self):
         """Map self.action to a Bootstrap label class."""
@@ -293,5 +565,6 @@ __all__ = (
     "AutomationGatewayModel",
     "SSOTServiceNowConfig",
     "Sync",
+    "SyncDiffChunk",
     "SyncLogEntry",
 )
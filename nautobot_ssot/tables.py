@@ -8,7 +8,7 @@ from .models import Sync, SyncLogEntry
 
 ACTION_LOGS_LINK = """
 <a class="{{ link_class }}"
-   href="{% url 'plugins:nautobot_ssot:synclogentry_list' %}?sync={{ record.id }}&action={{ action }}">
+   href="{% url 'plugins:nautobot_ssot:sync_logentries' pk=record.pk %}?action={{ action }}">
    {{ value }}
 </a>
 """
@@ -16,7 +16,7 @@ ACTION_LOGS_LINK = """
 
 STATUS_LOGS_LINK = """
 <a class="{{ link_class }}"
-   href="{% url 'plugins:nautobot_ssot:synclogentry_list' %}?sync={{ record.id }}&status={{ status }}">
+   href="{% url 'plugins:nautobot_ssot:sync_logentries' pk=record.pk %}?status={{ status }}">
    {{ value }}
 </a>
 """
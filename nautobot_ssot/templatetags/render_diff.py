@@ -110,7 +110,8 @@ def render_diff_paginated(diff, request):
     on a single page.
 
     Args:
-        diff: The diff dictionary to render.
+        diff: The diff dictionary to render, or a sequence of its flattened items such as `Sync.diff_items`, which
+            allows rendering a page without loading the whole diff.
         request: The current HTTP request (used for page count, page number, and URL building).
 
     Returns:
@@ -120,10 +121,10 @@ def render_diff_paginated(diff, request):
         return format_html("<p>No diff data available.</p>")
 
     per_page = get_paginate_count(request)
-    flat_items = _flatten_diff(diff)
+    flat_items = _flatten_diff(diff) if isinstance(diff, dict) else diff
 
     if len(flat_items) <= per_page:
-        return render_diff(diff)
+        return render_diff(diff if isinstance(diff, dict) else _group_flat_items(flat_items[:]))
 
     try:
         page_num = int(request.GET.get(_PAGE_PARAM, 1))
@@ -0,0 +1,205 @@
+"""Unit tests for the contrib bulk write mode."""
+
+from typing import List, Optional
+from unittest.mock import MagicMock
+
+from django.contrib.contenttypes.models import ContentType
+from nautobot.core.testing import TestCase
+from nautobot.dcim.models import LocationType
+from nautobot.extras.models import Tag
+from nautobot.tenancy.models import Tenant, TenantGroup
+from typing_extensions import TypedDict
+
+from nautobot_ssot.contrib import NautobotAdapter, NautobotModel
+from nautobot_ssot.tests.contrib_base_classes import NautobotTenant, NautobotTenantGroup, TestAdapter
+
+
+class BulkTestAdapter(TestAdapter):
+    """Tenant adapter with bulk mode enabled."""
+
+    bulk_mode = True
+    bulk_batch_size = 2
+
+
+class NautobotLocationType(NautobotModel):
+    """Location type model with a foreign key to itself."""
+
+    _model = LocationType
+    _modelname = "location_type"
+    _identifiers = ("name",)
+    _attributes = ("parent__name", "nestable")
+
+    name: str
+    parent__name: Optional[str] = None
+    nestable: bool = False
+
+
+class LocationTypeAdapter(NautobotAdapter):
+    """Location type adapter with bulk mode enabled."""
+
+    bulk_mode = True
+    top_level = ("location_type",)
+    location_type = NautobotLocationType
+
+
+class ContentTypeDict(TypedDict):
+    """Content type typed dict."""
+
+    app_label: str
+    model: str
+
+
+class BulkModeTests(TestCase):
+    """Tests for `NautobotAdapter.bulk_mode`."""
+
+    def setUp(self):
+        self.tag = Tag.objects.create(name="Bulk Tag")
+        self.tag.content_types.set([ContentType.objects.get_for_model(Tenant)])
+        self.group_to_keep = TenantGroup.objects.create(name="Keep", description="Old description")
+        self.group_to_delete = TenantGroup.objects.create(name="Delete", description="")
+        Tenant.objects.create(name="Tenant to update", description="", tenant_group=self.group_to_keep)
+        Tenant.objects.create(name="Tenant to delete", tenant_group=self.group_to_delete)
+
+    def _sync(self, source_data):
+        source = TestAdapter(job=MagicMock())
+        for group_data in source_data:
+            tenants = group_data.pop("tenants", [])
+            group = NautobotTenantGroup(**group_data)
+            source.add(group)
+            for tenant_data in tenants:
+                tenant = NautobotTenant(**tenant_data)
+                source.add(tenant)
+                group.add_child(tenant)
+        target = BulkTestAdapter(job=MagicMock())
+        target.load()
+        target.sync_from(source)
+        return target
+
+    def test_bulk_sync(self):
+        """Test that creates, updates and deletes are written once the sync is complete."""
+        target = self._sync(
+            [
+                {
+                    "name": "Keep",
+                    "description": "New description",
+                    "tenants": [
+                        {
+                            "name": "Tenant to update",
+                            "description": "",
+                            "tenant_group__name": "Keep",
+                            "tags": [{"name": "Bulk Tag"}],
+                        },
+                    ],
+                },
+                {
+                    "name": "New",
+                    "description": "",
+                    "tenants": [
+                        {
+                            "name": f"New tenant {i}",
+                            "description": "",
+                            "tenant_group__name": "New",
+                            "tags": [{"name": "Bulk Tag"}],
+                        }
+                        for i in range(3)
+                    ],
+                },
+            ]
+        )
+
+        self.assertEqual(0, len(target.bulk_queue))
+        self.assertEqual([], target.bulk_queue.failures)
+        self.assertEqual("New description", TenantGroup.objects.get(name="Keep").description)
+        self.assertFalse(TenantGroup.objects.filter(name="Delete").exists())
+        self.assertFalse(Tenant.objects.filter(name="Tenant to delete").exists())
+        for tenant in Tenant.objects.filter(name__startswith="New tenant"):
+            self.assertEqual("New", tenant.tenant_group.name)
+            self.assertEqual(["Bulk Tag"], [tag.name for tag in tenant.tags.all()])
+        self.assertEqual(["Bulk Tag"], [tag.name for tag in Tenant.objects.get(name="Tenant to update").tags.all()])
+
+    def test_bulk_create_failure(self):
+        """Test that a failing object is recorded without affecting the other objects."""
+        adapter = BulkTestAdapter(job=MagicMock())
+        NautobotTenant.create(adapter, {"name": "Good tenant"}, {"description": ""})
+        NautobotTenant.create(adapter, {"name": "Bad tenant"}, {"tenant_group__name": "I don't exist"})
+        self.assertFalse(Tenant.objects.filter(name="Good tenant").exists())
+
+        adapter.bulk_queue.flush()
+
+        self.assertTrue(Tenant.objects.filter(name="Good tenant").exists())
+        self.assertFalse(Tenant.objects.filter(name="Bad tenant").exists())
+        self.assertEqual(1, len(adapter.bulk_queue.failures))
+        self.assertEqual("Bad tenant", adapter.bulk_queue.failures[0]["unique_id"])
+        adapter.job.logger.error.assert_called_once()
+
+    def test_bulk_create_self_referencing(self):
+        """Test that objects referencing other objects of the same model created in the same flush are resolved."""
+        adapter = LocationTypeAdapter(job=MagicMock())
+        NautobotLocationType.create(adapter, {"name": "Bulk Room"}, {"parent__name": "Bulk Building"})
+        NautobotLocationType.create(adapter, {"name": "Bulk Building"}, {"parent__name": None})
+
+        adapter.bulk_queue.flush()
+
+        self.assertEqual([], adapter.bulk_queue.failures)
+        self.assertEqual("Bulk Building", LocationType.objects.get(name="Bulk Room").parent.name)
+
+    def test_dependency_order(self):
+        """Test that models are flushed after the models they reference."""
+        adapter = BulkTestAdapter(job=MagicMock())
+        adapter.bulk_queue.queue_delete(NautobotTenant, "Tenant", None)
+        adapter.bulk_queue.queue_create(NautobotTenantGroup, "Group", {"name": "Group"})
+        self.assertEqual([NautobotTenantGroup, NautobotTenant], adapter.bulk_queue.get_dependency_order())
+
+    def test_batch_sizes(self):
+        """Test that per-model batch sizes take precedence over the default batch size."""
+
+        class Adapter(BulkTestAdapter):
+            """Adapter with a per-model batch size."""
+
+            bulk_batch_sizes = {"tenant": 10}
+
+        adapter = Adapter(job=MagicMock())
+        self.assertEqual(10, adapter.bulk_queue.get_batch_size(NautobotTenant))
+        self.assertEqual(2, adapter.bulk_queue.get_batch_size(NautobotTenantGroup))
+
+
+class BulkModeManyToManyTests(TestCase):
+    """Tests for bulk many-to-many assignments through auto-created through tables."""
+
+    def test_many_to_many(self):
+        """Test that many-to-many fields are replaced in bulk."""
+
+        class NautobotTag(NautobotModel):
+            """Tag model with a many-to-many field."""
+
+            _model = Tag
+            _modelname = "tag"
+            _identifiers = ("name",)
+            _attributes = ("content_types",)
+
+            name: str
+            content_types: List[ContentTypeDict] = []
+
+        class Adapter(NautobotAdapter):
+            """Tag adapter with bulk mode enabled."""
+
+            bulk_mode = True
+            top_level = ("tag",)
+            tag = NautobotTag
+
+        tag = Tag.objects.create(name="Existing Tag")
+        tag.content_types.set([ContentType.objects.get_for_model(TenantGroup)])
+        adapter = Adapter(job=MagicMock())
+        adapter.load()
+        adapter.get(NautobotTag, "Existing Tag").update(
+            {"content_types": [{"app_label": "tenancy", "model": "tenant"}]}
+        )
+        NautobotTag.create(
+            adapter, {"name": "New Tag"}, {"content_types": [{"app_label": "tenancy", "model": "tenant"}]}
+        )
+
+        adapter.bulk_queue.flush()
+
+        tenant_content_type = ContentType.objects.get_for_model(Tenant)
+        self.assertEqual([tenant_content_type], list(Tag.objects.get(name="Existing Tag").content_types.all()))
+        self.assertEqual([tenant_content_type], list(Tag.objects.get(name="New Tag").content_types.all()))
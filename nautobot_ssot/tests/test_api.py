@@ -1,5 +1,8 @@
 """Unit tests for nautobot_ssot."""
 
+import csv
+import json
+
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from nautobot.core.testing import TestCase
@@ -7,6 +10,9 @@ from nautobot.users.models import Token
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
+from nautobot_ssot.models import Sync, SyncLogEntry
+
 User = get_user_model()
 
 
@@ -26,3 +32,127 @@ class PlaceholderAPITest(TestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["count"], 0)
+
+    def test_sync_diff(self):
+        """Verify that the diff of a sync can be paginated."""
+        sync = Sync.objects.create(source="Source", target="Target", diff={})
+        sync.store_diff(
+            {"location": {f"location_{i}": {"+": {"name": f"location_{i}"}} for i in range(5)}}, chunk_size=2
+        )
+        url = reverse("plugins-api:nautobot_ssot-api:sync-diff", kwargs={"pk": sync.pk})
+        response = self.client.get(url, {"limit": 2, "offset": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 5)
+        self.assertEqual(
+            [
+                {"model_type": "location", "id": "location_2", "diff": {"+": {"name": "location_2"}}},
+                {"model_type": "location", "id": "location_3", "diff": {"+": {"name": "location_3"}}},
+            ],
+            response.data["results"],
+        )
+
+    def test_sync_log_entries_cursor_pagination(self):
+        """Verify that sync log entries are paginated with cursors."""
+        sync = Sync.objects.create(source="Source", target="Target", diff={})
+        SyncLogEntry.objects.bulk_create(
+            SyncLogEntry(
+                sync=sync,
+                action=SyncLogEntryActionChoices.ACTION_NO_CHANGE,
+                status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+                message=f"Entry {i}",
+            )
+            for i in range(3)
+        )
+        url = reverse("plugins-api:nautobot_ssot-api:sync-logs", kwargs={"pk": sync.pk})
+        response = self.client.get(url, {"limit": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(2, len(response.data["results"]))
+        self.assertIsNone(response.data["previous"])
+        self.assertIn("cursor=", response.data["next"])
+        messages = [entry["message"] for entry in response.data["results"]]
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["next"])
+        messages += [entry["message"] for entry in response.data["results"]]
+        self.assertCountEqual(["Entry 0", "Entry 1", "Entry 2"], messages)
+
+        response = self.client.get(url, {"status": "bogus"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_sync_log_entries_list(self):
+        """Verify that the sync log entry list keeps the default pagination."""
+        sync = Sync.objects.create(source="Source", target="Target", diff={})
+        SyncLogEntry.objects.bulk_create(
+            SyncLogEntry(
+                sync=sync,
+                action=SyncLogEntryActionChoices.ACTION_NO_CHANGE,
+                status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+                message=f"Entry {i}",
+            )
+            for i in range(3)
+        )
+        url = reverse("plugins-api:nautobot_ssot-api:synclogentry-list")
+        response = self.client.get(url, {"sync": sync.pk, "limit": 2, "offset": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(3, response.data["count"])
+        self.assertEqual(1, len(response.data["results"]))
+
+    def test_sync_export_diff(self):
+        """Verify that the diff of a sync can be exported as NDJSON and CSV."""
+        sync = Sync.objects.create(source="Source", target="Target", diff={})
+        sync.store_diff(
+            {"location": {f"location_{i}": {"+": {"name": f"location_{i}"}} for i in range(3)}}, chunk_size=2
+        )
+        url = reverse("plugins-api:nautobot_ssot-api:sync-export-diff", kwargs={"pk": sync.pk})
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual("application/x-ndjson", response["Content-Type"])
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(
+            {"model_type": "location", "id": "location_2", "diff": {"+": {"name": "location_2"}}}, json.loads(lines[2])
+        )
+
+        response = self.client.get(url, {"export_format": "csv"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = list(csv.reader(b"".join(response.streaming_content).decode().splitlines()))
+        self.assertEqual(["model_type", "id", "diff"], rows[0])
+        self.assertEqual(["location", "location_0", '{"+": {"name": "location_0"}}'], rows[1])
+        self.assertEqual(4, len(rows))
+
+        response = self.client.get(url, {"export_format": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_sync_export_logs(self):
+        """Verify that the log entries of a sync can be exported and filtered."""
+        sync = Sync.objects.create(source="Source", target="Target", diff={})
+        SyncLogEntry.objects.bulk_create(
+            SyncLogEntry(
+                sync=sync,
+                action=action,
+                status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+                message=action,
+                diff={"+": {"name": action}},
+            )
+            for action in (SyncLogEntryActionChoices.ACTION_CREATE, SyncLogEntryActionChoices.ACTION_NO_CHANGE)
+        )
+        url = reverse("plugins-api:nautobot_ssot-api:sync-export-logs", kwargs={"pk": sync.pk})
+
+        response = self.client.get(url, {"action": SyncLogEntryActionChoices.ACTION_CREATE})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        entries = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(1, len(entries))
+        self.assertEqual(SyncLogEntryActionChoices.ACTION_CREATE, entries[0]["message"])
+        self.assertEqual({"+": {"name": "create"}}, entries[0]["diff"])
+        self.assertIsNone(entries[0]["synced_object_type"])
+
+        response = self.client.get(url, {"export_format": "csv"})
+        rows = list(csv.reader(b"".join(response.streaming_content).decode().splitlines()))
+        self.assertEqual(["id", "timestamp", "action", "status"], rows[0][:4])
+        self.assertEqual(3, len(rows))
+
+        response = self.client.get(url, {"status": "bogus"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(url, {"unknown_filter": "value"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
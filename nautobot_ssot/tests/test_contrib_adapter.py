@@ -2,7 +2,7 @@
 
 from typing import Annotated, List, Optional
 from unittest import skip
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from diffsync import ObjectNotFound
 from django.conf import settings
@@ -10,7 +10,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.db import connection
 from django.test.utils import CaptureQueriesContext
 from nautobot.apps.choices import RelationshipTypeChoices
-from nautobot.apps.testing import TestCase
+from nautobot.apps.testing import TestCase, TransactionTestCase
 from nautobot.circuits import models as circuits_models
 from nautobot.dcim import models as dcim_models
 from nautobot.extras import models as extras_models
@@ -30,6 +30,8 @@ from nautobot_ssot.tests.contrib_base_classes import (
     TestAdapter,
     TestCaseWithDeviceData,
 )
+from nautobot_ssot.utils.diffsync import sync_in_parallel
+from nautobot_ssot.utils.store import DiskStore
 
 
 class NautobotAdapterOneToOneRelationTests(TestCaseWithDeviceData):
@@ -143,6 +145,17 @@ class NautobotAdapterTests(TestCase):
         except ObjectNotFound:
             self.fail("Generic Nautobot adapter not loading child level objects correctly.")
 
+    def test_disk_backed_store(self):
+        job = MagicMock(disk_backed_store=True)
+        job.get_adapter_store.return_value = DiskStore(cache_size=1)
+        adapter = TestAdapter(job=job)
+        self.addCleanup(adapter.store.close)
+        adapter.load()
+        self.assertIs(job.get_adapter_store.return_value, adapter.store)
+        tenant = adapter.get(NautobotTenant, self.tenant_name)
+        self.assertEqual(self.tenant_group_name, tenant.tenant_group__name)
+        self.assertIn(tenant.get_unique_id(), adapter.get(NautobotTenantGroup, self.tenant_group_name).tenants)
+
     def test_load_custom_fields(self):
         class ProviderModel(NautobotModel):
             """Test model with a custom field,"""
@@ -298,6 +311,23 @@ class AdapterCustomRelationshipTest(TestCase):
             self.fail(message)
         self.assertEqual(tenant_name, self.tenant.name, msg=message)
 
+    def test_query_count_independent_of_object_count(self):
+        """Test that custom relationships are loaded without queries per object."""
+        with CaptureQueriesContext(connection) as ctx:
+            CustomRelationShipTestAdapterSource(job=MagicMock()).load()
+        baseline_queries = len(ctx.captured_queries)
+
+        for i in range(5):
+            provider = circuits_models.Provider.objects.create(name=f"Provider {i}")
+            tenant = tenancy_models.Tenant.objects.create(name=f"Tenant {i}")
+            extras_models.RelationshipAssociation.objects.create(
+                relationship=self.relationship, source=provider, destination=tenant
+            )
+        adapter = CustomRelationShipTestAdapterSource(job=MagicMock())
+        with self.assertNumQueries(baseline_queries):
+            adapter.load()
+        self.assertEqual("Provider 4", adapter.get(TenantModelCustomRelationship, "Tenant 4").provider__name)
+
 
 class CacheTests(TestCase):
     """Tests caching functionality between the nautobot adapter and model base classes."""
@@ -340,6 +370,400 @@ class CacheTests(TestCase):
             self.assertEqual(6, len(tenant_group_queries))
 
 
+class ValuesLoadingTests(TestCaseWithDeviceData):
+    """Tests for loading flat models from `values_list` rows."""
+
+    def test_load_from_values(self):
+        """Test that a model consisting of fields and foreign key lookups is loaded without model instances."""
+
+        class Adapter(NautobotAdapter):
+            """Adapter loading devices."""
+
+            top_level = ("device",)
+            device = NautobotDevice
+
+        device = dcim_models.Device.objects.get(name="sw01")
+        device.primary_ip4 = self.ip_address_1
+        interface = dcim_models.Interface.objects.get(name="Loopback 1", device=device)
+        interface.ip_addresses.add(self.ip_address_1)
+        device.validated_save()
+
+        adapter = Adapter(job=MagicMock())
+        self.assertIsNotNone(adapter._get_values_plan(NautobotDevice, NautobotDevice.get_synced_attributes()))
+        with self.assertNumQueries(1):
+            adapter.load()
+
+        diffsync_device = adapter.get(NautobotDevice, {"name": "sw01"})
+        self.assertEqual(device.pk, diffsync_device.pk)
+        self.assertEqual("Switch", diffsync_device.role__name)
+        self.assertEqual(self.ip_address_1.host, diffsync_device.primary_ip4__host)
+        self.assertEqual(self.ip_address_1.mask_length, diffsync_device.primary_ip4__mask_length)
+        self.assertIsNone(adapter.get(NautobotDevice, {"name": "sw02"}).primary_ip4__host)
+
+    def test_load_from_values_not_applicable(self):
+        """Test that models with children or to-many relationships are loaded from model instances."""
+        adapter = TestAdapter(job=MagicMock())
+        self.assertIsNone(adapter._get_values_plan(NautobotTenantGroup, NautobotTenantGroup.get_synced_attributes()))
+        self.assertIsNone(adapter._get_values_plan(NautobotTenant, NautobotTenant.get_synced_attributes()))
+
+    def test_load_from_values_with_overridden_hooks(self):
+        """Test that adapters overriding the per-object loading hooks load from model instances."""
+
+        class SingleObjectAdapter(NautobotAdapter):
+            """Adapter overriding `_load_single_object`."""
+
+            top_level = ("device",)
+            device = NautobotDevice
+
+            def _load_single_object(self, database_object, diffsync_model, parameter_names):
+                super()._load_single_object(database_object, diffsync_model, parameter_names)
+
+        class SingleParameterAdapter(NautobotAdapter):
+            """Adapter overriding `_handle_single_parameter`."""
+
+            top_level = ("device",)
+            device = NautobotDevice
+
+            def _handle_single_parameter(self, parameters, parameter_name, database_object, diffsync_model):
+                super()._handle_single_parameter(parameters, parameter_name, database_object, diffsync_model)
+
+        for adapter_class in (SingleObjectAdapter, SingleParameterAdapter):
+            adapter = adapter_class(job=MagicMock())
+            self.assertIsNone(adapter._get_values_plan(NautobotDevice, NautobotDevice.get_synced_attributes()))
+
+
+class BatchedLoadingTests(TestCase):
+    """Tests for loading to-many relationships and children in batches."""
+
+    @staticmethod
+    def _create_tenant_groups(start, count, tag):
+        for i in range(start, start + count):
+            tenant_group = tenancy_models.TenantGroup.objects.create(name=f"Group {i}", description=f"Group {i}")
+            for j in range(2):
+                tenant = tenancy_models.Tenant.objects.create(name=f"Tenant {i}.{j}", tenant_group=tenant_group)
+                tenant.tags.add(tag)
+
+    def test_prefetch_lookups(self):
+        """Test that to-many fields and foreign keys of the synced attributes are prefetched."""
+        self.assertEqual(["tenant_group", "tags"], NautobotTenant._get_prefetch_lookups())
+        adapter = TestAdapter(job=MagicMock())
+        (prefetch,) = adapter._get_children_prefetches(NautobotTenantGroup)
+        self.assertEqual("tenants", prefetch.prefetch_to)
+        self.assertEqual(("tenant_group", "tags"), prefetch.queryset._prefetch_related_lookups)
+
+    def test_query_count_independent_of_object_count(self):
+        """Test that loading children and their tags doesn't issue queries per object."""
+        tag = extras_models.Tag.objects.create(name="Batched")
+        tag.content_types.add(ContentType.objects.get_for_model(tenancy_models.Tenant))
+        self._create_tenant_groups(0, 1, tag)
+
+        with CaptureQueriesContext(connection) as ctx:
+            TestAdapter(job=MagicMock()).load()
+        baseline_queries = len(ctx.captured_queries)
+
+        self._create_tenant_groups(1, 5, tag)
+        adapter = TestAdapter(job=MagicMock())
+        with self.assertNumQueries(baseline_queries):
+            adapter.load()
+        self.assertEqual(12, len(adapter.get_all("tenant")))
+        self.assertEqual([{"name": "Batched"}], adapter.get(NautobotTenant, {"name": "Tenant 5.1"}).tags)
+
+
+class LoadPlanTests(TestCase):
+    """Tests for the compiled plans used to load diffsync models."""
+
+    def setUp(self):
+        tenant_group = tenancy_models.TenantGroup.objects.create(name="Group", description="Group description")
+        tenancy_models.Tenant.objects.create(name="Tenant", description="Tenant description", tenant_group=tenant_group)
+
+    def test_load_plan_compiled_once(self):
+        """Test that the load plan is compiled once per adapter and model class."""
+        load_plan = TestAdapter._get_load_plan(NautobotTenant)
+        self.assertIs(load_plan, TestAdapter._get_load_plan(NautobotTenant))
+        self.assertEqual(NautobotTenant.get_synced_attributes(), list(load_plan))
+
+        TestAdapter.clear_load_plans()
+        self.assertIsNot(load_plan, TestAdapter._get_load_plan(NautobotTenant))
+
+    def test_to_many_relationship_override(self):
+        """Test that overrides of `_handle_to_many_relationship` are called by the load plan."""
+
+        class Adapter(TestAdapter):
+            """Adapter loading placeholder tags."""
+
+            def _handle_to_many_relationship(self, database_object, diffsync_model, parameter_name):
+                """Load a placeholder instead of the related objects."""
+                return [{"name": f"{parameter_name} of {database_object.name}"}]
+
+        adapter = Adapter(job=MagicMock())
+        adapter.load()
+        self.assertEqual([{"name": "tags of Tenant"}], adapter.get(NautobotTenant, "Tenant").tags)
+
+    def test_load_param_method(self):
+        """Test that `load_param_*` methods are part of the load plan."""
+
+        class Adapter(TestAdapter):
+            """Adapter overriding the description parameter."""
+
+            def load_param_description(self, parameter_name, database_object):
+                """Load the description in upper case."""
+                return getattr(database_object, parameter_name).upper()
+
+        adapter = Adapter(job=MagicMock())
+        adapter.load()
+        self.assertEqual("TENANT DESCRIPTION", adapter.get(NautobotTenant, "Tenant").description)
+
+    def test_handle_single_parameter_override(self):
+        """Test that overriding `_handle_single_parameter` is still respected."""
+
+        class Adapter(TestAdapter):
+            """Adapter overriding the loading of single parameters."""
+
+            def _handle_single_parameter(self, parameters, parameter_name, database_object, diffsync_model):
+                super()._handle_single_parameter(parameters, parameter_name, database_object, diffsync_model)
+                if parameter_name == "description":
+                    parameters[parameter_name] = "Overridden"
+
+        adapter = Adapter(job=MagicMock())
+        adapter.load()
+        self.assertEqual("Overridden", adapter.get(NautobotTenant, "Tenant").description)
+        self.assertEqual("Overridden", adapter.get(NautobotTenantGroup, "Group").description)
+
+
+class TrustedDataTests(TestCase):
+    """Tests for constructing diffsync objects from database values without validation."""
+
+    def setUp(self):
+        tenant_group = tenancy_models.TenantGroup.objects.create(name="Group", description="Group description")
+        tenancy_models.Tenant.objects.create(name="Tenant", description="Tenant description", tenant_group=tenant_group)
+
+    def test_trusted_data(self):
+        """Test that objects constructed without validation equal validated objects."""
+
+        class Adapter(TestAdapter):
+            """Adapter trusting the database."""
+
+            trusted_data = True
+            trusted_data_sample_interval = 0
+
+        adapter = Adapter(job=MagicMock())
+        adapter.load()
+        validating_adapter = TestAdapter(job=MagicMock())
+        validating_adapter.load()
+        self.assertEqual(validating_adapter.dict(), adapter.dict())
+        self.assertEqual(2, adapter.trusted_objects_constructed)
+
+    def test_model_override(self):
+        """Test that models can opt out of trusting the database."""
+
+        class TenantModel(NautobotTenant):
+            """Tenant model always validated."""
+
+            _trusted_data = False
+
+        class Adapter(TestAdapter):
+            """Adapter trusting the database."""
+
+            trusted_data = True
+            tenant = TenantModel
+
+        adapter = Adapter(job=MagicMock())
+        self.assertTrue(adapter._is_trusted(NautobotTenantGroup))
+        self.assertFalse(adapter._is_trusted(TenantModel))
+
+    def test_sampling_validator(self):
+        """Test that sampled objects that don't pass validation raise an error."""
+
+        class TenantModel(NautobotModel):
+            """Tenant model with a mistyped description."""
+
+            _model = tenancy_models.Tenant
+            _modelname = "tenant"
+            _identifiers = ("name",)
+            _attributes = ("description",)
+
+            name: str
+            description: int
+
+        class Adapter(NautobotAdapter):
+            """Adapter trusting the database."""
+
+            top_level = ("tenant",)
+            tenant = TenantModel
+            trusted_data = True
+            trusted_data_sample_interval = 0
+
+        Adapter(job=MagicMock()).load()
+        Adapter.trusted_data_sample_interval = 1
+        with self.assertRaises(ValueError):
+            Adapter(job=MagicMock()).load()
+
+
+class ChunkedLoadingTests(TestCase):
+    """Tests for loading querysets in chunks."""
+
+    def setUp(self):
+        for i in range(3):
+            tenant_group = tenancy_models.TenantGroup.objects.create(name=f"Group {i}", description=f"Group {i}")
+            tenancy_models.Tenant.objects.create(name=f"Tenant {i}", tenant_group=tenant_group)
+
+    def test_chunked_loading(self):
+        """Test that chunked loading yields the same objects, prefetching related objects per chunk."""
+
+        class Adapter(TestAdapter):
+            """Adapter loading one row at a time."""
+
+            load_chunk_size = 1
+
+        class UnchunkedAdapter(TestAdapter):
+            """Adapter loading all rows at once."""
+
+            load_chunk_size = None
+
+        adapter = Adapter(job=MagicMock())
+        with CaptureQueriesContext(connection) as ctx:
+            adapter.load()
+        chunked_queries = len(ctx.captured_queries)
+        unchunked_adapter = UnchunkedAdapter(job=MagicMock())
+        with CaptureQueriesContext(connection) as ctx:
+            unchunked_adapter.load()
+
+        self.assertEqual(unchunked_adapter.dict(), adapter.dict())
+        self.assertGreater(chunked_queries, len(ctx.captured_queries))
+
+    def test_model_chunk_size(self):
+        """Test that models can override the chunk size of the adapter."""
+
+        class TenantGroupModel(NautobotTenantGroup):
+            """Tenant group model loaded without chunking."""
+
+            _load_chunk_size = 0
+
+        queryset = tenancy_models.TenantGroup.objects.all()
+        adapter = TestAdapter(job=MagicMock())
+        self.assertIs(queryset, adapter._iterate_in_chunks(queryset, TenantGroupModel))
+        self.assertIsNot(queryset, adapter._iterate_in_chunks(queryset, NautobotTenantGroup))
+
+
+class ParallelLoadingTests(TransactionTestCase):
+    """Tests for loading the top-level models of an adapter in parallel."""
+
+    def setUp(self):
+        for i in range(3):
+            tenant_group = tenancy_models.TenantGroup.objects.create(name=f"Group {i}", description=f"Group {i}")
+            tenancy_models.Tenant.objects.create(name=f"Tenant {i}", tenant_group=tenant_group)
+
+    def test_parallel_load(self):
+        """Test that loading sharded units in parallel yields the same objects as loading sequentially."""
+
+        class Adapter(TestAdapter):
+            """Adapter loading one unit per tenant group."""
+
+            parallel_load = True
+            load_shard_fields = {"tenant_group": "name"}
+
+        adapter = Adapter(job=MagicMock())
+        self.assertEqual(
+            ["tenant_group (name=Group 0)", "tenant_group (name=Group 1)", "tenant_group (name=Group 2)"],
+            [unit.name for unit in adapter.get_load_units()],
+        )
+        adapter.load()
+        serial_adapter = TestAdapter(job=MagicMock())
+        serial_adapter.load()
+
+        self.assertEqual(serial_adapter.dict(), adapter.dict())
+        self.assertIs(adapter, adapter.get("tenant", "Tenant 0").adapter)
+
+
+class PrefetchingAdapter(TestAdapter):
+    """Adapter prefetching related objects from the diff before a sync."""
+
+    prefetch_related_objects = True
+
+
+class PrefetchTests(TestCase):
+    """Tests for prefetching related objects from the diff before a sync."""
+
+    def test_prefetch_related_objects_from_diff(self):
+        """Test that all tenant groups and tags referenced by the diff are looked up in bulk."""
+        tag = extras_models.Tag.objects.create(name="Prefetched tag")
+        tag.content_types.set([ContentType.objects.get_for_model(tenancy_models.Tenant)])
+        source = TestAdapter(job=MagicMock())
+        for i in range(3):
+            group = NautobotTenantGroup(name=f"Group {i}", description="")
+            source.add(group)
+            tenancy_models.TenantGroup.objects.create(name=group.name)
+            tenant = NautobotTenant(name=f"Tenant {i}", tenant_group__name=group.name, tags=[{"name": tag.name}])
+            source.add(tenant)
+            group.add_child(tenant)
+        target = TestAdapter(job=MagicMock())
+        target.load()
+
+        diff = target.diff_from(source)
+        # Warm up the content type cache used to build cache keys.
+        ContentType.objects.get_for_models(tenancy_models.TenantGroup, extras_models.Tag)
+        self.assertEqual(
+            {
+                tenancy_models.TenantGroup: [{"name": f"Group {i}"} for i in range(3)],
+                extras_models.Tag: [{"name": tag.name}] * 3,
+            },
+            {
+                model_class: sorted(parameters_list, key=lambda parameters: parameters["name"])
+                for model_class, parameters_list in target.get_related_object_parameters_from_diff(diff).items()
+            },
+        )
+
+        with self.assertNumQueries(2):
+            target.prefetch_related_objects_from_diff(diff)
+        with self.assertNumQueries(0):
+            for i in range(3):
+                target.get_from_orm_cache({"name": f"Group {i}"}, tenancy_models.TenantGroup)
+            target.get_from_orm_cache({"name": tag.name}, extras_models.Tag)
+
+    def test_sync_from(self):
+        """Test that `sync_from` only prefetches when enabled, using the given diff even if it is empty."""
+        source = TestAdapter(job=MagicMock())
+        for adapter_class in (TestAdapter, PrefetchingAdapter):
+            with self.subTest(adapter_class=adapter_class.__name__):
+                target = adapter_class(job=MagicMock())
+                target.load()
+                diff = target.diff_from(source)
+                self.assertFalse(diff.has_diffs())
+                with patch.object(target, "prefetch_related_objects_from_diff") as prefetch:
+                    target.sync_from(source, diff=diff)
+                if target.prefetch_related_objects:
+                    prefetch.assert_called_once_with(diff)
+                else:
+                    prefetch.assert_not_called()
+
+
+class ParallelSyncPrefetchTests(TransactionTestCase):
+    """Tests for prefetching related objects before syncing in parallel."""
+
+    def test_prefetch_with_parallel_sync(self):
+        """Test that the tenant groups referenced by the diff are prefetched before the tenants are synced."""
+        source = TestAdapter(job=MagicMock())
+        for i in range(3):
+            group = NautobotTenantGroup(name=f"Group {i}", description="")
+            source.add(group)
+            tenancy_models.TenantGroup.objects.create(name=group.name)
+            tenant = NautobotTenant(name=f"Tenant {i}", tenant_group__name=group.name)
+            source.add(tenant)
+            group.add_child(tenant)
+        target = PrefetchingAdapter(job=MagicMock())
+        target.load()
+        diff = target.diff_from(source)
+
+        with patch.object(
+            target, "prefetch_related_objects_from_diff", wraps=target.prefetch_related_objects_from_diff
+        ) as prefetch:
+            self.assertTrue(sync_in_parallel(source, target, diff, max_workers=2))
+
+        prefetch.assert_called_once_with(diff)
+        for i in range(3):
+            self.assertEqual(f"Group {i}", tenancy_models.Tenant.objects.get(name=f"Tenant {i}").tenant_group.name)
+
+
 class TestNestedRelationships(TestCase):
     """Tests for nested relationships."""
 
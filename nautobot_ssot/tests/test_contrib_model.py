@@ -319,3 +319,31 @@ class QuerySetPrefetchRelatedTest(TestCase):
 
         BaseIPAddressModel._get_queryset()  # pylint: disable=protected-access
         prefetch_related_mock.assert_called_with("parent__namespace", "status", "tenant")
+
+
+class FieldSetterTest(TestCase):
+    """Test the compiled functions used to set fields on Django objects."""
+
+    def test_field_setter_compiled_once(self):
+        """Test that the setter of a field is compiled once per model class and field."""
+        setter = NautobotTenant._get_field_setter("description")  # pylint: disable=protected-access
+        self.assertIs(setter, NautobotTenant._get_field_setter("description"))  # pylint: disable=protected-access
+
+        NautobotTenant.clear_field_setters()
+        self.assertIsNot(setter, NautobotTenant._get_field_setter("description"))  # pylint: disable=protected-access
+
+    def test_field_setters(self):
+        """Test that plain fields are set directly and relationship fields are prepared for setting."""
+        tenant = tenancy_models.Tenant(name="Tenant")
+        relationship_fields = NautobotTenant._get_relationship_fields_dict()  # pylint: disable=protected-access
+        NautobotTenant._handle_single_field(  # pylint: disable=protected-access
+            "description", tenant, "Description", relationship_fields, MagicMock()
+        )
+        NautobotTenant._handle_single_field(  # pylint: disable=protected-access
+            "tenant_group__name", tenant, "Group", relationship_fields, MagicMock()
+        )
+        self.assertEqual("Description", tenant.description)
+        self.assertEqual(
+            {"name": "Group", "_model_class": tenancy_models.TenantGroup},
+            relationship_fields["foreign_keys"]["tenant_group"],
+        )
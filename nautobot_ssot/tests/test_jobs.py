@@ -2,17 +2,61 @@
 
 import logging
 import os.path
+import threading
 import time
-from unittest.mock import Mock, call, patch
+from unittest.mock import Mock, patch
 
+from diffsync import Adapter, DiffSyncModel
+from diffsync.store.local import LocalStore
 from django.db.utils import IntegrityError, OperationalError
 from django.test import override_settings
 from nautobot.core.testing import TransactionTestCase
 from nautobot.extras.models import JobLogEntry, JobResult
 
 from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
-from nautobot_ssot.models import SyncLogEntry
+from nautobot_ssot.jobs.base import ProcessAdapterLoader
+from nautobot_ssot.models import Sync, SyncLogEntry
 from nautobot_ssot.tests.jobs import DataSource, DataSyncBaseJob, DataTarget
+from nautobot_ssot.utils.cache import ORMCache
+from nautobot_ssot.utils.store import DiskStore
+
+
+class ProcessLoadedModel(DiffSyncModel):
+    """Model loaded by `ProcessLoadedAdapter`, recording the process that loaded it."""
+
+    _modelname = "process_loaded"
+    _identifiers = ("name",)
+    _attributes = ("pid",)
+
+    name: str
+    pid: int
+
+
+class ProcessLoadedAdapter(Adapter):
+    """Picklable adapter for testing `ProcessAdapterLoader`."""
+
+    process_loaded = ProcessLoadedModel
+    top_level = ["process_loaded"]
+
+    def __init__(self, *args, job=None, **kwargs):
+        """Initialize the adapter."""
+        super().__init__(*args, **kwargs)
+        self.job = job
+
+    def load(self):
+        """Load models recording the current process."""
+        for i in range(3):
+            self.add(ProcessLoadedModel(name=f"object_{i}", pid=os.getpid()))
+
+
+class ShardedDataSyncJob(DataSyncBaseJob):  # pylint: disable=abstract-method
+    """Job split into shards by region."""
+
+    shard_key = "region"
+
+    def get_shards(self):
+        """Return the regions to split the sync by."""
+        return ["east", "west"]
 
 
 @override_settings(JOBS_ROOT=os.path.join(os.path.dirname(__file__), "jobs"))
@@ -67,6 +111,104 @@ class BaseJobTestCase(TransactionTestCase):  # pylint: disable=too-many-public-m
 
         self.assertEqual(2, SyncLogEntry.objects.count())
 
+    def test_sync_log_flushed_on_failure(self):
+        """Test that buffered sync log entries are written when the sync fails."""
+
+        def load_source():
+            """Log an entry and fail."""
+            self.job.sync_log(
+                action=SyncLogEntryActionChoices.ACTION_CREATE,
+                status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+            )
+            self.assertEqual(1, len(self.job.sync_log_buffer))
+            raise ValueError("Failed to load")
+
+        self.job.load_source_adapter = load_source
+        with self.assertRaises(ValueError):
+            self.job.run(dryrun=True, memory_profiling=False)
+        self.assertEqual(1, SyncLogEntry.objects.count())
+        self.assertIsNone(self.job.sync_log_buffer)
+
+    def test_sync_log_synced_objects_resolved_in_bulk(self):
+        """Test that the synced objects of DiffSync log events are looked up in one batch per model."""
+        synced_object = JobResult.objects.first()
+        self.job.lookup_objects = Mock(side_effect=lambda model_name, unique_ids: {"found": synced_object})
+
+        def load_source():
+            """Log DiffSync events for several objects."""
+            for unique_id in ("found", "missing", "found"):
+                self.job._structlog_to_sync_log_entry(
+                    None,
+                    "info",
+                    {
+                        "src": "source",
+                        "dst": "target",
+                        "action": None,
+                        "model": "jobresult",
+                        "unique_id": unique_id,
+                        "diffs": {},
+                        "status": SyncLogEntryStatusChoices.STATUS_SUCCESS,
+                        "event": "No changes to apply",
+                    },
+                )
+            self.job.lookup_objects.assert_not_called()
+
+        self.job.load_source_adapter = load_source
+        self.job.run(dryrun=True, memory_profiling=False)
+
+        self.job.lookup_objects.assert_called_once_with("jobresult", ["found", "missing"])
+        self.assertCountEqual(
+            ["jobresult missing", repr(synced_object), repr(synced_object)],
+            SyncLogEntry.objects.values_list("object_repr", flat=True),
+        )
+        self.assertEqual(2, SyncLogEntry.objects.filter(synced_object_id=synced_object.pk).count())
+
+    def test_summarize_unchanged_records(self):
+        """Test that unchanged records are counted per model instead of logged, apart from a sample."""
+        self.job.unchanged_records_sample_size = 1
+
+        def log_event(action, model, unique_id):
+            """Log a DiffSync event."""
+            self.job._structlog_to_sync_log_entry(
+                None,
+                "info",
+                {
+                    "src": "source",
+                    "dst": "target",
+                    "action": action,
+                    "model": model,
+                    "unique_id": unique_id,
+                    "diffs": {},
+                    "status": SyncLogEntryStatusChoices.STATUS_SUCCESS,
+                    "event": "Sync event",
+                },
+            )
+
+        def load_source():
+            """Log unchanged and created records."""
+            for unique_id in ("a", "b", "c"):
+                log_event(None, "tenant", unique_id)
+            log_event(None, "prefix", "10.0.0.0/8")
+            log_event(SyncLogEntryActionChoices.ACTION_CREATE, "tenant", "d")
+
+        self.job.load_source_adapter = load_source
+        self.job.run(dryrun=True, memory_profiling=False, summarize_unchanged_records=True)
+
+        self.assertEqual({"tenant": 3, "prefix": 1}, self.job.sync.unchanged_summary)
+        self.assertEqual(4, Sync.objects.get(pk=self.job.sync.pk).num_unchanged)
+        self.assertEqual(
+            2,
+            SyncLogEntry.objects.filter(sync=self.job.sync, action=SyncLogEntryActionChoices.ACTION_NO_CHANGE).count(),
+        )
+        self.assertEqual(
+            1, SyncLogEntry.objects.filter(sync=self.job.sync, action=SyncLogEntryActionChoices.ACTION_CREATE).count()
+        )
+
+    def test_lookup_objects_defaults_to_lookup_object(self):
+        """Test that lookup_objects() falls back to calling lookup_object() for each unique ID."""
+        self.job.lookup_object = Mock(side_effect=lambda model_name, unique_id: unique_id.upper())
+        self.assertEqual({"a": "A", "b": "B"}, self.job.lookup_objects("model", ["a", "b"]))
+
     # TODO: Re-enable this test once the bug in core is fixed.
     def test_as_form(self):
         """Test the as_form() method."""
@@ -155,12 +297,34 @@ class BaseJobTestCase(TransactionTestCase):  # pylint: disable=too-many-public-m
         self.job.source_adapter.diff_to().dict.return_value = {}
         self.job.calculate_diff()
         self.job.source_adapter.diff_to.assert_called()
-        self.job.sync.save.assert_has_calls([call(), call()])
+        self.job.sync.save.assert_called_once_with()
+        self.job.sync.store_diff.assert_called_once_with({})
+
+    @patch("nautobot_ssot.jobs.base.calculate_diff_in_parallel")
+    def test_calculate_diff_parallel(self, mock_calculate_diff_in_parallel):
+        """Test calculate_diff() method with parallel diff calculation."""
+        self.job.sync = Mock()
+        self.job.source_adapter = Mock()
+        self.job.target_adapter = Mock()
+        self.job.parallel_diff = True
+        self.job.parallel_diff_max_workers = 4
+        self.job.diff_class = Mock()
+        mock_calculate_diff_in_parallel.return_value.dict.return_value = {}
+        self.job.calculate_diff()
+        mock_calculate_diff_in_parallel.assert_called_once_with(
+            self.job.source_adapter,
+            self.job.target_adapter,
+            flags=self.job.diffsync_flags,
+            max_workers=4,
+            diff_class=self.job.diff_class,
+        )
+        self.job.source_adapter.diff_to.assert_not_called()
+        self.job.sync.store_diff.assert_called_once_with({})
 
     def test_calculate_diff_fail_diff_save_too_large(self):
         """Test calculate_diff() method logs failure."""
         self.job.sync = Mock()
-        self.job.sync.save.side_effect = [None, OperationalError("Fail")]
+        self.job.sync.store_diff.side_effect = OperationalError("Fail")
         self.job.source_adapter = Mock()
         self.job.target_adapter = Mock()
         self.job.logger.info = Mock()
@@ -174,7 +338,7 @@ class BaseJobTestCase(TransactionTestCase):  # pylint: disable=too-many-public-m
     def test_calculate_diff_fail_diff_save_generic(self):
         """Test calculate_diff() method logs failure."""
         self.job.sync = Mock()
-        self.job.sync.save.side_effect = [None, IntegrityError("Fail")]
+        self.job.sync.store_diff.side_effect = IntegrityError("Fail")
         self.job.source_adapter = Mock()
         self.job.target_adapter = Mock()
         self.job.logger.info = Mock()
@@ -183,6 +347,149 @@ class BaseJobTestCase(TransactionTestCase):  # pylint: disable=too-many-public-m
         with self.assertRaises(IntegrityError):
             self.job.calculate_diff()
 
+    def test_execute_sync(self):
+        """Test execute_sync() method syncs with `sync_to` by default."""
+        self.job.source_adapter = Mock()
+        self.job.target_adapter = Mock()
+        self.job.execute_sync()
+        self.job.source_adapter.sync_to.assert_called_once_with(self.job.target_adapter, flags=self.job.diffsync_flags)
+
+    @patch("nautobot_ssot.jobs.base.sync_in_parallel")
+    def test_execute_sync_parallel(self, mock_sync_in_parallel):
+        """Test execute_sync() method with parallel sync execution applies the calculated diff."""
+        self.job.source_adapter = Mock()
+        self.job.target_adapter = Mock()
+        self.job.diff = Mock()
+        self.job.parallel_sync = True
+        self.job.parallel_sync_max_workers = 2
+        self.job.parallel_sync_serial_types = ("location",)
+        self.job.execute_sync()
+        mock_sync_in_parallel.assert_called_once_with(
+            self.job.source_adapter,
+            self.job.target_adapter,
+            self.job.diff,
+            flags=self.job.diffsync_flags,
+            max_workers=2,
+            serial_types=("location",),
+        )
+        self.job.source_adapter.sync_to.assert_not_called()
+        self.job.source_adapter.diff_to.assert_not_called()
+
+    def test_disk_backed_store(self):
+        """Test that adapters get a disk-backed store when `disk_backed_store` is set, closed after the sync."""
+        self.assertIs(LocalStore, self.job.get_adapter_store())
+
+        def load_source():
+            """Load an adapter with the store selected by the job."""
+            self.job.source_adapter = ProcessLoadedAdapter(internal_storage_engine=self.job.get_adapter_store())
+            self.job.source_adapter.load()
+
+        stores_open_at_final_flush = []
+        record_unchanged_summary = self.job.record_unchanged_summary
+
+        def record_unchanged_summary_with_store():
+            """Record whether the store is still open once the last log entries are written."""
+            stores_open_at_final_flush.append(os.path.exists(self.job.source_adapter.store.path))
+            record_unchanged_summary()
+
+        self.job.disk_store_cache_size = 1
+        self.job.load_source_adapter = load_source
+        self.job.record_unchanged_summary = record_unchanged_summary_with_store
+        self.job.run(dryrun=True, memory_profiling=True, disk_backed_store=True)
+
+        store = self.job.source_adapter.store
+        self.assertIsInstance(store, DiskStore)
+        self.assertEqual([True], stores_open_at_final_flush)
+        self.assertFalse(os.path.exists(store.path))
+        self.assertIsNotNone(self.job.sync.source_load_memory_peak)
+
+    @patch("nautobot_ssot.jobs.base.JobResult.enqueue_job")
+    def test_sharded_execution_dispatch(self, mock_enqueue_job):
+        """Test that sharded execution dispatches a job run per shard instead of syncing."""
+        job = ShardedDataSyncJob()
+        job.job_result = self.job.job_result
+        job.job_model = Mock()
+        job.user = Mock()
+        job.load_source_adapter = Mock()
+
+        job.run(dryrun=True, memory_profiling=False, sharded_execution=True)
+
+        job.load_source_adapter.assert_not_called()
+        self.assertEqual(2, mock_enqueue_job.call_count)
+        for call, shard in zip(mock_enqueue_job.call_args_list, ["east", "west"]):
+            self.assertEqual((job.job_model, job.user), call.args)
+            self.assertEqual(shard, call.kwargs["shard"])
+            self.assertEqual(str(job.sync.pk), call.kwargs["parent_sync"])
+            self.assertTrue(call.kwargs["sharded_execution"])
+            self.assertTrue(call.kwargs["dryrun"])
+        self.assertEqual("", job.sync.shard)
+        self.assertIsNone(job.sync.parent)
+        job.sync.refresh_from_db()
+        self.assertEqual(2, job.sync.shard_count)
+        self.assertEqual({"completed": 0, "failed": 0, "pending": 2}, job.sync.get_shards_status())
+
+    def test_sharded_execution_unsupported(self):
+        """Test that sharded execution is only offered by jobs implementing `get_shards()`, and rejected otherwise."""
+        self.assertIn("sharded_execution", ShardedDataSyncJob._get_vars())
+        self.assertNotIn("sharded_execution", self.job_class._get_vars())
+        self.assertNotIn("parent_sync", self.job_class._get_vars())
+
+        with self.assertRaisesRegex(ValueError, "get_shards"):
+            self.job.run(dryrun=True, memory_profiling=False, sharded_execution=True)
+        self.assertIsNone(self.job.sync)
+        self.assertFalse(Sync.objects.exists())
+
+    def test_sharded_execution_shard(self):
+        """Test that a shard run syncs its shard and aggregates its results into the parent sync, even on failure."""
+        parent = Sync.objects.create(source="Source", target="Target", diff={}, shard_count=2)
+
+        def load_source():
+            """Log an entry for the shard."""
+            self.assertEqual("east", self.job.shard)
+            self.job.sync_log(
+                action=SyncLogEntryActionChoices.ACTION_CREATE,
+                status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+            )
+
+        self.job.load_source_adapter = load_source
+        self.job.run(dryrun=True, memory_profiling=False, sharded_execution=True, shard="east", parent_sync=parent.pk)
+
+        self.assertEqual(parent, self.job.sync.parent)
+        self.assertEqual("east", self.job.sync.shard)
+        parent.refresh_from_db()
+        self.assertEqual(1, parent.num_created)
+        self.assertIsNotNone(parent.source_load_time)
+
+        failing_job = self.job_class()
+        failing_job.job_result = JobResult.objects.create(name="fake job", task_name="fake job", worker="default")
+        failing_job.load_source_adapter = Mock(side_effect=ValueError("Failed to load"))
+        failing_job.load_target_adapter = lambda *x, **y: None
+        with self.assertRaises(ValueError):
+            failing_job.run(
+                dryrun=True, memory_profiling=False, sharded_execution=True, shard="west", parent_sync=parent.pk
+            )
+        parent.refresh_from_db()
+        self.assertEqual(2, parent.shards.count())
+        self.assertEqual(1, parent.num_created)
+        self.assertEqual(1, parent.get_log_entries().count())
+
+    def test_record_cache_statistics(self):
+        """Test that the ORM cache statistics of the adapters are stored on the Sync."""
+
+        def load_target():
+            """Load target adapter."""
+            self.job.target_adapter = Mock(cache=ORMCache())
+            self.job.target_adapter.cache.cache_hits["dcim.location"] = 3
+
+        self.job.load_target_adapter = load_target
+
+        self.job.run(dryrun=True, memory_profiling=False)
+        self.job.sync.refresh_from_db()
+        self.assertEqual(
+            {"target": {"dcim.location": {"hits": 3, "misses": 0, "evictions": 0, "size": 0}}},
+            self.job.sync.cache_statistics,
+        )
+
     def test_parallel_loading_enabled_default(self):
         """Test that parallel loading is enabled by default."""
         mock_diff = self._create_mock_diff()
@@ -374,6 +681,39 @@ class BaseJobTestCase(TransactionTestCase):  # pylint: disable=too-many-public-m
         self.assertIn("Source adapter loading completed", log_messages)
         self.assertIn("Target adapter loading completed", log_messages)
 
+    def test_parallel_loading_logs_written_while_loading(self):
+        """Test that logs from threads show up in the job result while the adapters are still loading."""
+        mock_diff = self._create_mock_diff()
+        log_entry_written = []
+
+        def load_source():
+            """Log a message and wait for it to be written."""
+            logger = logging.getLogger(f"nautobot.extras.jobs.run_job[{self.job.job_result.id}]")
+            logger.info("Source adapter loading started")
+            for _ in range(50):
+                if JobLogEntry.objects.filter(
+                    job_result=self.job.job_result, message="Source adapter loading started"
+                ).exists():
+                    log_entry_written.append(True)
+                    break
+                time.sleep(0.1)
+            source_adapter = Mock()
+            source_adapter.diff_to.return_value = mock_diff
+            self.job.source_adapter = source_adapter
+
+        self.job.load_source_adapter = load_source
+        self.job.load_target_adapter = lambda: setattr(self.job, "target_adapter", Mock())
+
+        self.job.run(dryrun=True, memory_profiling=False, parallel_loading=True)
+
+        self.assertEqual([True], log_entry_written)
+        self.assertEqual(
+            1,
+            JobLogEntry.objects.filter(
+                job_result=self.job.job_result, grouping="source", message="Source adapter loading started"
+            ).count(),
+        )
+
     def test_parallel_loading_preserves_custom_groupings(self):
         """Test that custom log groupings from extra dict are preserved in parallel mode.
 
@@ -566,6 +906,99 @@ class BaseJobTestCase(TransactionTestCase):  # pylint: disable=too-many-public-m
         duplicate_count = log_messages.count("Duplicate message")
         self.assertGreaterEqual(duplicate_count, 1)
 
+    def test_parallel_loading_processes(self):
+        """Test that adapters are loaded in separate processes and sent back with references to the job intact."""
+
+        def load_source():
+            """Load the source adapter and log a message."""
+            logger = logging.getLogger(f"nautobot.extras.jobs.run_job[{self.job.job_result.id}]")
+            logger.info("Source adapter loaded in process %s", os.getpid())
+            self.job.source_adapter = ProcessLoadedAdapter(job=self.job)
+            self.job.source_adapter.load()
+
+        def load_target():
+            """Load the target adapter."""
+            self.job.target_adapter = ProcessLoadedAdapter(job=self.job)
+            self.job.target_adapter.load()
+
+        self.job.load_source_adapter = load_source
+        self.job.load_target_adapter = load_target
+        self.job.parallel_loading_use_processes = True
+
+        self.job.run(dryrun=True, memory_profiling=False, parallel_loading=True)
+
+        for adapter in (self.job.source_adapter, self.job.target_adapter):
+            self.assertIsInstance(adapter, ProcessLoadedAdapter)
+            self.assertIs(self.job, adapter.job)
+            objects = adapter.get_all("process_loaded")
+            self.assertEqual(3, len(objects))
+            self.assertNotEqual(os.getpid(), objects[0].pid)
+            self.assertIs(adapter, objects[0].adapter)
+        self.assertNotEqual(
+            self.job.source_adapter.get_all("process_loaded")[0].pid,
+            self.job.target_adapter.get_all("process_loaded")[0].pid,
+        )
+        self.assertTrue(
+            JobLogEntry.objects.filter(
+                job_result=self.job.job_result,
+                grouping="source",
+                message__startswith="Source adapter loaded in process",
+            ).exists()
+        )
+        self.assertIsNotNone(self.job.sync.source_load_time)
+
+    def test_parallel_loading_processes_with_log_writer(self):
+        """Test that the loading processes are forked before the log writer's and loading threads are started."""
+
+        def load_adapter(adapter_type):
+            """Load an adapter, logging while the other one is loading."""
+            logger = logging.getLogger(f"nautobot.extras.jobs.run_job[{self.job.job_result.id}]")
+            for i in range(100):
+                logger.info("Loading the %s adapter (%s)", adapter_type, i)
+            setattr(self.job, f"{adapter_type}_adapter", ProcessLoadedAdapter(job=self.job))
+            getattr(self.job, f"{adapter_type}_adapter").load()
+
+        self.job.load_source_adapter = lambda: load_adapter("source")
+        self.job.load_target_adapter = lambda: load_adapter("target")
+        self.job.parallel_loading_use_processes = True
+        threads_at_fork = []
+        original_start = ProcessAdapterLoader.start
+
+        def start(loader):
+            threads_at_fork.append([thread.name for thread in threading.enumerate()])
+            return original_start(loader)
+
+        with patch.object(ProcessAdapterLoader, "start", autospec=True, side_effect=start):
+            self.job.run(dryrun=True, memory_profiling=False, parallel_loading=True)
+
+        self.assertEqual(2, len(threads_at_fork))
+        for thread_names in threads_at_fork:
+            self.assertNotIn("ssot-job-log-writer", thread_names)
+            self.assertFalse([name for name in thread_names if name.startswith("ThreadPoolExecutor")])
+        for adapter_type in ("source", "target"):
+            self.assertEqual(
+                100,
+                JobLogEntry.objects.filter(
+                    job_result=self.job.job_result,
+                    grouping=adapter_type,
+                    message__startswith=f"Loading the {adapter_type} adapter",
+                ).count(),
+            )
+
+    def test_parallel_loading_processes_error(self):
+        """Test that an error while loading an adapter in a separate process is raised in the job's process."""
+
+        def load_target():
+            """Fail to load the target adapter."""
+            raise ValueError("Target adapter failed")
+
+        self.job.load_source_adapter = lambda: setattr(self.job, "source_adapter", ProcessLoadedAdapter())
+        self.job.load_target_adapter = load_target
+        self.job.parallel_loading_use_processes = True
+
+        with self.assertRaisesRegex(ValueError, "Target adapter failed"):
+            self.job.run(dryrun=True, memory_profiling=False, parallel_loading=True)
+
 
 class DataSourceTestCase(BaseJobTestCase):
     """Test the DataSource class."""
@@ -1,10 +1,12 @@
 """Test cases for custom Django MGMT commands."""
 
+from datetime import timedelta
 from io import StringIO
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
 from nautobot.dcim.models import (
     Device,
     DeviceType,
@@ -15,6 +17,8 @@ from nautobot.dcim.models import (
 )
 from nautobot.extras.models import CustomField, Role, Status
 
+from nautobot_ssot.models import Sync
+
 
 class TestElongateInterfaceNames(TestCase):
     """Unittests for elongate_interface_names command."""
@@ -202,3 +206,22 @@ class TestDumpdataNautobotSSOT(TestCase):
         payload = out.getvalue()
         self.assertTrue(payload.lstrip().startswith("["))
         self.assertNotIn("nautobot_ssot.ssotconfig", payload)
+
+
+class TestPruneSSoTHistory(TestCase):
+    """Unittests for prune_ssot_history command."""
+
+    def test_prune(self):
+        """Test that old syncs are deleted, keeping the most recent ones."""
+        for days in range(1, 4):
+            Sync.objects.create(
+                source="Source", target="Nautobot", start_time=timezone.now() - timedelta(days=days, hours=1), diff={}
+            )
+        out = StringIO()
+        call_command("prune_ssot_history", "--retention-days=1", "--keep-last=1", "--dry-run", stdout=out)
+        self.assertIn("Would delete 2 syncs", out.getvalue())
+        self.assertEqual(3, Sync.objects.count())
+
+        call_command("prune_ssot_history", "--retention-days=1", "--keep-last=1", stdout=out)
+        self.assertIn("Deleted 2 syncs", out.getvalue())
+        self.assertEqual(1, Sync.objects.count())
@@ -9,8 +9,9 @@ from django.utils.timezone import now
 from nautobot.extras.choices import JobResultStatusChoices
 from nautobot.extras.models import JobResult
 
+from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
 from nautobot_ssot.jobs.examples import ExampleDataSource, ExampleDataTarget
-from nautobot_ssot.models import Sync
+from nautobot_ssot.models import Sync, SyncLogEntry
 from nautobot_ssot.tests.utils.job_helpers import get_test_job_model
 
 
@@ -105,3 +106,150 @@ class SyncTestCase(TestCase):
         self.source_sync.refresh_from_db()
         actual = self.source_sync.diff["uuid"]
         self.assertEqual(actual, expected)
+
+    def test_store_diff(self):
+        """Test that a diff is stored in chunks per model type and reassembled."""
+        diff = {
+            "location": {f"location_{i}": {"+": {"description": f"Location {i}"}} for i in range(5)},
+            "device": {"device_0": {"-": {"serial": uuid.UUID("12345678-1234-5678-1234-567812345678")}}},
+        }
+        self.source_sync.store_diff(diff, chunk_size=2)
+        self.assertEqual(
+            [("location", 2), ("location", 2), ("location", 1), ("device", 1)],
+            list(self.source_sync.diff_chunks.values_list("model_type", "num_objects")),
+        )
+        expected = {
+            **diff,
+            "device": {"device_0": {"-": {"serial": "12345678-1234-5678-1234-567812345678"}}},
+        }
+        self.assertEqual(expected, self.source_sync.get_diff())
+
+        # Storing a diff again replaces the chunks stored before.
+        self.source_sync.store_diff({"device": {}}, chunk_size=2)
+        self.assertFalse(self.source_sync.diff_chunks.exists())
+
+    def test_diff_items(self):
+        """Test that slicing the diff items only loads the chunks that are needed."""
+        diff = {
+            "location": {f"location_{i}": {} for i in range(5)},
+            "device": {f"device_{i}": {} for i in range(3)},
+        }
+        self.source_sync.store_diff(diff, chunk_size=2)
+        diff_items = self.source_sync.diff_items
+        self.assertEqual(8, len(diff_items))
+        with self.assertNumQueries(1):
+            page = diff_items[3:6]
+        self.assertEqual(
+            [("location", "location_3", {}), ("location", "location_4", {}), ("device", "device_0", {})],
+            page,
+        )
+        self.assertEqual(("device", "device_2", {}), diff_items[-1])
+        with self.assertRaises(IndexError):
+            diff_items[8]  # pylint: disable=pointless-statement
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                [(model_type, obj_id) for model_type, children in diff.items() for obj_id in children],
+                [(model_type, obj_id) for model_type, obj_id, _ in self.source_sync.diff_items],
+            )
+
+    def test_diff_items_legacy(self):
+        """Test that diffs stored in the `diff` field are still available as items."""
+        self.source_sync.diff = {"location": {"location_0": {}}}
+        self.assertEqual([("location", "location_0", {})], list(self.source_sync.diff_items))
+        self.assertEqual(self.source_sync.diff, self.source_sync.get_diff())
+
+    def test_log_counts(self):
+        """Test that the log counters are incremented for new entries and can be recalculated."""
+        entries = [
+            SyncLogEntry(
+                sync=self.source_sync,
+                action=SyncLogEntryActionChoices.ACTION_CREATE,
+                status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+            ),
+            SyncLogEntry(
+                sync=self.source_sync,
+                action=SyncLogEntryActionChoices.ACTION_UPDATE,
+                status=SyncLogEntryStatusChoices.STATUS_FAILURE,
+            ),
+        ]
+        SyncLogEntry.objects.bulk_create(entries)
+        self.source_sync.add_log_counts(entries)
+        self.assertEqual(1, self.source_sync.num_created)
+        self.assertEqual(1, self.source_sync.num_updated)
+        self.assertEqual(1, self.source_sync.num_succeeded)
+        self.source_sync.refresh_from_db()
+        self.assertEqual(1, self.source_sync.num_created)
+        self.assertEqual(1, self.source_sync.num_failed)
+
+        SyncLogEntry.objects.filter(action=SyncLogEntryActionChoices.ACTION_UPDATE).delete()
+        self.source_sync.refresh_log_counts()
+        self.source_sync.refresh_from_db()
+        self.assertEqual(0, self.source_sync.num_updated)
+        self.assertEqual(0, self.source_sync.num_failed)
+        self.assertEqual(1, self.source_sync.num_created)
+        self.assertEqual(1, Sync.annotated_queryset().get(pk=self.source_sync.pk).num_succeeded)
+
+        self.source_sync.unchanged_summary = {"location": 3, "tenant": 2}
+        self.source_sync.refresh_log_counts()
+        self.source_sync.refresh_from_db()
+        self.assertEqual(5, self.source_sync.num_unchanged)
+
+    def test_aggregate_shards(self):
+        """Test that the results of the shards of a sync are aggregated into it, along with their log entries."""
+        self.source_sync.shard_count = 2
+        self.source_sync.save()
+        for shard, seconds in (("east", 10), ("west", 20)):
+            shard_sync = Sync.objects.create(
+                source="Some other system",
+                target="Nautobot",
+                diff={},
+                parent=self.source_sync,
+                shard=shard,
+                summary={"create": 1, "update": 2},
+                unchanged_summary={"location": 3},
+                num_created=1,
+                num_succeeded=1,
+                source_load_time=datetime.timedelta(seconds=seconds),
+            )
+            SyncLogEntry.objects.create(
+                sync=shard_sync,
+                action=SyncLogEntryActionChoices.ACTION_CREATE,
+                status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+            )
+
+        self.source_sync.aggregate_shards()
+
+        self.source_sync.refresh_from_db()
+        self.assertEqual({"create": 2, "update": 4}, self.source_sync.summary)
+        self.assertEqual({"location": 6}, self.source_sync.unchanged_summary)
+        self.assertEqual(6, self.source_sync.num_unchanged)
+        self.assertEqual(2, self.source_sync.num_created)
+        self.assertEqual(2, self.source_sync.num_succeeded)
+        self.assertEqual(datetime.timedelta(seconds=20), self.source_sync.source_load_time)
+        self.assertIsNone(self.source_sync.sync_time)
+        self.assertEqual(2, self.source_sync.get_log_entries().count())
+        self.assertEqual(0, self.target_sync.get_log_entries().count())
+        self.assertEqual(str(self.target_sync.logs.all().query), str(self.target_sync.get_log_entries().query))
+
+    def test_get_shards_status(self):
+        """Test that the shards of a sync that haven't started yet are counted as pending along with running ones."""
+        self.assertIsNone(self.source_sync.get_shards_status())
+        self.assertIsNone(self.source_sync.get_shards_display())
+
+        self.source_sync.shard_count = 4
+        for shard, status in (
+            ("east", JobResultStatusChoices.STATUS_SUCCESS),
+            ("west", JobResultStatusChoices.STATUS_FAILURE),
+            ("north", JobResultStatusChoices.STATUS_STARTED),
+        ):
+            Sync.objects.create(
+                source="Some other system",
+                target="Nautobot",
+                diff={},
+                parent=self.source_sync,
+                shard=shard,
+                job_result=JobResult.objects.create(name=shard, task_name=shard, worker="default", status=status),
+            )
+
+        self.assertEqual({"completed": 1, "failed": 1, "pending": 2}, self.source_sync.get_shards_status())
+        self.assertIn("bg-danger", self.source_sync.get_shards_display())
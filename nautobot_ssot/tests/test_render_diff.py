@@ -157,3 +157,18 @@ class TestRenderDiffPaginated(TestCase):
         result = render_diff_paginated(diff, request)
         self.assertIn("x3", str(result))
         self.assertIn("x4", str(result))
+
+    def test_diff_items_paginated(self):
+        """A sequence of flattened diff items is paginated like a diff dictionary."""
+        items = [("region", f"x{i}", {}) for i in range(5)]
+        request = self._make_request(page="2")
+        result = render_diff_paginated(items, request)
+        self.assertIn("x3", str(result))
+        self.assertNotIn("x2", str(result))
+        self.assertIn("page=", str(result))
+
+    def test_diff_items_no_pagination(self):
+        """A sequence of flattened diff items that fits on one page renders fully."""
+        items = [("region", "a", {}), ("region", "b", {})]
+        result = render_diff_paginated(items, self._make_request())
+        self.assertEqual(render_diff({"region": {"a": {}, "b": {}}}), result)
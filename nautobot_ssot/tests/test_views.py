@@ -127,6 +127,43 @@ class SyncViewsTestCase(  # pylint: disable=too-many-ancestors
         response = self.client.get(url)
         self.assertHttpStatus(response, 200)
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_sync_logentries_tab_cursor_pagination(self):
+        """Test that the log entries of a sync are paginated with previous/next cursors."""
+        self.add_permissions("nautobot_ssot.view_synclogentry")
+        SyncLogEntry.objects.bulk_create(
+            SyncLogEntry(
+                sync=self.sync,
+                action=SyncLogEntryActionChoices.ACTION_NO_CHANGE,
+                status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+                message=f"Entry {i}",
+            )
+            for i in range(3)
+        )
+
+        url = reverse("plugins:nautobot_ssot:sync_logentries", kwargs={"pk": self.sync.pk})
+        response = self.client.get(url, {"per_page": 2})
+        self.assertHttpStatus(response, 200)
+        self.assertIn("cursor=", response.content.decode())
+        self.assertEqual(2, len(list(response.context["logs_table"].rows)))
+
+        response = self.client.get(response.context["logs_pagination"]["next"])
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(1, len(list(response.context["logs_table"].rows)))
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_sync_list_links_to_logentries_tab(self):
+        """Test that the log entry counters of the sync list link to the cursor-paginated tab of each sync."""
+        self.add_permissions("nautobot_ssot.view_sync")
+
+        response = self.client.get(reverse("plugins:nautobot_ssot:sync_list"))
+        self.assertHttpStatus(response, 200)
+        content = response.content.decode()
+        url = reverse("plugins:nautobot_ssot:sync_logentries", kwargs={"pk": self.sync.pk})
+        self.assertIn(f"{url}?action={SyncLogEntryActionChoices.ACTION_CREATE}", content)
+        self.assertIn(f"{url}?status={SyncLogEntryStatusChoices.STATUS_FAILURE}", content)
+        self.assertNotIn(f"?sync={self.sync.pk}", content)
+
     @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
     def test_sync_jobresult_tab(self):
         self.add_permissions("extras.view_jobresult")
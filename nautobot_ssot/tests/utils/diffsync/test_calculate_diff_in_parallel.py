@@ -0,0 +1,125 @@
+"""Unit tests for calculate_diff_in_parallel."""
+
+import unittest
+from typing import List, Optional
+
+from diffsync import Adapter, DiffSyncModel
+from diffsync.diff import Diff
+from diffsync.enum import DiffSyncFlags
+
+from nautobot_ssot.utils.diffsync import calculate_diff_in_parallel
+
+
+class Location(DiffSyncModel):
+    """Top-level model with children."""
+
+    _modelname = "location"
+    _identifiers = ("name",)
+    _attributes = ("description",)
+    _children = {"device": "devices"}
+
+    name: str
+    description: Optional[str] = None
+    devices: List[str] = []
+
+
+class Device(DiffSyncModel):
+    """Child model of Location."""
+
+    _modelname = "device"
+    _identifiers = ("name",)
+    _attributes = ("serial",)
+
+    name: str
+    serial: Optional[str] = None
+
+
+class Tenant(DiffSyncModel):
+    """Another top-level model."""
+
+    _modelname = "tenant"
+    _identifiers = ("name",)
+    _attributes = ("description",)
+
+    name: str
+    description: Optional[str] = None
+
+
+class ExampleAdapter(Adapter):
+    """Adapter with two top-level models."""
+
+    location = Location
+    device = Device
+    tenant = Tenant
+    top_level = ["location", "tenant"]
+
+    def load_data(self, suffix):
+        """Load locations with devices and tenants, with descriptions and serials that differ by suffix."""
+        for i in range(5):
+            location = Location(name=f"location_{i}", description=f"Location {i}{suffix}")
+            self.add(location)
+            for j in range(3):
+                device = Device(name=f"device_{i}_{j}", serial=f"{j}{suffix if j == 0 else ''}")
+                self.add(device)
+                location.add_child(device)
+        for i in range(4):
+            self.add(Tenant(name=f"tenant_{i}{suffix if i == 3 else ''}", description=f"Tenant {i}{suffix}"))
+
+
+class LocationOnlyAdapter(ExampleAdapter):
+    """Adapter whose tenants aren't top-level, so that they are skipped when diffing."""
+
+    top_level = ["location"]
+
+
+class CustomDiff(Diff):
+    """Diff subclass to check that the given diff class is used."""
+
+
+class TestCalculateDiffInParallel(unittest.TestCase):
+    """Tests for the `calculate_diff_in_parallel` function."""
+
+    def test_identical_to_serial_diff(self):
+        """Test that the parallel diff has the same elements, order and summary as a serial one."""
+        for source_class, target_class in (
+            (ExampleAdapter, ExampleAdapter),
+            (ExampleAdapter, LocationOnlyAdapter),
+            (LocationOnlyAdapter, ExampleAdapter),
+        ):
+            with self.subTest(source=source_class.__name__, target=target_class.__name__):
+                source = source_class()
+                source.load_data(" (source)")
+                target = target_class()
+                target.load_data("")
+                flags = DiffSyncFlags.CONTINUE_ON_FAILURE
+
+                serial_diff = source.diff_to(target, flags=flags)
+                parallel_diff = calculate_diff_in_parallel(source, target, flags=flags, max_workers=2)
+
+                self.assertEqual(serial_diff.summary(), parallel_diff.summary())
+                self.assertEqual(serial_diff.dict(), parallel_diff.dict())
+                self.assertEqual(list(serial_diff.dict()), list(parallel_diff.dict()))
+                self.assertEqual(serial_diff.models_processed, parallel_diff.models_processed)
+                self.assertEqual(
+                    [element.name for element in serial_diff.get_children()],
+                    [element.name for element in parallel_diff.get_children()],
+                )
+
+    def test_diff_class_and_callback(self):
+        """Test that the given diff class is used and the callback gets the progress of all threads."""
+        source = ExampleAdapter()
+        source.load_data(" (source)")
+        target = LocationOnlyAdapter()
+        target.load_data("")
+        calls = []
+
+        diff = calculate_diff_in_parallel(
+            source, target, max_workers=2, diff_class=CustomDiff, callback=lambda *args: calls.append(args)
+        )
+
+        self.assertIsInstance(diff, CustomDiff)
+        self.assertTrue(calls)
+        self.assertEqual({"diff"}, {stage for stage, _, _ in calls})
+        self.assertEqual({len(source) + len(target)}, {total for _, _, total in calls})
+        self.assertEqual(sorted(current for _, current, _ in calls), [current for _, current, _ in calls])
+        self.assertEqual(diff.models_processed, calls[-1][1])
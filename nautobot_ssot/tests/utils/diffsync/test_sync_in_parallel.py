@@ -0,0 +1,157 @@
+"""Unit tests for sync_in_parallel."""
+
+import threading
+import unittest
+from typing import List, Optional
+
+from diffsync import Adapter, DiffSyncModel
+from diffsync.enum import DiffSyncFlags
+
+from nautobot_ssot.utils.diffsync import sync_in_parallel
+
+CALLS = []
+CALLS_LOCK = threading.Lock()
+
+
+class RecordingModel(DiffSyncModel):
+    """Model recording its creates and deletes in `CALLS`."""
+
+    @classmethod
+    def create(cls, adapter, ids, attrs):
+        """Record the create of an object."""
+        if attrs.get("description") == "fail":
+            raise ValueError(f"Unable to create {ids['name']}")
+        with CALLS_LOCK:
+            CALLS.append(("create", cls._modelname, ids["name"], threading.current_thread().name))
+        return super().create(adapter, ids, attrs)
+
+    def delete(self):
+        """Record the delete of an object."""
+        with CALLS_LOCK:
+            CALLS.append(("delete", self._modelname, self.name, threading.current_thread().name))
+        return super().delete()
+
+
+class Region(RecordingModel):
+    """Top-level model that locations depend on."""
+
+    _modelname = "region"
+    _identifiers = ("name",)
+    _attributes = ("description",)
+
+    name: str
+    description: Optional[str] = None
+
+
+class Location(RecordingModel):
+    """Top-level model with children."""
+
+    _modelname = "location"
+    _identifiers = ("name",)
+    _attributes = ("description",)
+    _children = {"device": "devices"}
+
+    name: str
+    description: Optional[str] = None
+    devices: List[str] = []
+
+
+class Device(RecordingModel):
+    """Child model of Location."""
+
+    _modelname = "device"
+    _identifiers = ("name",)
+    _attributes = ("serial",)
+
+    name: str
+    serial: Optional[str] = None
+
+
+class ExampleAdapter(Adapter):
+    """Adapter with two top-level models."""
+
+    region = Region
+    location = Location
+    device = Device
+    top_level = ["region", "location"]
+
+    def load_data(self, prefix, count, suffix=""):
+        """Load regions and locations with devices."""
+        for i in range(count):
+            self.add(Region(name=f"{prefix}region_{i}", description=f"Region {i}{suffix}"))
+            location = Location(name=f"{prefix}location_{i}", description=f"Location {i}{suffix}")
+            self.add(location)
+            for j in range(2):
+                device = Device(name=f"{prefix}device_{i}_{j}", serial=f"{j}{suffix}")
+                self.add(device)
+                location.add_child(device)
+
+
+class TestSyncInParallel(unittest.TestCase):
+    """Tests for the `sync_in_parallel` function."""
+
+    def setUp(self):
+        """Load a source with new and changed objects and a target with objects to delete."""
+        CALLS.clear()
+        self.source = ExampleAdapter()
+        self.source.load_data("", 3, suffix=" (source)")
+        self.source.load_data("new_", 4)
+        self.target = ExampleAdapter()
+        self.target.load_data("", 3)
+        self.target.load_data("old_", 2)
+
+    def test_sync(self):
+        """Test that the diff is fully applied, with each model type synced after the types it may depend on."""
+        diff = self.source.diff_to(self.target)
+
+        changed = sync_in_parallel(self.source, self.target, diff, max_workers=4)
+
+        self.assertTrue(changed)
+        self.assertFalse(self.source.diff_to(self.target).has_diffs())
+        operations = [call[:2] for call in CALLS]
+        self.assertEqual(
+            [("create", "region")] * 4
+            + [("create", "location")] * 4
+            + [("delete", "location")] * 2
+            + [("delete", "region")] * 2,
+            [operation for operation in operations if operation[1] != "device"],
+        )
+        for location in range(4):
+            location_index = CALLS.index(
+                next(call for call in CALLS if call[:3] == ("create", "location", f"new_location_{location}"))
+            )
+            device_indexes = [
+                index for index, call in enumerate(CALLS) if call[2].startswith(f"new_device_{location}_")
+            ]
+            self.assertEqual(2, len(device_indexes))
+            self.assertLess(location_index, min(device_indexes))
+        self.assertLess(
+            max(index for index, call in enumerate(CALLS) if call[0] == "create"),
+            min(index for index, call in enumerate(CALLS) if call[0] == "delete"),
+        )
+
+    def test_serial_types(self):
+        """Test that the objects of serial types are synced by a single thread."""
+        diff = self.source.diff_to(self.target)
+
+        sync_in_parallel(self.source, self.target, diff, max_workers=4, serial_types=("location",))
+
+        self.assertFalse(self.source.diff_to(self.target).has_diffs())
+        location_threads = {call[3] for call in CALLS if call[:2] == ("create", "location")}
+        self.assertEqual(1, len(location_threads))
+
+    def test_no_changes(self):
+        """Test that nothing is reported as changed for an empty diff."""
+        diff = self.target.diff_to(self.target)
+
+        self.assertFalse(sync_in_parallel(self.target, self.target, diff))
+        self.assertEqual([], CALLS)
+
+    def test_failure(self):
+        """Test that an error while syncing an object is raised and stops the sync."""
+        self.source.get("region", "new_region_0").description = "fail"
+        diff = self.source.diff_to(self.target)
+
+        with self.assertRaises(ValueError):
+            sync_in_parallel(self.source, self.target, diff, flags=DiffSyncFlags.NONE, max_workers=2)
+        self.assertNotIn("location", {call[1] for call in CALLS})
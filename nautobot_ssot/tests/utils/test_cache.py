@@ -1,10 +1,12 @@
 """Unittests for caching classes."""
 
+import pickle
+
 from nautobot.core.testing import TestCase
 from nautobot.dcim.models import Location, LocationType
 from nautobot.extras.models import Status
 
-from nautobot_ssot.utils.cache import ORMCache
+from nautobot_ssot.utils.cache import ORMCache, SharedORMCache, shared_orm_cache
 
 
 class TestORMCache(TestCase):
@@ -46,3 +48,128 @@ class TestORMCache(TestCase):
         self.assertEqual(self.cache.hits("dcim.locationtype"), 2)
         result = self.cache.get_from_orm(LocationType, {"name": "Location Type 1"})
         self.assertEqual(self.cache.hits("dcim.locationtype"), 3)
+
+    def test_prefetch(self):
+        """Test loading many objects into the cache at once."""
+        location_type_2 = LocationType.objects.create(name="Location Type 2")
+        LocationType.objects.create(name="Location Type 3", parent=location_type_2)
+
+        with self.assertNumQueries(2):
+            self.cache.prefetch(
+                LocationType,
+                [
+                    {"name": "Location Type 2"},
+                    {"name": "Location Type 2"},
+                    {"name": "Location Type 404"},
+                    {"name": "Location Type 3", "parent__name": "Location Type 2"},
+                ],
+            )
+
+        with self.assertNumQueries(0):
+            self.assertEqual(location_type_2, self.cache.get_from_orm(LocationType, {"name": "Location Type 2"}))
+            result = self.cache.get_from_orm(
+                LocationType, {"name": "Location Type 3", "parent__name": "Location Type 2"}
+            )
+            self.assertEqual("Location Type 3", result.name)
+        # Parameter sets without matching objects are not cached, so that the usual errors are raised.
+        with self.assertRaises(LocationType.DoesNotExist):
+            self.cache.get_from_orm(LocationType, {"name": "Location Type 404"})
+
+    def test_prefetch_multiple_objects_returned(self):
+        """Test that parameter sets matching multiple objects are not cached."""
+        location_type_2 = LocationType.objects.create(name="Location Type 2")
+        for name in ("Location 2", "Location 3"):
+            Location.objects.create(name=name, location_type=location_type_2, status=Status.objects.get(name="Active"))
+
+        self.cache.prefetch(Location, [{"location_type__name": "Location Type 2"}])
+
+        with self.assertRaises(Location.MultipleObjectsReturned):
+            self.cache.get_from_orm(Location, {"location_type__name": "Location Type 2"})
+
+    def test_misses(self):
+        """Test that misses are counted without resetting the hits."""
+        self.cache.get_from_orm(LocationType, {"name": "Location Type 1"})
+        LocationType.objects.create(name="Location Type 2")
+        self.cache.get_from_orm(LocationType, {"name": "Location Type 2"})
+        self.assertEqual(1, self.cache.hits("dcim.locationtype"))
+        self.assertEqual(2, self.cache.misses("dcim.locationtype"))
+        self.assertEqual(
+            {"dcim.locationtype": {"hits": 1, "misses": 2, "evictions": 0, "size": 2}},
+            self.cache.statistics(),
+        )
+
+    def test_model_capacity(self):
+        """Test that the least recently used objects of a model are evicted once its capacity is reached."""
+        cache = ORMCache(capacities={"dcim.locationtype": 2})
+        for name in ("Location Type 2", "Location Type 3"):
+            LocationType.objects.create(name=name)
+        cache.get_from_orm(LocationType, {"name": "Location Type 1"})
+        cache.get_from_orm(LocationType, {"name": "Location Type 2"})
+        # Using 'Location Type 1' again makes 'Location Type 2' the least recently used object.
+        cache.get_from_orm(LocationType, {"name": "Location Type 1"})
+        cache.get_from_orm(LocationType, {"name": "Location Type 3"})
+
+        self.assertEqual(1, cache.evictions("dcim.locationtype"))
+        self.assertEqual(
+            {frozenset([("name", "Location Type 1")]), frozenset([("name", "Location Type 3")])},
+            set(cache.cache["dcim.locationtype"]),
+        )
+
+    def test_global_capacity(self):
+        """Test that the least recently used objects across models are evicted once the capacity is reached."""
+        cache = ORMCache(capacity=1)
+        cache.get_from_orm(LocationType, {"name": "Location Type 1"})
+        cache.get_from_orm(Location, {"name": "Location 1"})
+
+        self.assertEqual(1, cache.evictions("dcim.locationtype"))
+        self.assertEqual(0, cache.statistics()["dcim.locationtype"]["size"])
+        self.assertEqual(1, cache.statistics()["dcim.location"]["size"])
+
+    def test_pickle(self):
+        """Test that a pickled cache keeps its objects and statistics."""
+        self.cache.shared_cache = shared_orm_cache
+        cache = pickle.loads(pickle.dumps(self.cache))
+
+        self.assertIs(shared_orm_cache, cache.shared_cache)
+        self.assertEqual(self.cache.statistics(), cache.statistics())
+        with self.assertNumQueries(0):
+            cache.get_from_orm(LocationType, {"name": "Location Type 1"})
+
+
+class TestSharedORMCache(TestCase):
+    """Unit tests for the process-wide shared ORM cache."""
+
+    def setUp(self):
+        """Setup the test cases."""
+        self.location_type = LocationType.objects.create(name="Location Type 1")
+        self.shared_cache = SharedORMCache(models=["dcim.locationtype"])
+        self.shared_cache.invalidate()
+        ORMCache(shared_cache=self.shared_cache).get_from_orm(LocationType, {"name": "Location Type 1"})
+
+    def test_shared_between_caches(self):
+        """Test that a new cache starts warm with the objects fetched by another cache."""
+        cache = ORMCache(shared_cache=self.shared_cache)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.location_type, cache.get_from_orm(LocationType, {"name": "Location Type 1"}))
+        self.assertEqual(1, cache.hits("dcim.locationtype"))
+
+    def test_only_configured_models(self):
+        """Test that objects of models that aren't configured aren't shared."""
+        Location.objects.create(
+            name="Location 1", location_type=self.location_type, status=Status.objects.get(name="Active")
+        )
+        ORMCache(shared_cache=self.shared_cache).get_from_orm(Location, {"name": "Location 1"})
+        self.assertIsNone(self.shared_cache.get("dcim.location", frozenset([("name", "Location 1")])))
+
+    def test_signal_invalidation(self):
+        """Test that saving an object of a cached model invalidates the shared objects of that model."""
+        self.shared_cache.handle_change(sender=LocationType, instance=self.location_type)
+        self.assertIsNone(self.shared_cache.get("dcim.locationtype", frozenset([("name", "Location Type 1")])))
+
+    def test_version_invalidation(self):
+        """Test that a change in another process invalidates the shared objects on the next refresh."""
+        other_process_cache = SharedORMCache(models=["dcim.locationtype"])
+        other_process_cache.invalidate("dcim.locationtype")
+
+        ORMCache(shared_cache=self.shared_cache)
+        self.assertIsNone(self.shared_cache.get("dcim.locationtype", frozenset([("name", "Location Type 1")])))
@@ -3,6 +3,7 @@
 from typing import Optional
 
 from django.contrib.contenttypes.models import ContentType
+from django.db.models import Prefetch
 from django.test import TestCase
 from nautobot.circuits.models import Provider
 from nautobot.dcim.models import Location, LocationType
@@ -12,7 +13,9 @@ from typing_extensions import TypedDict
 
 from nautobot_ssot.contrib.types import RelationshipSideEnum
 from nautobot_ssot.utils.orm import (
+    add_prefetch_lookups,
     get_custom_relationship_association_parameters,
+    get_custom_relationship_peers,
     get_orm_attribute,
     load_typed_dict,
     orm_attribute_lookup,
@@ -406,3 +409,50 @@ class TestGetCustomRelationshipAssociationParameters(BaseTestCase):
         self.assertEqual(result["destination_type"], self.location_type)
         self.assertEqual(result["destination_id"], self.location_1.id)
         self.assertTrue("source_id" not in result.keys())
+
+
+class TestGetCustomRelationshipPeers(TestGetCustomRelationshipAssociationParameters):
+    """Tests for `get_custom_relationship_peers` function."""
+
+    def test_invalid_relationship_side(self):
+        """Test passing invalid relationship side."""
+        with self.assertRaises(TypeError):
+            get_custom_relationship_peers(self.relationship_1, "source")
+
+    def test_get_peers_from_source(self):
+        """Test getting the related objects of the source side."""
+        result = get_custom_relationship_peers(self.relationship_1, RelationshipSideEnum.SOURCE)
+        self.assertEqual({self.provider_1.id: [self.location_1]}, result)
+
+    def test_get_peers_from_destination(self):
+        """Test getting the related objects of the destination side."""
+        result = get_custom_relationship_peers(self.relationship_1, RelationshipSideEnum.DESTINATION)
+        self.assertEqual({self.location_1.id: [self.provider_1]}, result)
+
+    def test_query_count(self):
+        """Test that the associations and related objects are fetched with one query each."""
+        provider_2 = Provider.objects.create(name="Provider 2")
+        RelationshipAssociation.objects.create(
+            relationship=self.relationship_1,
+            source=provider_2,
+            destination=self.location_2,
+        )
+        with self.assertNumQueries(2):
+            result = get_custom_relationship_peers(self.relationship_1, RelationshipSideEnum.SOURCE)
+        self.assertEqual([self.location_2], result[provider_2.id])
+
+class TestAddPrefetchLookups(TestCase):
+    """Unit tests for `add_prefetch_lookups` function."""
+
+    def test_add_prefetch_lookups(self):
+        """Test that lookups are added to the queryset."""
+        prefetch = Prefetch("children", queryset=Location.objects.select_related("location_type"))
+        queryset = add_prefetch_lookups(Location.objects.all(), ["parent", prefetch])
+        self.assertEqual(("parent", prefetch), queryset._prefetch_related_lookups)
+
+    def test_skip_existing_lookups(self):
+        """Test that lookups the queryset already prefetches are skipped, whether strings or `Prefetch` objects."""
+        queryset = Location.objects.prefetch_related("children", "parent")
+        prefetch = Prefetch("children", queryset=Location.objects.select_related("location_type"))
+        result = add_prefetch_lookups(queryset, [prefetch, "parent", "location_type", "location_type"])
+        self.assertEqual(("children", "parent", "location_type"), result._prefetch_related_lookups)
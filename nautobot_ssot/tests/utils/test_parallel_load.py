@@ -0,0 +1,152 @@
+"""Unit tests for loading adapters in parallel."""
+
+import logging
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from diffsync import Adapter, DiffSyncModel
+from django.db.utils import OperationalError
+from nautobot.core.testing import TransactionTestCase
+from nautobot.extras.models import JobLogEntry, JobResult
+
+from nautobot_ssot.utils.parallel_load import JobLogEntryWriter, LoadUnit, load_in_parallel
+from nautobot_ssot.utils.store import DiskStore
+
+
+class Item(DiffSyncModel):
+    """Model loaded by the units."""
+
+    _modelname = "item"
+    _identifiers = ("name",)
+    _attributes = ("thread",)
+
+    name: str
+    thread: int
+
+
+class ExampleAdapter(Adapter):
+    """Adapter loaded through load units."""
+
+    item = Item
+    top_level = ["item"]
+
+
+class TestLoadInParallel(unittest.TestCase):
+    """Tests for the `load_in_parallel` function."""
+
+    def setUp(self):
+        """Create an adapter with a mock job."""
+        self.job = MagicMock()
+        self.job.job_result.id = "1234"
+        self.job_logger = logging.getLogger("nautobot.extras.jobs.run_job[1234]")
+        self.adapter = ExampleAdapter()
+        self.barrier = threading.Barrier(3, timeout=5)
+        writer_patcher = patch("nautobot_ssot.utils.parallel_load.JobLogEntryWriter")
+        self.writer_class = writer_patcher.start()
+        self.addCleanup(writer_patcher.stop)
+        self.writer = self.writer_class.return_value
+
+    def _get_unit(self, name, count):
+        """Get a unit adding `count` items, which only finishes once all units are running concurrently."""
+
+        def load():
+            self.barrier.wait()
+            for i in range(count):
+                self.adapter.add(Item(name=f"{name}_{i}", thread=threading.get_ident()))
+            self.job_logger.warning("Loaded %s items", count)
+
+        return LoadUnit(name, load)
+
+    def test_load(self):
+        """Test that the units run concurrently and their objects are merged in order into the adapter's store."""
+        load_in_parallel(
+            self.adapter, [self._get_unit("a", 3), self._get_unit("b", 2), self._get_unit("c", 1)], job=self.job
+        )
+
+        items = self.adapter.get_all("item")
+        self.assertEqual(["a_0", "a_1", "a_2", "b_0", "b_1", "c_0"], [item.name for item in items])
+        self.assertEqual(3, len({item.thread for item in items}))
+        self.assertTrue(all(item.adapter is self.adapter for item in items))
+        self.writer_class.assert_called_once_with(self.job.job_result)
+        self.writer.start.assert_called_once()
+        self.writer.close.assert_called_once()
+        self.assertEqual(3, self.writer.write.call_count)
+        self.assertIn(
+            ("Loaded 2 items", "b"),
+            [(record.getMessage(), grouping) for (record, grouping), _ in self.writer.write.call_args_list],
+        )
+
+    def test_error(self):
+        """Test that an error in a unit is raised once all units are done, without merging any objects."""
+
+        def fail():
+            self.barrier.wait()
+            raise ValueError("Unable to load")
+
+        with self.assertRaisesRegex(ValueError, "Unable to load"):
+            load_in_parallel(
+                self.adapter, [self._get_unit("a", 3), LoadUnit("b", fail), self._get_unit("c", 1)], job=self.job
+            )
+
+        self.assertEqual([], self.adapter.get_all("item"))
+        self.assertEqual(2, self.writer.write.call_count)
+        self.writer.close.assert_called_once()
+
+    def test_disk_store(self):
+        """Test that the units are run one after another directly into a store that isn't kept in memory."""
+        adapter = ExampleAdapter(internal_storage_engine=DiskStore(cache_size=2))
+        self.addCleanup(adapter.store.close)
+
+        def get_unit(name):
+            return LoadUnit(name, lambda: adapter.add(Item(name=name, thread=threading.get_ident())))
+
+        load_in_parallel(adapter, [get_unit("a"), get_unit("b"), get_unit("c")], job=self.job)
+
+        items = adapter.get_all("item")
+        self.assertEqual(["a", "b", "c"], [item.name for item in items])
+        self.assertEqual({threading.get_ident()}, {item.thread for item in items})
+        self.writer_class.assert_not_called()
+        self.job.logger.warning.assert_called_once()
+
+
+class TestJobLogEntryWriter(TransactionTestCase):
+    """Tests for the `JobLogEntryWriter` class."""
+
+    databases = ("default", "job_logs")
+
+    def setUp(self):
+        """Create a job result to write entries for."""
+        self.job_result = JobResult.objects.create(name="fake job", task_name="fake job", worker="default")
+
+    def test_write(self):
+        """Test that all written records end up as job log entries, keeping custom groupings."""
+        writer = JobLogEntryWriter(self.job_result, batch_size=2).start()
+        for i in range(4):
+            writer.write(logging.makeLogRecord({"msg": "Record %s", "args": (i,), "levelno": logging.INFO}), "source")
+        writer.write(
+            logging.makeLogRecord({"msg": "Bad record", "levelno": logging.WARNING, "grouping": "Data Quality"}),
+            "target",
+        )
+        writer.close()
+
+        self.assertEqual(5, writer.entries_written)
+        entries = JobLogEntry.objects.filter(job_result=self.job_result)
+        self.assertEqual(
+            ["Record 0", "Record 1", "Record 2", "Record 3"],
+            sorted(entries.filter(grouping="source", log_level="info").values_list("message", flat=True)),
+        )
+        self.assertTrue(
+            entries.filter(grouping="Data Quality (target)", log_level="warning", message="Bad record").exists()
+        )
+
+    def test_error(self):
+        """Test that an error while writing is raised when closing, without blocking further writes."""
+        writer = JobLogEntryWriter(self.job_result, max_queue_size=1)
+        with patch.object(JobLogEntry.objects, "bulk_create", side_effect=OperationalError("Fail")):
+            writer.start()
+            for i in range(3):
+                writer.write(logging.makeLogRecord({"msg": f"Record {i}"}), "source")
+            with self.assertRaises(OperationalError):
+                writer.close()
+        self.assertEqual(0, writer.entries_written)
@@ -0,0 +1,118 @@
+"""Unit tests for pruning the sync history."""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from nautobot.extras.models import JobResult
+
+from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
+from nautobot_ssot.jobs.examples import ExampleDataSource
+from nautobot_ssot.models import Sync, SyncDiffChunk, SyncLogEntry
+from nautobot_ssot.tests.jobs import DataSource
+from nautobot_ssot.tests.utils.job_helpers import get_test_job_model
+from nautobot_ssot.utils.retention import prune_sync_history
+
+
+class TestPruneSyncHistory(TestCase):
+    """Tests for the `prune_sync_history` function."""
+
+    def setUp(self):
+        """Create syncs of two jobs, started 1 to 5 days ago."""
+        self.syncs = {}
+        for source in ("Source A", "Source B"):
+            for days in range(1, 6):
+                sync = Sync.objects.create(
+                    source=source,
+                    target="Nautobot",
+                    start_time=timezone.now() - timedelta(days=days, hours=1),
+                    diff={},
+                )
+                sync.store_diff({"location": {"location_0": {}}})
+                SyncLogEntry.objects.bulk_create(
+                    SyncLogEntry(
+                        sync=sync,
+                        action=SyncLogEntryActionChoices.ACTION_NO_CHANGE,
+                        status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+                    )
+                    for _ in range(3)
+                )
+                self.syncs[source, days] = sync
+
+    def test_prune(self):
+        """Test that syncs older than the retention period are deleted in batches, keeping the latest of each job."""
+        result = prune_sync_history(retention_days=2, keep_last=3, batch_size=2)
+        self.assertEqual(4, result.syncs)
+        self.assertEqual(12, result.log_entries)
+        self.assertEqual(6, Sync.objects.count())
+        self.assertFalse(Sync.objects.filter(pk=self.syncs["Source A", 4].pk).exists())
+        self.assertTrue(Sync.objects.filter(pk=self.syncs["Source A", 3].pk).exists())
+        self.assertEqual(18, SyncLogEntry.objects.count())
+        self.assertEqual(6, SyncDiffChunk.objects.count())
+
+    def test_keep_last_per_job(self):
+        """Test that the latest syncs are kept per job, even for jobs with the same data source and target."""
+        Sync.objects.all().delete()
+        for job_class in (ExampleDataSource, DataSource):
+            job_model = get_test_job_model(job_class)
+            for days in range(3, 6):
+                Sync.objects.create(
+                    source="Source",
+                    target="Nautobot",
+                    start_time=timezone.now() - timedelta(days=days),
+                    diff={},
+                    job_result=JobResult.objects.create(
+                        name=job_class.__name__, job_model=job_model, task_name=job_class.__name__, worker="default"
+                    ),
+                )
+
+        result = prune_sync_history(retention_days=2, keep_last=2)
+        self.assertEqual(2, result.syncs)
+        for job_class in (ExampleDataSource, DataSource):
+            self.assertEqual(2, Sync.objects.filter(job_result__name=job_class.__name__).count())
+
+    def test_prune_shards(self):
+        """Test that shards are deleted along with their parent sync, and not counted among the latest syncs to keep."""
+        for days in (1, 4):
+            for shard in ("east", "west"):
+                shard_sync = Sync.objects.create(
+                    source="Source A",
+                    target="Nautobot",
+                    start_time=timezone.now() - timedelta(days=days),
+                    diff={},
+                    parent=self.syncs["Source A", days],
+                    shard=shard,
+                )
+                shard_sync.store_diff({"location": {"location_0": {}}})
+                SyncLogEntry.objects.create(
+                    sync=shard_sync,
+                    action=SyncLogEntryActionChoices.ACTION_NO_CHANGE,
+                    status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+                )
+
+        result = prune_sync_history(retention_days=2, keep_last=3, dry_run=True)
+        self.assertEqual((6, 14), (result.syncs, result.log_entries))
+        result = prune_sync_history(retention_days=2, keep_last=3, batch_size=1)
+        self.assertEqual((6, 14), (result.syncs, result.log_entries))
+        self.assertEqual(8, Sync.objects.count())
+        self.assertTrue(Sync.objects.filter(pk=self.syncs["Source A", 3].pk).exists())
+        self.assertEqual(2, self.syncs["Source A", 1].shards.count())
+        self.assertEqual(8, SyncDiffChunk.objects.count())
+        self.assertEqual(20, SyncLogEntry.objects.count())
+
+    def test_prune_diffs(self):
+        """Test that the diffs of syncs older than the diff retention period are dropped, keeping the syncs."""
+        result = prune_sync_history(retention_days=4, diff_retention_days=2, batch_size=1)
+        self.assertEqual(4, result.syncs)
+        self.assertEqual(4, result.diffs)
+        self.assertEqual(6, Sync.objects.count())
+        self.assertEqual(2, SyncDiffChunk.objects.count())
+        self.assertFalse(self.syncs["Source B", 3].diff_chunks.exists())
+        self.assertEqual(3, self.syncs["Source B", 3].logs.count())
+
+    def test_dry_run(self):
+        """Test that a dry run only counts the records that would be removed."""
+        result = prune_sync_history(retention_days=2, diff_retention_days=1, dry_run=True)
+        self.assertEqual((8, 24, 2), (result.syncs, result.log_entries, result.diffs))
+        self.assertEqual(10, Sync.objects.count())
+        self.assertEqual(10, SyncDiffChunk.objects.count())
@@ -0,0 +1,159 @@
+"""Unit tests for the disk-backed DiffSync store."""
+
+import gc
+import os
+import pickle
+import unittest
+from typing import List, Optional
+
+from diffsync import Adapter, DiffSyncModel
+from diffsync.exceptions import ObjectAlreadyExists, ObjectNotFound
+
+from nautobot_ssot.utils.store import DiskStore
+
+
+class Location(DiffSyncModel):
+    """Top-level model with children."""
+
+    _modelname = "location"
+    _identifiers = ("name",)
+    _attributes = ("description",)
+    _children = {"device": "devices"}
+
+    name: str
+    description: Optional[str] = None
+    devices: List[str] = []
+
+
+class Device(DiffSyncModel):
+    """Child model of Location."""
+
+    _modelname = "device"
+    _identifiers = ("name",)
+    _attributes = ("serial",)
+
+    name: str
+    serial: Optional[str] = None
+
+
+class ExampleAdapter(Adapter):
+    """Adapter with locations and their devices."""
+
+    location = Location
+    device = Device
+    top_level = ["location"]
+
+    def load_data(self, count, suffix=""):
+        """Load locations with devices, adding the devices to their location once they are all added."""
+        for i in range(count):
+            location = Location(name=f"location_{i}", description=f"Location {i}{suffix}")
+            self.add(location)
+            for j in range(5):
+                device = Device(name=f"device_{i}_{j}", serial=f"{j}{suffix}")
+                self.add(device)
+                location.add_child(device)
+
+
+class TestDiskStore(unittest.TestCase):
+    """Tests for the `DiskStore` class."""
+
+    def setUp(self):
+        """Load an adapter with a disk-backed store holding few objects in memory."""
+        self.adapter = ExampleAdapter(internal_storage_engine=DiskStore(cache_size=3))
+        self.adapter.load_data(10)
+        self.store = self.adapter.store
+        self.addCleanup(self.store.close)
+
+    def test_objects_written_to_disk(self):
+        """Test that objects beyond the cache size are written to disk, keeping changes made after their eviction."""
+        statistics = self.store.statistics()
+        self.assertEqual(60, statistics["objects"])
+        self.assertLess(statistics["in_memory"], 60)
+        self.assertGreater(statistics["disk_writes"], 0)
+        self.assertEqual(60, self.adapter.count())
+        self.assertEqual({"location", "device"}, self.store.get_all_model_names())
+
+        location = self.adapter.get("location", "location_0")
+        self.assertEqual([f"device_0_{j}" for j in range(5)], location.devices)
+        self.assertIs(self.adapter, location.adapter)
+        self.assertEqual([f"location_{i}" for i in range(10)], [obj.name for obj in self.adapter.get_all("location")])
+
+    def test_changes_kept(self):
+        """Test that changes to objects are kept once they are evicted and read back from disk."""
+        self.adapter.get("device", "device_0_0").serial = "changed"
+        for location in self.adapter.get_all("location"):
+            self.adapter.get_by_uids(location.devices, "device")
+
+        self.assertEqual("changed", self.adapter.get("device", "device_0_0").serial)
+        self.assertGreater(self.store.statistics()["disk_reads"], 0)
+
+    def test_evicted_objects_kept_while_referenced(self):
+        """Test that evicted objects are returned as they are while referenced elsewhere, and written once released."""
+        device = self.adapter.get("device", "device_0_0")
+        for i in range(5):
+            self.adapter.get("location", f"location_{i}")
+        device.serial = "changed"
+        self.assertIs(device, self.adapter.get("device", "device_0_0"))
+
+        for i in range(5):
+            self.adapter.get("location", f"location_{i}")
+        device.serial = "changed again"
+        del device
+        gc.collect()
+
+        self.assertEqual("changed again", self.adapter.get("device", "device_0_0").serial)
+
+    def test_garbage_collected(self):
+        """Test that a store is garbage collected along with its adapter, deleting its database."""
+        adapter = ExampleAdapter(internal_storage_engine=DiskStore(cache_size=3))
+        adapter.load_data(10)
+        path = adapter.store.path
+        self.assertTrue(os.path.exists(path))
+
+        del adapter
+        gc.collect()
+
+        self.assertFalse(os.path.exists(path))
+
+    def test_diff_and_sync(self):
+        """Test that the store can be diffed against and synced to like the in-memory store."""
+        memory_adapter = ExampleAdapter()
+        memory_adapter.load_data(10)
+        self.assertFalse(memory_adapter.diff_to(self.adapter).has_diffs())
+        self.assertFalse(self.adapter.diff_to(memory_adapter).has_diffs())
+
+        source = ExampleAdapter()
+        source.load_data(12, suffix=" (source)")
+        source.sync_to(self.adapter)
+
+        self.assertFalse(source.diff_to(self.adapter).has_diffs())
+        self.assertEqual(72, self.adapter.count())
+
+    def test_add_and_remove(self):
+        """Test adding duplicate objects and removing objects."""
+        location = self.adapter.get("location", "location_0")
+        self.adapter.add(location)
+        with self.assertRaises(ObjectAlreadyExists):
+            self.adapter.add(Location(name="location_0"))
+
+        self.adapter.remove(location, remove_children=True)
+        with self.assertRaises(ObjectNotFound):
+            self.adapter.get("location", "location_0")
+        with self.assertRaises(ObjectNotFound):
+            self.adapter.get_by_uids(["device_0_0"], "device")
+        self.assertEqual(54, self.adapter.count())
+
+    def test_pickle(self):
+        """Test that a pickled store reopens the database with all objects."""
+        adapter = pickle.loads(pickle.dumps(self.adapter))
+        self.addCleanup(adapter.store.close)
+
+        self.assertEqual(60, adapter.count())
+        self.assertFalse(self.adapter.diff_to(adapter).has_diffs())
+
+    def test_close(self):
+        """Test that closing the store deletes its database."""
+        self.assertTrue(os.path.exists(self.store.path))
+        self.store.close()
+        self.assertFalse(os.path.exists(self.store.path))
+        self.assertEqual(0, self.adapter.count())
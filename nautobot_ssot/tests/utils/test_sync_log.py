@@ -0,0 +1,74 @@
+"""Unit tests for the SyncLogEntry buffer."""
+
+from unittest.mock import Mock, patch
+
+from django.test import TestCase
+
+from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
+from nautobot_ssot.models import Sync, SyncLogEntry
+from nautobot_ssot.utils.sync_log import SyncLogEntryBuffer
+
+
+class TestSyncLogEntryBuffer(TestCase):
+    """Tests for the `SyncLogEntryBuffer` class."""
+
+    def setUp(self):
+        self.sync = Sync.objects.create(source="Source", target="Target", diff={})
+
+    def _entry(self, message=""):
+        return SyncLogEntry(
+            sync=self.sync,
+            action=SyncLogEntryActionChoices.ACTION_NO_CHANGE,
+            status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+            message=message,
+        )
+
+    def test_flush_size(self):
+        """Test that entries are written once the buffer is full."""
+        buffer = SyncLogEntryBuffer(flush_size=3, flush_interval=None)
+        buffer.add(self._entry())
+        buffer.add(self._entry())
+        self.assertEqual(0, SyncLogEntry.objects.count())
+        with self.assertNumQueries(4):  # bulk create and counter update wrapped in a savepoint
+            buffer.add(self._entry())
+        self.assertEqual(3, SyncLogEntry.objects.count())
+        self.sync.refresh_from_db()
+        self.assertEqual(3, self.sync.num_unchanged)
+        self.assertEqual(3, self.sync.num_succeeded)
+        self.assertEqual(0, len(buffer))
+        self.assertEqual(3, buffer.entries_written)
+
+    def test_flush_interval(self):
+        """Test that entries are written once the flush interval has passed."""
+        buffer = SyncLogEntryBuffer(flush_size=100, flush_interval=5)
+        with patch("nautobot_ssot.utils.sync_log.time.monotonic", return_value=buffer._last_flush + 1):
+            buffer.add(self._entry())
+        self.assertEqual(0, SyncLogEntry.objects.count())
+        with patch("nautobot_ssot.utils.sync_log.time.monotonic", return_value=buffer._last_flush + 5):
+            buffer.add(self._entry())
+        self.assertEqual(2, SyncLogEntry.objects.count())
+
+    def test_flush(self):
+        """Test that a flush writes all entries and keeps them when writing fails."""
+        buffer = SyncLogEntryBuffer(flush_interval=None)
+        buffer.add(self._entry("first"))
+        with patch.object(SyncLogEntry.objects, "bulk_create", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                buffer.flush()
+        self.assertEqual(1, len(buffer))
+        buffer.flush()
+        self.assertEqual(["first"], list(SyncLogEntry.objects.values_list("message", flat=True)))
+        buffer.flush()
+        self.assertEqual(1, SyncLogEntry.objects.count())
+
+    def test_resolve_synced_objects(self):
+        """Test that synced objects are resolved once per flush, for the entries added with a lookup."""
+        resolve_synced_objects = Mock()
+        buffer = SyncLogEntryBuffer(flush_interval=None, resolve_synced_objects=resolve_synced_objects)
+        first, second = self._entry("first"), self._entry("second")
+        buffer.add(first, ("tenant", "Tenant 1"))
+        buffer.add(second)
+        resolve_synced_objects.assert_not_called()
+        buffer.flush()
+        resolve_synced_objects.assert_called_once_with([(first, ("tenant", "Tenant 1"))])
+        self.assertEqual(2, SyncLogEntry.objects.count())
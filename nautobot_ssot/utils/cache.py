@@ -1,12 +1,18 @@
 """Caching classes for use in SSoT processes."""
 
-from collections import defaultdict
+import operator
+import threading
+from collections import OrderedDict, defaultdict
 from collections.abc import Hashable
 from dataclasses import dataclass, field
-from typing import DefaultDict, Type
+from functools import reduce
+from itertools import islice
+from typing import DefaultDict, Iterable, Optional, Type
 
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Model
+from django.core.cache import cache as django_cache
+from django.db.models import F, Model, Q
 
 # This type describes a set of parameters to use as a dictionary key for the cache. As such, its needs to be hashable
 # and therefore a frozenset rather than a normal set or a list.
@@ -21,42 +27,293 @@ from django.db.models import Model
 ParameterSet = frozenset[tuple[str, Hashable]]
 
 
+class SharedORMCache:
+    """Process-wide cache for slowly changing lookup models, shared by the `ORMCache` instances of a worker.
+
+    Only models listed in the `shared_orm_cache_models` app setting (e.g. `["extras.status", "dcim.locationtype"]`)
+    are cached. Cached objects of a model are dropped when:
+
+    - an object of that model is saved or deleted in this process (`post_save`/`post_delete` signals), or
+    - the version stamp of that model in Django's cache has changed since the objects were cached. Version stamps are
+      bumped whenever the model changes in any process, so that other workers notice the change the next time an
+      `ORMCache` is created.
+    """
+
+    version_key_prefix = "nautobot_ssot:shared_orm_cache_version"
+
+    def __init__(self, models: Optional[Iterable[str]] = None):
+        """Initialize the cache, reading the models to cache from the app settings unless `models` is given."""
+        self._models = set(models) if models is not None else None
+        self._lock = threading.Lock()
+        self._cache: DefaultDict[str, dict[ParameterSet, Model]] = defaultdict(dict)
+        # Version stamp of each model at the time its objects were cached.
+        self._versions: dict[str, Optional[int]] = {}
+
+    @property
+    def models(self) -> set[str]:
+        """Get the cache keys of the models that are cached."""
+        if self._models is None:
+            return set(settings.PLUGINS_CONFIG.get("nautobot_ssot", {}).get("shared_orm_cache_models", []))
+        return self._models
+
+    def __reduce_ex__(self, protocol):
+        """Pickle the process-wide cache by reference, so that it is the receiving process' own cache once unpickled."""
+        if self is shared_orm_cache:
+            return "shared_orm_cache"
+        return super().__reduce_ex__(protocol)
+
+    def __getstate__(self):
+        """Get the state of the cache for pickling, without its lock."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state of the cache from pickling, with a new lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _get_version_key(self, model_cache_key: str) -> str:
+        return f"{self.version_key_prefix}:{model_cache_key}"
+
+    def get(self, model_cache_key: str, parameter_set: ParameterSet) -> Optional[Model]:
+        """Get an object from the cache, or `None` if it isn't cached."""
+        return self._cache.get(model_cache_key, {}).get(parameter_set)
+
+    def set(self, model_cache_key: str, parameter_set: ParameterSet, obj: Model):
+        """Store an object in the cache if its model is one of the cached models."""
+        if model_cache_key not in self.models:
+            return
+        with self._lock:
+            if model_cache_key not in self._versions:
+                self._versions[model_cache_key] = django_cache.get(self._get_version_key(model_cache_key))
+            self._cache[model_cache_key][parameter_set] = obj
+
+    def invalidate(self, model_cache_key: Optional[str] = None, bump_version: bool = True):
+        """Drop the cached objects of one or all models, by default telling other processes to do the same."""
+        model_cache_keys = [model_cache_key] if model_cache_key else list(self.models)
+        with self._lock:
+            for key in model_cache_keys:
+                self._cache.pop(key, None)
+                self._versions.pop(key, None)
+        if not bump_version:
+            return
+        for key in model_cache_keys:
+            try:
+                django_cache.incr(self._get_version_key(key))
+            except ValueError:
+                # The version stamp doesn't exist yet, or has been evicted from the cache.
+                django_cache.set(self._get_version_key(key), 1, timeout=None)
+
+    def refresh(self):
+        """Drop the cached objects of all models whose version stamp has changed in another process."""
+        if not self._versions:
+            return
+        versions = django_cache.get_many([self._get_version_key(key) for key in self._versions])
+        with self._lock:
+            for key, version in list(self._versions.items()):
+                if versions.get(self._get_version_key(key)) != version:
+                    self._cache.pop(key, None)
+                    self._versions.pop(key, None)
+
+    def handle_change(self, sender, **kwargs):  # pylint: disable=unused-argument
+        """Signal handler for `post_save` and `post_delete` invalidating the cached objects of the sender model."""
+        model_cache_key = sender._meta.concrete_model._meta.label_lower
+        if model_cache_key in self.models:
+            self.invalidate(model_cache_key)
+
+
+# The shared cache of this process, see `SharedORMCache`.
+shared_orm_cache = SharedORMCache()
+
+
 @dataclass
 class ORMCache:
-    """Basic caching class for use in `NautobotAdapter` and other tools when interacting with the database."""
+    """Basic caching class for use in `NautobotAdapter` and other tools when interacting with the database.
+
+    The cache can optionally be bounded, in which case the least recently used objects are evicted once it is full:
+
+    - `capacity` limits the total number of cached objects across all models.
+    - `capacities` limits the number of cached objects per model, keyed by cache key (e.g. `"dcim.location"`).
+
+    Hits, misses and evictions are counted per model, see `statistics`.
+
+    If `shared_cache` is set, objects missing from this cache are looked up there before querying the database, so
+    that lookup objects fetched by one job can be reused by the next one in the same worker. See `SharedORMCache`.
 
-    cache: DefaultDict[str, dict[ParameterSet, Model]] = field(init=False, repr=False)
+    `get_from_orm` may be called from several threads, for example while syncing in parallel.
+    """
+
+    capacity: Optional[int] = None
+    capacities: dict[str, int] = field(default_factory=dict)
+    shared_cache: Optional[SharedORMCache] = field(default=None, repr=False)
+
+    cache: DefaultDict[str, OrderedDict[ParameterSet, Model]] = field(init=False, repr=False)
     cache_hits: DefaultDict[str, int] = field(init=False)
+    cache_misses: DefaultDict[str, int] = field(init=False)
+    cache_evictions: DefaultDict[str, int] = field(init=False)
+    # Usage order of all cached objects across models, used to evict from the whole cache if `capacity` is set.
+    _usage: OrderedDict[tuple[str, ParameterSet], None] = field(init=False, repr=False)
 
     def __post_init__(self):
         """Post initialization of the class."""
+        self._lock = threading.RLock()
         self.invalidate_cache()
 
+    def __getstate__(self):
+        """Get the state of the cache for pickling, e.g. by `ProcessAdapterLoader`, without its lock."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state of the cache from pickling, with a new lock."""
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
     def invalidate_cache(self, zero_out_hits=True):
         """Invalidates all the objects in the ORM cache."""
-        self.cache = defaultdict(dict)
+        self.cache = defaultdict(OrderedDict)
+        self._usage = OrderedDict()
+        if self.shared_cache is not None:
+            self.shared_cache.refresh()
         if zero_out_hits:
             self.cache_hits = defaultdict(int)
+            self.cache_misses = defaultdict(int)
+            self.cache_evictions = defaultdict(int)
 
     def hits(self, cache_key: str):
         """Get number of hits for specified cache key."""
         return self.cache_hits.get(cache_key, None)
 
+    def misses(self, cache_key: str):
+        """Get number of misses for specified cache key."""
+        return self.cache_misses.get(cache_key, None)
+
+    def evictions(self, cache_key: str):
+        """Get number of evictions for specified cache key."""
+        return self.cache_evictions.get(cache_key, None)
+
+    def statistics(self) -> dict[str, dict[str, int]]:
+        """Get the hits, misses, evictions and current size of the cache per cache key.
+
+        Example:
+            {"dcim.location": {"hits": 1998, "misses": 2, "evictions": 0, "size": 2}}
+        """
+        return {
+            cache_key: {
+                "hits": self.cache_hits.get(cache_key, 0),
+                "misses": self.cache_misses.get(cache_key, 0),
+                "evictions": self.cache_evictions.get(cache_key, 0),
+                "size": len(self.cache.get(cache_key, {})),
+            }
+            for cache_key in sorted(set(self.cache_hits) | set(self.cache_misses) | set(self.cache))
+        }
+
+    @staticmethod
+    def get_model_cache_key(model_class: Type[Model]) -> str:
+        """Get the cache key under which objects of the given model class are stored."""
+        content_type = ContentType.objects.get_for_model(model_class)
+        return f"{content_type.app_label}.{content_type.model}"
+
+    def _evict(self, model_cache_key: str, parameter_set: ParameterSet):
+        """Remove a single object from the cache."""
+        del self.cache[model_cache_key][parameter_set]
+        self._usage.pop((model_cache_key, parameter_set), None)
+        self.cache_evictions[model_cache_key] += 1
+
+    def _store(self, model_cache_key: str, parameter_set: ParameterSet, obj: Model):
+        """Store an object in the cache, evicting the least recently used objects if the cache is full."""
+        model_cache = self.cache[model_cache_key]
+        model_cache[parameter_set] = obj
+        model_cache.move_to_end(parameter_set)
+        if self.capacity is not None:
+            self._usage[(model_cache_key, parameter_set)] = None
+            self._usage.move_to_end((model_cache_key, parameter_set))
+
+        model_capacity = self.capacities.get(model_cache_key)
+        while model_capacity is not None and len(model_cache) > model_capacity:
+            self._evict(model_cache_key, next(iter(model_cache)))
+        while self.capacity is not None and len(self._usage) > self.capacity:
+            self._evict(*next(iter(self._usage)))
+
     def get_from_orm(self, model_class: Type[Model], parameters: dict):
         """Retrieve an object from the ORM or the cache."""
         parameter_set = frozenset(parameters.items())
-        content_type = ContentType.objects.get_for_model(model_class)
-        model_cache_key = f"{content_type.app_label}.{content_type.model}"
+        model_cache_key = self.get_model_cache_key(model_class)
+
+        with self._lock:
+            # Check for keys in dictionaries directly to avoid false results of searching in cache.
+            if model_cache_key in self.cache.keys():
+                if parameter_set in self.cache[model_cache_key].keys():
+                    self.cache_hits[model_cache_key] += 1
+                    self.cache[model_cache_key].move_to_end(parameter_set)
+                    if self.capacity is not None:
+                        self._usage.move_to_end((model_cache_key, parameter_set))
+                    return self.cache[model_cache_key][parameter_set]
+
+            if self.shared_cache is not None:
+                obj = self.shared_cache.get(model_cache_key, parameter_set)
+                if obj is not None:
+                    self.cache_hits[model_cache_key] += 1
+                    self._store(model_cache_key, parameter_set, obj)
+                    return obj
 
-        # Check for keys in dictionaries directly to avoid false results of searching in cache.
-        if model_cache_key in self.cache.keys():
-            if parameter_set in self.cache[model_cache_key].keys():
-                self.cache_hits[model_cache_key] += 1
-                return self.cache[model_cache_key][parameter_set]
+            self.cache_misses[model_cache_key] += 1
+            self.cache_hits.setdefault(model_cache_key, 0)
 
         # As we are using `get` here, this will error if there is not exactly one object that corresponds to the
         # parameter set. We intentionally pass these errors through.
-        self.cache[model_cache_key][parameter_set] = model_class.objects.get(**dict(parameter_set))
-        self.cache_hits[model_cache_key] = 0
+        obj = model_class.objects.get(**dict(parameter_set))
+        with self._lock:
+            self._store(model_cache_key, parameter_set, obj)
+        if self.shared_cache is not None:
+            self.shared_cache.set(model_cache_key, parameter_set, obj)
+
+        return obj
+
+    def prefetch(self, model_class: Type[Model], parameters_list: Iterable[dict], batch_size: int = 1000):
+        """Load the objects identified by many parameter sets into the cache using as few queries as possible.
+
+        Parameter sets are grouped by the fields they use. Groups using a single field are resolved with one
+        `filter(<field>__in=...)` query per `batch_size` parameter sets, groups using several fields with one query
+        OR-ing the parameter sets together per batch.
+
+        Parameter sets that don't match exactly one object are not cached, so that `get_from_orm` raises the usual
+        errors for them later on.
+        """
+        model_cache_key = self.get_model_cache_key(model_class)
+        model_cache = self.cache[model_cache_key]
+        # Example: {("name", "parent__name"): {frozenset([("name", "Room"), ("parent__name", "Building")])}}
+        groups = defaultdict(set)
+        for parameters in parameters_list:
+            parameter_set = frozenset(parameters.items())
+            if parameter_set in model_cache:
+                continue
+            if self.shared_cache is not None and (obj := self.shared_cache.get(model_cache_key, parameter_set)):
+                self._store(model_cache_key, parameter_set, obj)
+                continue
+            groups[tuple(sorted(parameters))].add(parameter_set)
+
+        for keys, parameter_sets in groups.items():
+            # Annotate the lookup values onto the objects so that we can map them back to their parameter sets.
+            aliases = {f"_ssot_prefetch_{index}": F(key) for index, key in enumerate(keys)}
+            # Example: {frozenset([("name", "Room")]): {<UUID>: <LocationType: Room>}}
+            matches = defaultdict(dict)
+            iterator = iter(parameter_sets)
+            while batch := list(islice(iterator, batch_size)):
+                if len(keys) == 1:
+                    query = Q(**{f"{keys[0]}__in": [value for ((_, value),) in batch]})
+                else:
+                    query = reduce(operator.or_, (Q(**dict(parameter_set)) for parameter_set in batch))
+                for obj in model_class.objects.filter(query).annotate(**aliases):
+                    match = frozenset(zip(keys, (getattr(obj, alias) for alias in aliases)))
+                    matches[match][obj.pk] = obj
+            for parameter_set in parameter_sets:
+                if len(matches.get(parameter_set, {})) == 1:
+                    obj = next(iter(matches[parameter_set].values()))
+                    self._store(model_cache_key, parameter_set, obj)
+                    if self.shared_cache is not None:
+                        self.shared_cache.set(model_cache_key, parameter_set, obj)
 
-        return self.cache[model_cache_key][parameter_set]
+        self.cache_hits.setdefault(model_cache_key, 0)
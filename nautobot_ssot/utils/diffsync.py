@@ -1,7 +1,29 @@
 """Utility functions and classes for use with the DiffSync library."""
 
-from functools import lru_cache
-from typing import Annotated, ClassVar, Union, get_args, get_origin, get_type_hints
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import (
+    Annotated,
+    Callable,
+    ClassVar,
+    Iterable,
+    Optional,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+import structlog
+from diffsync import Adapter
+from diffsync.diff import Diff
+from diffsync.enum import DiffSyncActions, DiffSyncFlags
+from diffsync.helpers import DiffSyncDiffer, DiffSyncSyncer
+from diffsync.utils import intersection, symmetric_difference
+from django.db import connections
 
 from nautobot_ssot.contrib.types import CustomAnnotation
 
@@ -96,3 +118,155 @@ class DiffSyncModelUtilityMixin:
         if cls.is_attr_annotated(attr_name):
             return cls.get_attr_args(attr_name)[0]
         return cls.get_type_hints()[attr_name]
+
+
+def calculate_diff_in_parallel(  # pylint: disable=too-many-arguments
+    source: Adapter,
+    target: Adapter,
+    flags: DiffSyncFlags = DiffSyncFlags.NONE,
+    max_workers: Optional[int] = None,
+    diff_class: Type[Diff] = Diff,
+    callback: Optional[Callable[[str, int, int], None]] = None,
+) -> Diff:
+    """Calculate the diff from `source` to `target`, diffing each top-level model type in a separate thread.
+
+    Top-level model types are independent of each other, as their children are diffed along with them. The diff
+    elements of each type are added to the resulting diff in the same order as `source.diff_to(target)` would, and
+    the objects of top-level types that only one of the adapters has are counted as processed as DiffSync does, so
+    the result, including its summary, is identical no matter in which order the threads finish.
+
+    Args:
+        source: Adapter to diff from.
+        target: Adapter to diff to.
+        flags: DiffSync flags to diff with.
+        max_workers: Maximum number of threads, as per `ThreadPoolExecutor`.
+        diff_class: Diff or subclass thereof to store the diff in, as per `Adapter.diff_to`.
+        callback: Function with parameters (stage, current, total), called with the progress of all threads as per
+            `Adapter.diff_to`. It is called from the diffing threads, one at a time.
+    """
+    progress_lock = threading.Lock()
+    progress = {}
+
+    def report_progress(model_type, models_processed, total_models):
+        with progress_lock:
+            progress[model_type] = models_processed
+            callback("diff", sum(progress.values()), total_models)
+
+    def diff_model_type(model_type):
+        differ = DiffSyncDiffer(
+            src_diffsync=source,
+            dst_diffsync=target,
+            flags=flags,
+            callback=partial(_drop_stage, partial(report_progress, model_type)) if callback else None,
+        )
+        elements = differ.diff_object_list(src=source.get_all(model_type), dst=target.get_all(model_type))
+        return elements, differ.models_processed
+
+    diff = diff_class()
+    # This won't count the children of skipped types, just like DiffSync.
+    for skipped_type in symmetric_difference(target.top_level, source.top_level):
+        adapter = target if skipped_type in target.top_level else source
+        progress[skipped_type] = len(adapter.get_all(skipped_type))
+    diff.models_processed = sum(progress.values())
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ssot-diff") as executor:
+        # `map` yields the results in the order of the model types, regardless of completion order.
+        for elements, models_processed in executor.map(
+            diff_model_type, intersection(target.top_level, source.top_level)
+        ):
+            for element in elements:
+                diff.add(element)
+            diff.models_processed += models_processed
+    diff.complete()
+    return diff
+
+
+def _drop_stage(function, stage, *args):  # pylint: disable=unused-argument
+    """Call `function` with the arguments of a DiffSync progress callback other than the stage."""
+    return function(*args)
+
+
+def sync_in_parallel(  # pylint: disable=too-many-arguments,too-many-locals
+    source: Adapter,
+    target: Adapter,
+    diff: Diff,
+    flags: DiffSyncFlags = DiffSyncFlags.NONE,
+    max_workers: int = 4,
+    serial_types: Iterable[str] = (),
+) -> bool:
+    """Apply a diff from `source` to `target`, syncing independent subtrees of the diff in a thread pool.
+
+    The dependency graph is derived from the diff itself:
+
+    - The top-level model types are synced one after another in the order of the diff, i.e. of `top_level`, as
+      objects may depend on objects of the types before them.
+    - Each top-level object forms a subtree with its `_children`, which is synced parent before children, as with
+      `sync_to`. The subtrees of a model type don't depend on each other and are synced concurrently.
+    - Top-level objects to delete are only synced once all creates and updates are done, in reverse type order, so
+      that objects are deleted before the objects they may depend on.
+
+    Each thread uses its own database connection. DiffSync logs the result of each object as with `sync_to`, so that
+    the results end up in the sync log. If `target` prefetches related objects from the diff in its `sync_from`, as
+    `NautobotAdapter` does, they are prefetched before the threads are started.
+
+    Args:
+        source: Adapter to sync from.
+        target: Adapter to sync to, which must support having its models created, updated and deleted concurrently.
+        diff: Diff from `source` to `target` to apply.
+        flags: DiffSync flags to sync with.
+        max_workers: Maximum number of threads.
+        serial_types: Model types whose top-level objects depend on each other, such as nested locations, and are
+            therefore synced one after another.
+
+    Returns:
+        bool: Whether anything was changed. As with `sync_to`, `target.sync_complete()` is called in that case.
+    """
+    if getattr(target, "prefetch_related_objects", False):
+        target.prefetch_related_objects_from_diff(diff)
+
+    elements_by_type = {}
+    for element in diff.get_children():
+        elements_by_type.setdefault(element.type, []).append(element)
+    stages = []
+    deletes = []
+    for model_type, elements in elements_by_type.items():
+        stages.append((model_type, [element for element in elements if element.action != DiffSyncActions.DELETE]))
+        deletes.append((model_type, [element for element in elements if element.action == DiffSyncActions.DELETE]))
+    stages.extend(reversed(deletes))
+
+    failed = threading.Event()
+
+    def sync_elements(pending):
+        # The syncer keeps state about the element being synced, so each thread needs its own. It doesn't use the
+        # diff passed to it when syncing single elements.
+        syncer = DiffSyncSyncer(diff=Diff(), src_diffsync=source, dst_diffsync=target, flags=flags)
+        changed = False
+        try:
+            while not failed.is_set():
+                try:
+                    element = pending.get_nowait()
+                except queue.Empty:
+                    break
+                changed |= syncer.sync_diff_element(element)
+        except Exception:
+            failed.set()
+            raise
+        finally:
+            connections.close_all()
+        return changed
+
+    changed = False
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ssot-sync") as executor:
+        for model_type, elements in stages:
+            if not elements:
+                continue
+            pending = queue.SimpleQueue()
+            for element in elements:
+                pending.put(element)
+            num_workers = 1 if model_type in serial_types else min(max_workers, len(elements))
+            futures = [executor.submit(sync_elements, pending) for _ in range(num_workers)]
+            for future in futures:
+                changed |= future.result()
+
+    if changed:
+        target.sync_complete(source, diff, flags, structlog.get_logger().new(src=source, dst=target, flags=flags))
+    return changed
@@ -0,0 +1,101 @@
+"""Streaming export of sync diffs and log entries as NDJSON or CSV."""
+
+import csv
+import json
+
+from django.http import StreamingHttpResponse
+
+from nautobot_ssot.models import DiffJSONEncoder
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+DIFF_EXPORT_FIELDS = ("model_type", "id", "diff")
+
+LOG_ENTRY_EXPORT_FIELDS = (
+    "id",
+    "timestamp",
+    "action",
+    "status",
+    "synced_object_type",
+    "synced_object_id",
+    "object_repr",
+    "message",
+    "diff",
+)
+
+
+class _Echo:  # pylint: disable=too-few-public-methods
+    """File-like object whose `write` returns what was written, for use with `csv.writer` in a generator."""
+
+    def write(self, value):
+        """Return the value instead of buffering it."""
+        return value
+
+
+def iter_diff_rows(sync):
+    """Yield a `(model_type, id, diff)` row for each top-level object of the diff of a sync.
+
+    Chunked diffs are decompressed one chunk at a time.
+    """
+    yield from sync.diff_items
+
+
+def iter_log_entry_rows(queryset, chunk_size=2000):
+    """Yield a row of `LOG_ENTRY_EXPORT_FIELDS` values for each SyncLogEntry of the queryset.
+
+    Rows are read with `values_list(...).iterator()`, so that neither model instances are built nor the whole result
+    set is held in memory.
+    """
+    rows = queryset.order_by("timestamp", "id").values_list(
+        "id",
+        "timestamp",
+        "action",
+        "status",
+        "synced_object_type__app_label",
+        "synced_object_type__model",
+        "synced_object_id",
+        "object_repr",
+        "message",
+        "diff",
+    )
+    for entry_id, timestamp, action, status, app_label, model, *values in rows.iterator(chunk_size=chunk_size):
+        synced_object_type = f"{app_label}.{model}" if app_label else None
+        yield (entry_id, timestamp, action, status, synced_object_type, *values)
+
+
+def iter_ndjson(fields, rows):
+    """Encode rows as newline-delimited JSON objects with the given field names."""
+    encoder = DiffJSONEncoder()
+    for row in rows:
+        yield encoder.encode(dict(zip(fields, row))) + "\n"
+
+
+def iter_csv(fields, rows):
+    """Encode rows as CSV lines, preceded by a header line with the given field names.
+
+    Dictionary and list values, such as diffs, are encoded as JSON.
+    """
+    writer = csv.writer(_Echo())
+    yield writer.writerow(fields)
+    for row in rows:
+        yield writer.writerow(
+            [json.dumps(value, cls=DiffJSONEncoder) if isinstance(value, (dict, list)) else value for value in row]
+        )
+
+
+def streaming_export_response(export_format, filename, fields, rows):
+    """Build a `StreamingHttpResponse` that encodes rows as they are consumed.
+
+    Args:
+        export_format (str): Key of `EXPORT_FORMATS`.
+        filename (str): Name of the attachment, without extension.
+        fields (tuple): Field names of the row values.
+        rows (Iterable[tuple]): Rows to export.
+    """
+    encode = iter_csv if export_format == "csv" else iter_ndjson
+    response = StreamingHttpResponse(encode(fields, rows), content_type=EXPORT_FORMATS[export_format])
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{export_format}"'
+    return response
@@ -1,10 +1,11 @@
 """Collection of utility functions for interacting with Django ORM."""
 
+from collections import defaultdict
 from typing import Type
 from uuid import UUID
 
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Model, QuerySet
+from django.db.models import Model, Prefetch, QuerySet
 from nautobot.core.models import BaseModel
 from nautobot.extras.models import Relationship, RelationshipAssociation
 from typing_extensions import Any, get_type_hints, is_typeddict
@@ -61,6 +62,29 @@ def orm_attribute_lookup(db_obj: Model, attr_name: str) -> Any:
     return related_object
 
 
+def add_prefetch_lookups(queryset: QuerySet, lookups: list) -> QuerySet:
+    """Add `prefetch_related` lookups to a queryset, skipping lookups the queryset already prefetches.
+
+    Args:
+        queryset (QuerySet): The queryset to add the lookups to.
+        lookups (list): Lookups as strings or `Prefetch` objects.
+
+    Returns:
+        QuerySet: The queryset with the lookups added.
+    """
+
+    def prefetch_to(lookup):
+        return lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup
+
+    seen = {prefetch_to(lookup) for lookup in queryset._prefetch_related_lookups}  # pylint: disable=protected-access
+    missing = []
+    for lookup in lookups:
+        if prefetch_to(lookup) not in seen:
+            seen.add(prefetch_to(lookup))
+            missing.append(lookup)
+    return queryset.prefetch_related(*missing) if missing else queryset
+
+
 def load_typed_dict(typed_dict_class: Type, db_obj: Model) -> dict:
     """Convert a Django ORM object into an associated TypedDict instance.
 
@@ -166,3 +190,47 @@ def get_custom_relationship_associations(
         )
     )
     return relationship_associations, relationship_associations.count()
+
+
+def get_custom_relationship_peers(
+    relationship: Relationship,
+    relationship_side: RelationshipSideEnum,
+) -> dict[UUID, list[BaseModel]]:
+    """Get the related objects of all the objects on one side of a custom relationship at once.
+
+    Args:
+        relationship (Relationship): Instance of Nautobot `Relationship` object.
+        relationship_side (RelationshipSideEnum): Enum defining which side of the relationship the objects are on.
+
+    Returns:
+        dict[UUID, list[BaseModel]]: Mapping of object IDs to the objects on the other side of their associations.
+
+    Raises:
+        TypeError: Raised when inputs don't match specified types.
+    """
+    if not isinstance(relationship, Relationship):
+        raise TypeError("`relationship` parameter must be an instance of `nautobot.extras.models.Relationship`")
+    if relationship_side == RelationshipSideEnum.SOURCE:
+        own_id_field, peer_id_field, peer_type = "source_id", "destination_id", relationship.destination_type
+    elif relationship_side == RelationshipSideEnum.DESTINATION:
+        own_id_field, peer_id_field, peer_type = "destination_id", "source_id", relationship.source_type
+    else:
+        raise TypeError(
+            "`relationship_side` parameter must be instance of `nautobot_ssot.contrib.types.RelationshipSideEnum"
+        )
+
+    associations = RelationshipAssociation.objects.filter(
+        relationship=relationship,
+        source_type=relationship.source_type,
+        destination_type=relationship.destination_type,
+    ).values_list(own_id_field, peer_id_field)
+    peer_ids_by_id = defaultdict(list)
+    for own_id, peer_id in associations:
+        peer_ids_by_id[own_id].append(peer_id)
+
+    peer_model = peer_type.model_class()
+    peers = peer_model.objects.in_bulk({peer_id for peer_ids in peer_ids_by_id.values() for peer_id in peer_ids})
+    return {
+        own_id: [peers[peer_id] for peer_id in peer_ids if peer_id in peers]
+        for own_id, peer_ids in peer_ids_by_id.items()
+    }
@@ -0,0 +1,306 @@
+"""Loading of adapters, or of independent parts of an adapter, in parallel threads."""
+
+import logging
+import queue
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Optional
+
+from diffsync import Adapter
+from diffsync.store.local import LocalStore
+from django.db import connections
+from nautobot.extras.models import JobLogEntry
+
+
+def format_log_message(record):
+    """Get the message of a log record, including the traceback of its exception if any."""
+    message = record.getMessage()
+    if record.exc_info:
+        message += "\n" + "".join(traceback.format_exception(*record.exc_info))
+    return message
+
+
+def get_log_grouping(record, grouping):
+    """Get the grouping of a log record captured from a thread, keeping any custom grouping it was logged with."""
+    custom_grouping = record.__dict__.get("grouping")
+    return f"{custom_grouping} ({grouping})" if custom_grouping else grouping
+
+
+def job_log_entry_from_record(record, job_result, grouping):
+    """Create an unsaved `JobLogEntry` from a log record."""
+    # Map logging levels to appropriate log levels for JobLogEntry
+    if record.levelno >= logging.ERROR:
+        log_level = "error"
+    elif record.levelno >= logging.WARNING:
+        log_level = "warning"
+    elif record.levelno >= logging.INFO:
+        log_level = "info"
+    else:
+        log_level = "debug"
+    return JobLogEntry(
+        job_result=job_result,
+        log_level=log_level,
+        message=format_log_message(record),
+        grouping=get_log_grouping(record, grouping),
+        created=datetime.fromtimestamp(record.created, tz=timezone.utc),
+    )
+
+
+class JobLogEntryWriter:
+    """Write log records as `JobLogEntry` objects from a background thread, using `bulk_create`.
+
+    Records are converted when they are written and passed to the background thread through a queue of at most
+    `max_queue_size` entries, so that memory usage stays constant no matter how much is logged. If the queue is full,
+    writing blocks until the background thread catches up. The background thread writes whatever has queued up since
+    its last write, up to `batch_size` entries at a time, so that entries show up in the job result while they are
+    being logged.
+
+    Call `start()` before writing and `close()` once done, which waits for all entries to be written.
+    """
+
+    _stop = object()
+
+    def __init__(self, job_result, batch_size: int = 500, max_queue_size: int = 10000):
+        """Initialize the writer.
+
+        Args:
+            job_result (JobResult): Job result to write the entries for.
+            batch_size (int): Maximum number of entries per `INSERT` query.
+            max_queue_size (int): Maximum number of entries waiting to be written.
+        """
+        self.job_result = job_result
+        self.batch_size = batch_size
+        self.queue = queue.Queue(maxsize=max_queue_size)
+        self.entries_written = 0
+        self.error = None
+        self._thread = threading.Thread(target=self._run, name="ssot-job-log-writer", daemon=True)
+
+    def start(self):
+        """Start the background thread."""
+        self._thread.start()
+        return self
+
+    def write(self, record, grouping):
+        """Queue a log record to be written under the given grouping."""
+        self.queue.put(job_log_entry_from_record(record, self.job_result, grouping))
+
+    def close(self):
+        """Wait for all queued entries to be written and stop the background thread.
+
+        Raises:
+            Exception: The first error that occurred while writing entries.
+        """
+        self.queue.put(self._stop)
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def _run(self):
+        """Write queued entries until the writer is closed."""
+        try:
+            while True:
+                batch = [self.queue.get()]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self.queue.get_nowait())
+                    except queue.Empty:
+                        break
+                # Nothing is queued after the stop marker, so it can only be the last entry of a batch.
+                stopping = batch[-1] is self._stop
+                if stopping:
+                    batch.pop()
+                # After an error, keep taking entries off the queue so that writers don't block.
+                if batch and self.error is None:
+                    try:
+                        JobLogEntry.objects.bulk_create(batch)
+                        self.entries_written += len(batch)
+                    except Exception as error:  # pylint: disable=broad-except
+                        self.error = error
+                if stopping:
+                    return
+        finally:
+            connections.close_all()
+
+
+class ThreadLogHandler(logging.Handler):
+    """Handler that captures log records of a thread in parallel adapter loading.
+
+    Records are passed to a `JobLogEntryWriter` if one is given, and collected in `records` otherwise.
+    """
+
+    def __init__(self, job_logger_name, thread_id, writer: Optional[JobLogEntryWriter] = None, grouping=None):
+        """Initialize the thread log handler.
+
+        Args:
+            job_logger_name: Name of the job logger to capture logs from.
+            thread_id: ID of the thread that owns this handler.
+            writer: Writer to pass records to, rather than collecting them.
+            grouping: Grouping to write records under, e.g. "source" or "target".
+        """
+        super().__init__()
+        self.records = []
+        self.writer = writer
+        self.grouping = grouping
+        # The handler may be attached to several loggers that a record propagates through.
+        self._last_record = None
+        self.job_logger_name = job_logger_name
+        self.thread_id = thread_id  # Store the thread ID that owns this handler
+        # List of logger names to exclude (noisy third-party libraries)
+        self.excluded_loggers = [
+            "urllib3",
+            "requests",
+            "httpcore",
+            "httpx",
+            "asyncio",
+            "django.db.backends",  # SQL query logs
+        ]
+
+    def emit(self, record):
+        """Store the log record if it's relevant to the job and from this thread."""
+        # Only capture logs from the thread that owns this handler
+        current_thread_id = threading.get_ident()
+        if current_thread_id != self.thread_id:
+            return  # This log is from a different thread, ignore it
+
+        # Skip DEBUG level logs from excluded loggers
+        if record.levelno == logging.DEBUG:
+            logger_name = record.name
+            # Check if this logger is in our exclusion list
+            for excluded in self.excluded_loggers:
+                if logger_name.startswith(excluded):
+                    return  # Skip this log record
+
+        # Capture logs from:
+        # 1. The job logger (exact match)
+        # 2. Nautobot loggers (any level)
+        # 3. Nautobot SSOT loggers (any level)
+        # 4. Any INFO level or above logs (to catch important messages from other sources)
+        if (
+            record.name == self.job_logger_name
+            or record.name.startswith("nautobot")
+            or record.name.startswith("nautobot_ssot")
+            or record.levelno >= logging.INFO
+        ):
+            if record is self._last_record:
+                return  # Already captured through another logger
+            self._last_record = record
+            if self.writer is not None:
+                self.writer.write(record, self.grouping)
+            else:
+                self.records.append(record)
+
+
+@dataclass
+class LoadUnit:
+    """Independent part of loading an adapter, e.g. a top-level model or the objects of a model in one location.
+
+    `load` adds the objects of the unit to the adapter as usual. It must not rely on objects that other units add,
+    as units run concurrently and their objects are only added to the adapter's store once all units are done.
+    """
+
+    name: str
+    load: Callable[[], None]
+
+
+class _StagingStoreRouter:
+    """Proxy for an adapter's store, directing each thread to the staging store of the unit it is loading."""
+
+    def __init__(self, store):
+        """Initialize the router for the adapter's own store."""
+        self.store = store
+        self.local = threading.local()
+
+    def __getattr__(self, name):
+        """Get an attribute of the current thread's staging store, or of the adapter's own store outside of units."""
+        return getattr(getattr(self.local, "store", self.store), name)
+
+
+def _get_job_logger_name(job) -> Optional[str]:
+    """Get the name of the logger of a job, which parallel loading captures the records of."""
+    job_result = getattr(job, "job_result", None)
+    return f"nautobot.extras.jobs.run_job[{job_result.id}]" if job_result is not None else None
+
+
+def load_in_parallel(adapter: Adapter, units: Iterable[LoadUnit], max_workers: Optional[int] = None, job=None):
+    """Run the given load units of an adapter in a thread pool and merge the loaded objects into its store.
+
+    Each unit adds its objects to a staging store of its own, which are merged into the adapter's store in the order
+    of the units once all of them are done, so that the result doesn't depend on which unit finishes first. Each
+    thread uses its own database connection.
+
+    Staging stores keep their objects in memory, so if the adapter's store isn't a `LocalStore`, such as a `DiskStore`,
+    the units are run one after another in the calling thread instead, adding their objects directly to its store.
+
+    If `job` is given, the log records of each unit's thread are captured like `ThreadLogHandler` does for parallel
+    adapter loading and written as job log entries by a `JobLogEntryWriter` shared by all units, grouped by unit name.
+
+    Args:
+        adapter: Adapter to load.
+        units: Independent units to load concurrently.
+        max_workers: Maximum number of threads, `None` for the `ThreadPoolExecutor` default.
+        job: Job whose logs to capture, by default the adapter's `job` if it has one.
+
+    Raises:
+        Exception: The first error raised by a unit, in the order of the units, after all units are done.
+    """
+    units = list(units)
+    if job is None:
+        job = getattr(adapter, "job", None)
+    if not isinstance(adapter.store, LocalStore):
+        if job is not None:
+            job.logger.warning("Loading %s sequentially, as parallel loading requires an in-memory store.", adapter)
+        for unit in units:
+            unit.load()
+        return
+
+    job_logger_name = _get_job_logger_name(job)
+    log_writer = JobLogEntryWriter(job.job_result) if job_logger_name is not None else None
+    router = _StagingStoreRouter(adapter.store)
+
+    def load_unit(unit):
+        staging_store = LocalStore(adapter=adapter, name=unit.name)
+        router.local.store = staging_store
+        log_handler = None
+        loggers = []
+        if log_writer is not None:
+            log_handler = ThreadLogHandler(
+                job_logger_name, threading.get_ident(), writer=log_writer, grouping=unit.name
+            )
+            loggers = [logging.getLogger(name) for name in (job_logger_name, "nautobot", "nautobot_ssot", None)]
+            for logger in loggers:
+                logger.addHandler(log_handler)
+        error = None
+        try:
+            unit.load()
+        except Exception as exception:  # pylint: disable=broad-except
+            error = exception
+        finally:
+            for logger in loggers:
+                logger.removeHandler(log_handler)
+            del router.local.store
+            connections.close_all()
+        return staging_store, error
+
+    adapter.store = router
+    try:
+        if log_writer is not None:
+            log_writer.start()
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ssot-load") as executor:
+                results = list(executor.map(load_unit, units))
+        finally:
+            if log_writer is not None:
+                log_writer.close()
+    finally:
+        adapter.store = router.store
+
+    for _, error in results:
+        if error is not None:
+            raise error
+    for staging_store, _ in results:
+        for model_name in staging_store.get_all_model_names():
+            for obj in staging_store.get_all(model=model_name):
+                adapter.store.add(obj=obj)
@@ -0,0 +1,169 @@
+"""Pruning of old Sync history in bounded batches."""
+
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from nautobot_ssot.models import Sync, SyncDiffChunk, SyncLogEntry
+
+
+@dataclass
+class PruneResult:
+    """Number of records removed, or that would be removed in a dry run, by `prune_sync_history`."""
+
+    syncs: int = 0
+    log_entries: int = 0
+    diffs: int = 0
+
+
+def _raw_delete(queryset):
+    """Delete the records of a queryset with a single `DELETE` query.
+
+    This skips Django's deletion collector, which would fetch every record to send delete signals and cascade. Only
+    use it for models that nothing else references.
+    """
+    return queryset._raw_delete(queryset.db)  # pylint: disable=protected-access
+
+
+def get_expired_syncs(older_than, keep_last=0):
+    """Get the syncs started before `older_than`, excluding the latest `keep_last` syncs of each job.
+
+    Syncs of the same job are identified by the job of their job result, or by their data source and target for
+    syncs without one. Shards of sharded syncs are left out, as they expire along with their parent sync.
+    """
+    syncs = Sync.objects.filter(parent__isnull=True)
+    expired = syncs.filter(start_time__lt=older_than)
+    if keep_last:
+        kept = []
+        job_model_ids = (
+            expired.filter(job_result__job_model__isnull=False)
+            .order_by()
+            .values_list("job_result__job_model", flat=True)
+            .distinct()
+        )
+        for job_model_id in job_model_ids:
+            kept.extend(
+                syncs.filter(job_result__job_model=job_model_id)
+                .order_by("-start_time")
+                .values_list("pk", flat=True)[:keep_last]
+            )
+        without_job = syncs.filter(job_result__job_model__isnull=True)
+        for source, target in (
+            expired.filter(job_result__job_model__isnull=True).order_by().values_list("source", "target").distinct()
+        ):
+            kept.extend(
+                without_job.filter(source=source, target=target)
+                .order_by("-start_time")
+                .values_list("pk", flat=True)[:keep_last]
+            )
+        expired = expired.exclude(pk__in=kept)
+    return expired
+
+
+def _iter_batches(queryset, batch_size):
+    """Yield lists of up to `batch_size` primary keys of a queryset whose records are removed between batches."""
+    while True:
+        batch = list(queryset.order_by().values_list("pk", flat=True)[:batch_size])
+        if not batch:
+            return
+        yield batch
+
+
+def _with_shards(syncs):
+    """Extend syncs with their shards, if any."""
+    return Sync.objects.filter(Q(pk__in=syncs.values("pk")) | Q(parent__in=syncs.values("pk")))
+
+
+def _with_diffs(syncs):
+    """Filter syncs down to those with a stored diff."""
+    return syncs.filter(Q(diff_chunk__isnull=False) | ~Q(diff={})).distinct()
+
+
+def drop_sync_diffs(syncs, batch_size=1000):
+    """Drop the stored diffs of the given syncs, keeping the Sync records and their log entries.
+
+    Returns:
+        int: Number of syncs whose diffs were dropped.
+    """
+    dropped = 0
+    for batch in _iter_batches(_with_diffs(syncs), batch_size):
+        with transaction.atomic():
+            for chunk_batch in _iter_batches(SyncDiffChunk.objects.filter(sync_id__in=batch), batch_size):
+                _raw_delete(SyncDiffChunk.objects.filter(pk__in=chunk_batch))
+            Sync.objects.filter(pk__in=batch).update(diff={})
+        dropped += len(batch)
+    return dropped
+
+
+def delete_syncs(syncs, batch_size=1000):
+    """Delete the given syncs along with their shards, log entries and diffs, `batch_size` records per query.
+
+    Each batch is deleted in its own transaction, so that locks are only held briefly and an interrupted run can be
+    resumed.
+
+    Returns:
+        PruneResult: Number of deleted syncs, including shards, and log entries.
+    """
+    result = PruneResult()
+    for batch in _iter_batches(syncs, batch_size):
+        batch_syncs = Sync.objects.filter(Q(pk__in=batch) | Q(parent_id__in=batch))
+        for entry_batch in _iter_batches(SyncLogEntry.objects.filter(sync__in=batch_syncs), batch_size):
+            result.log_entries += _raw_delete(SyncLogEntry.objects.filter(pk__in=entry_batch))
+        with transaction.atomic():
+            # Delete the shards first, so that deleting their parents doesn't cascade to them one by one.
+            for shard_batch in _iter_batches(Sync.objects.filter(parent_id__in=batch), batch_size):
+                _raw_delete(SyncDiffChunk.objects.filter(sync_id__in=shard_batch))
+                Sync.objects.filter(pk__in=shard_batch).delete()
+                result.syncs += len(shard_batch)
+            _raw_delete(SyncDiffChunk.objects.filter(sync_id__in=batch))
+            Sync.objects.filter(pk__in=batch).delete()
+        result.syncs += len(batch)
+    return result
+
+
+def prune_sync_history(  # pylint: disable=too-many-arguments
+    retention_days,
+    keep_last=0,
+    diff_retention_days=None,
+    batch_size=1000,
+    dry_run=False,
+):
+    """Delete syncs older than the retention period, along with their shards, log entries and diffs.
+
+    Args:
+        retention_days (int): Age in days after which syncs are deleted.
+        keep_last (int): Number of most recent syncs of each job to keep regardless of their age.
+        diff_retention_days (int): Age in days after which the diffs of syncs are dropped, while the syncs themselves
+            are kept until `retention_days`. `None` to keep diffs as long as their syncs.
+        batch_size (int): Maximum number of records removed per query.
+        dry_run (bool): Only count the records that would be removed.
+
+    Returns:
+        PruneResult: Number of removed syncs, log entries and diffs.
+    """
+    now = timezone.now()
+    expired = get_expired_syncs(now - timedelta(days=retention_days), keep_last=keep_last)
+    diffs_expired = None
+    if diff_retention_days is not None and diff_retention_days < retention_days:
+        diffs_expired = _with_shards(
+            get_expired_syncs(now - timedelta(days=diff_retention_days), keep_last=keep_last).exclude(
+                pk__in=expired.values("pk")
+            )
+        )
+
+    if dry_run:
+        result = PruneResult(
+            syncs=_with_shards(expired).count(),
+            log_entries=SyncLogEntry.objects.filter(sync__in=_with_shards(expired)).count(),
+        )
+        if diffs_expired is not None:
+            result.diffs = _with_diffs(diffs_expired).count()
+        return result
+
+    diffs = drop_sync_diffs(diffs_expired, batch_size=batch_size) if diffs_expired is not None else 0
+    result = delete_syncs(expired, batch_size=batch_size)
+    result.diffs = diffs
+    return result
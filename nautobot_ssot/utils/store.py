@@ -0,0 +1,332 @@
+"""DiffSync store keeping the objects of an adapter on disk rather than in memory."""
+
+import copy
+import os
+import pickle  # nosec
+import sqlite3
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict, defaultdict, deque
+from itertools import islice
+from typing import DefaultDict, Deque, Dict, List, Optional, Set, Tuple
+
+from diffsync.exceptions import ObjectAlreadyExists, ObjectNotFound
+from diffsync.store import BaseStore
+
+# Maximum number of uids per `SELECT ... IN` query, below SQLite's limit of variables per statement, and of garbage
+# collected objects that are written to the database at once.
+_QUERY_BATCH_SIZE = 500
+
+
+def _model_state(obj) -> dict:
+    """Get the state of a DiffSync model as per pydantic's `__getstate__`, but without copying any of its parts.
+
+    The model keeps updating these in place, so that they hold its latest state once the model itself is gone.
+    """
+    return {
+        "__dict__": obj.__dict__,
+        "__pydantic_extra__": obj.__pydantic_extra__,
+        "__pydantic_fields_set__": obj.__pydantic_fields_set__,
+        "__pydantic_private__": obj.__pydantic_private__,
+    }
+
+
+def _close_database(connection, path):
+    """Close the database of a store and delete its file."""
+    connection.close()
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+class DiskStore(BaseStore):
+    """DiffSync store keeping objects in a temporary SQLite database, with the most recently used ones in memory.
+
+    Up to `cache_size` objects are kept in memory. Once that is exceeded, the store only keeps a weak reference to the
+    least recently used objects, which are pickled and written to the database once they are no longer referenced
+    elsewhere, e.g. by a loader that is adding children to them. Until then, later lookups return them as they are, so
+    that changes made to them are never lost. Only the unique ids of the objects are always kept in memory.
+
+    The database file is created in `directory`, or the system's temporary directory, and deleted once the store is
+    closed or garbage collected.
+    """
+
+    def __init__(self, *args, cache_size: int = 10000, directory: Optional[str] = None, **kwargs):
+        """Initialize the store with an empty database.
+
+        Args:
+            cache_size (int): Number of most recently used objects kept in memory.
+            directory (str): Directory to create the database file in, `None` for the system's temporary directory.
+        """
+        super().__init__(*args, **kwargs)
+        self.cache_size = cache_size
+        file_descriptor, self.path = tempfile.mkstemp(prefix="nautobot-ssot-", suffix=".sqlite3", dir=directory)
+        os.close(file_descriptor)
+        self._uids: DefaultDict[str, Dict[str, None]] = defaultdict(dict)
+        self._init_memory()
+        self.disk_reads = 0
+        self.disk_writes = 0
+        self._connect()
+
+    def _init_memory(self):
+        """Initialize the state of the objects in memory."""
+        self._cache: OrderedDict = OrderedDict()
+        # Objects evicted from `_cache`, or read without being used, with their weak reference and finalizer, and the
+        # state of those of them that have since been garbage collected, queued by their finalizers to be written.
+        self._released: Dict[tuple, Tuple[weakref.ref, weakref.finalize]] = {}
+        self._write_queue: Deque[tuple] = deque()
+        # Hashes of the pickled data of the objects read from the database, to skip writing back unchanged objects.
+        self._data_hashes: Dict[tuple, int] = {}
+
+    def _connect(self):
+        """Open the database, creating its table if needed."""
+        self._lock = threading.RLock()
+        # Access is serialized through `_lock`, as the diff and sync may use the store from several threads.
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode = OFF")
+        self._connection.execute("PRAGMA synchronous = OFF")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS objects "
+            "(model TEXT NOT NULL, uid TEXT NOT NULL, data BLOB NOT NULL, PRIMARY KEY (model, uid)) WITHOUT ROWID"
+        )
+        self._finalizer = weakref.finalize(self, _close_database, self._connection, self.path)
+
+    def __getstate__(self):
+        """Get the state of the store for pickling, writing all objects to the database so that it can be reopened."""
+        self.flush()
+        state = self.__dict__.copy()
+        for attribute in ("_lock", "_connection", "_finalizer", "_cache", "_released", "_write_queue", "_data_hashes"):
+            del state[attribute]
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state of the store from pickling, taking over its database."""
+        self.__dict__.update(state)
+        self._init_memory()
+        self._connect()
+
+    def close(self):
+        """Close and delete the database, dropping all objects of the store."""
+        with self._lock:
+            self._finalizer()
+            for _, finalizer in self._released.values():
+                finalizer.detach()
+            self._uids.clear()
+            self._init_memory()
+
+    def _dumps(self, obj) -> bytes:
+        """Pickle an object without its adapter."""
+        obj_copy = copy.copy(obj)
+        obj_copy.adapter = None
+        return pickle.dumps(obj_copy, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _loads(self, key: tuple, data: bytes):
+        """Unpickle an object read from the database and track it in memory until it is no longer referenced."""
+        obj = pickle.loads(data)  # noqa: S301  # nosec
+        obj.adapter = self.adapter
+        self._release(key, obj)
+        self._data_hashes[key] = hash(data)
+        self.disk_reads += 1
+        return obj
+
+    def _write(self, items: List[tuple]):
+        """Write `(key, obj)` pairs to the database, skipping objects that haven't changed since they were read."""
+        rows = []
+        for key, obj in items:
+            data = self._dumps(obj)
+            if self._data_hashes.get(key) != hash(data):
+                rows.append((*key, data))
+                self._data_hashes[key] = hash(data)
+        if not rows:
+            return
+        self._connection.executemany("INSERT OR REPLACE INTO objects (model, uid, data) VALUES (?, ?, ?)", rows)
+        self.disk_writes += len(rows)
+
+    def _release(self, key: tuple, obj):
+        """Only keep a weak reference to an object, queueing its state to be written once it is garbage collected."""
+        ref = weakref.ref(obj)
+        # The finalizer mustn't reference the store, nor the object itself, so that neither is kept alive by it.
+        finalizer = weakref.finalize(obj, self._write_queue.append, (key, ref, type(obj), _model_state(obj)))
+        finalizer.atexit = False
+        self._released[key] = (ref, finalizer)
+
+    def _unrelease(self, key: tuple):
+        """Stop tracking a released object, if any, which is either used again or removed."""
+        released = self._released.pop(key, None)
+        if released:
+            released[1].detach()
+
+    def _write_queued(self):
+        """Write the state of the released objects that have been garbage collected to the database."""
+        items = []
+        while self._write_queue:
+            key, ref, object_class, state = self._write_queue.popleft()
+            # Skip objects that have been removed, or replaced by another object of the same key, since.
+            if self._released.get(key, (None,))[0] is not ref:
+                continue
+            del self._released[key]
+            obj = object_class.__new__(object_class)
+            obj.__setstate__(state)
+            items.append((key, obj))
+        self._write(items)
+        for key, _ in items:
+            self._data_hashes.pop(key, None)
+
+    def _touch(self, key: tuple, obj):
+        """Mark an object as the most recently used one, evicting the least recently used objects if needed."""
+        self._unrelease(key)
+        self._cache[key] = obj
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._release(*self._cache.popitem(last=False))
+        if len(self._write_queue) >= min(self.cache_size, _QUERY_BATCH_SIZE):
+            self._write_queued()
+
+    def _get_in_memory(self, key: tuple):
+        """Get an object if it is in memory, or `None`."""
+        obj = self._cache.get(key)
+        if obj is None and key in self._released:
+            obj = self._released[key][0]()
+        return obj
+
+    def _get_many(self, modelname: str, uids: List[str]) -> Dict[str, object]:
+        """Get the objects with the given uids, reading those that aren't in memory from the database in batches."""
+        objects = {}
+        missing = []
+        for uid in uids:
+            obj = self._get_in_memory((modelname, uid))
+            if obj is None:
+                missing.append(uid)
+            else:
+                objects[uid] = obj
+        if missing:
+            # Objects that have just been garbage collected may not have been written yet.
+            self._write_queued()
+        uids_iter = iter(missing)
+        while batch := list(islice(uids_iter, _QUERY_BATCH_SIZE)):
+            placeholders = ", ".join("?" * len(batch))
+            rows = self._connection.execute(
+                f"SELECT uid, data FROM objects WHERE model = ? AND uid IN ({placeholders})",  # nosec
+                [modelname, *batch],
+            )
+            for uid, data in rows:
+                objects[uid] = self._loads((modelname, uid), data)
+        return objects
+
+    def _get_released(self) -> List[tuple]:
+        """Get the `(key, obj)` pairs of the released objects that are still referenced elsewhere."""
+        return [(key, obj) for key, (ref, _) in list(self._released.items()) if (obj := ref()) is not None]
+
+    def flush(self):
+        """Write all objects in memory to the database, keeping them in memory."""
+        with self._lock:
+            self._write_queued()
+            self._write([*self._cache.items(), *self._get_released()])
+
+    def statistics(self) -> Dict[str, int]:
+        """Get the number of objects in the store and in memory, and of objects read from and written to disk."""
+        with self._lock:
+            self._write_queued()
+        return {
+            "objects": self.count(),
+            "in_memory": len(self._cache) + len(self._get_released()),
+            "disk_reads": self.disk_reads,
+            "disk_writes": self.disk_writes,
+        }
+
+    def get_all_model_names(self) -> Set[str]:
+        """Get all the model names stored."""
+        with self._lock:
+            return {modelname for modelname, uids in self._uids.items() if uids}
+
+    def get(self, *, model, identifier):
+        """Get one object from the store based on its unique id.
+
+        Raises:
+            ObjectNotFound: if the requested object is not present
+        """
+        object_class, modelname = self._get_object_class_and_model(model)
+        uid = self._get_uid(model, object_class, identifier)
+        with self._lock:
+            if uid not in self._uids[modelname]:
+                raise ObjectNotFound(f"{modelname} {uid} not present in {str(self)}")
+            obj = self._get_many(modelname, [uid])[uid]
+            self._touch((modelname, uid), obj)
+            return obj
+
+    def get_all(self, *, model) -> List:
+        """Get all objects of a given type, in the order they were added.
+
+        The objects are not added to the most recently used objects, so that iterating over all objects of a type
+        doesn't evict the objects in use.
+        """
+        modelname = model if isinstance(model, str) else model.get_type()
+        with self._lock:
+            uids = list(self._uids[modelname])
+            objects = self._get_many(modelname, uids)
+            return [objects[uid] for uid in uids]
+
+    def get_by_uids(self, *, uids: List[str], model) -> List:
+        """Get multiple objects from the store by their unique ids and type.
+
+        Raises:
+            ObjectNotFound: if any of the requested uids are not found in the store
+        """
+        modelname = model if isinstance(model, str) else model.get_type()
+        with self._lock:
+            for uid in uids:
+                if uid not in self._uids[modelname]:
+                    raise ObjectNotFound(f"{modelname} {uid} not present in {str(self)}")
+            objects = self._get_many(modelname, uids)
+            return [objects[uid] for uid in uids]
+
+    def remove_item(self, modelname: str, uid: str) -> None:
+        """Remove one item from the store."""
+        key = (modelname, uid)
+        with self._lock:
+            if uid not in self._uids[modelname]:
+                raise ObjectNotFound(f"{modelname} {uid} not present in {str(self)}")
+            del self._uids[modelname][uid]
+            self._cache.pop(key, None)
+            self._unrelease(key)
+            self._data_hashes.pop(key, None)
+            self._connection.execute("DELETE FROM objects WHERE model = ? AND uid = ?", key)
+
+    def add(self, *, obj) -> None:
+        """Add a DiffSyncModel object to the store.
+
+        Raises:
+            ObjectAlreadyExists: if a different object with the same uid is already present.
+        """
+        modelname = obj.get_type()
+        uid = obj.get_unique_id()
+        with self._lock:
+            if uid in self._uids[modelname]:
+                existing_obj = self._get_many(modelname, [uid])[uid]
+                if existing_obj is not obj:
+                    raise ObjectAlreadyExists(f"Object {uid} already present", obj)
+                return
+            if not obj.adapter:
+                obj.adapter = self.adapter
+            self._uids[modelname][uid] = None
+            self._touch((modelname, uid), obj)
+
+    def update(self, *, obj) -> None:
+        """Update a DiffSyncModel object in the store."""
+        modelname = obj.get_type()
+        uid = obj.get_unique_id()
+        with self._lock:
+            self._uids[modelname][uid] = None
+            self._touch((modelname, uid), obj)
+
+    def count(self, *, model=None) -> int:
+        """Get the number of objects of a specific model, or of all objects in the store if unspecified."""
+        modelname = None
+        if model:
+            modelname = model if isinstance(model, str) else model.get_type()
+        with self._lock:
+            if modelname is None:
+                return sum(len(uids) for uids in self._uids.values())
+            return len(self._uids[modelname])
@@ -0,0 +1,97 @@
+"""Buffered writing of SyncLogEntry records."""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import List, Optional, Tuple
+
+from django.db import transaction
+
+from nautobot_ssot.models import SyncLogEntry
+
+
+class SyncLogEntryBuffer:
+    """Accumulate `SyncLogEntry` objects in memory and write them to the database with `bulk_create`.
+
+    The buffer is flushed whenever it holds `flush_size` entries, or when an entry is added at least `flush_interval`
+    seconds after the previous flush. Whoever creates the buffer is responsible for a final `flush()` once no more
+    entries will be added, `DataSyncBaseJob.run` does so even if the sync fails.
+
+    Entries can be added along with a `(model_name, unique_id)` lookup, in which case their synced objects are only
+    resolved right before they are written, through the `resolve_synced_objects` callback. This allows resolving
+    the synced objects of all buffered entries with few queries.
+
+    Along with the entries, the log counters of their `Sync` are incremented.
+
+    Note that the `timestamp` of an entry is set when it is written, so it may lag behind the logged event by up to
+    the flush interval.
+    """
+
+    def __init__(
+        self,
+        flush_size: int = 1000,
+        flush_interval: Optional[float] = 5.0,
+        batch_size: int = 1000,
+        resolve_synced_objects: Optional[Callable] = None,
+    ):
+        """Initialize the buffer.
+
+        Args:
+            flush_size (int): Number of buffered entries that triggers a flush.
+            flush_interval (float): Seconds after which the next added entry triggers a flush, `None` to disable.
+            batch_size (int): Number of entries per `INSERT` query.
+            resolve_synced_objects (Callable): Called with a list of `(entry, (model_name, unique_id))` tuples before
+                writing, to set the synced objects of the entries added with a lookup.
+        """
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.resolve_synced_objects = resolve_synced_objects
+        self.entries: List[Tuple[SyncLogEntry, Optional[tuple]]] = []
+        self.entries_written = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Number of entries waiting to be written."""
+        return len(self.entries)
+
+    def add(self, entry: SyncLogEntry, lookup: Optional[tuple] = None):
+        """Add an unsaved entry, optionally with the `(model_name, unique_id)` of its synced object, to the buffer.
+
+        The buffer is flushed if it is due.
+        """
+        with self._lock:
+            self.entries.append((entry, lookup))
+            due = len(self.entries) >= self.flush_size or (
+                self.flush_interval is not None and time.monotonic() - self._last_flush >= self.flush_interval
+            )
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered entries to the database.
+
+        If writing fails, the entries are kept in the buffer so that a later flush can retry them.
+        """
+        with self._lock:
+            entries, self.entries = self.entries, []
+            self._last_flush = time.monotonic()
+        if not entries:
+            return
+        try:
+            pending_lookups = [(entry, lookup) for entry, lookup in entries if lookup is not None]
+            if pending_lookups and self.resolve_synced_objects is not None:
+                self.resolve_synced_objects(pending_lookups)
+            with transaction.atomic():
+                SyncLogEntry.objects.bulk_create([entry for entry, _ in entries], batch_size=self.batch_size)
+                entries_by_sync = {}
+                for entry, _ in entries:
+                    entries_by_sync.setdefault(entry.sync_id, (entry.sync, []))[1].append(entry)
+                for sync, sync_entries in entries_by_sync.values():
+                    sync.add_log_counts(sync_entries)
+        except Exception:
+            with self._lock:
+                self.entries = entries + self.entries
+            raise
+        self.entries_written += len(entries)
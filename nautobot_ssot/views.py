@@ -6,7 +6,7 @@ from django.shortcuts import render
 from django.template import loader
 from django.template.defaultfilters import date
 from django.urls import reverse
-from django.utils.html import format_html
+from django.utils.html import format_html, format_html_join
 from django.utils.timesince import timesince
 from django.views import View as DjangoView
 from django_tables2 import RequestConfig
@@ -35,12 +35,12 @@ from nautobot.apps.views import (
     get_obj_from_context,
 )
 from nautobot.core.ui.utils import flatten_context
-from nautobot.core.views.paginator import get_paginate_count
 from nautobot.extras.models import Job as JobModel
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from nautobot_ssot.api import serializers
+from nautobot_ssot.api.pagination import SyncLogEntryCursorPagination
 from nautobot_ssot.integrations import utils
 from nautobot_ssot.templatetags.render_diff import render_diff, render_diff_paginated
 
@@ -77,6 +77,9 @@ class SyncObjectPanel(ObjectFieldsPanel):
         if key == "duration":
             obj = get_obj_from_context(context, self.context_object_key)
             return obj.get_duration_display()
+        if key == "shard_count" and value is not None:
+            obj = get_obj_from_context(context, self.context_object_key)
+            return obj.get_shards_display()
         # TODO: If Core adds a different way to render job result status labels, use here:
         if key == "job_result__status":
             status_labels = {
@@ -126,6 +129,8 @@ class StatisticsObjectPanel(ObjectFieldsPanel):
                 reverse("plugins:nautobot_ssot:sync_logentries", kwargs={"pk": obj.pk}),
                 value,
             )
+        if key == "unchanged_summary" and value:
+            return format_html_join(", ", "{}: {}", sorted(value.items()))
         return super().render_value(key, value, context)
 
 
@@ -137,8 +142,33 @@ class DiffPanel(ObjectTextPanel):
         obj = get_obj_from_context(context, "object")
         request = context.get("request")
         if request is not None:
-            return render_diff_paginated(obj.diff, request)
-        return render_diff(obj.diff)
+            return render_diff_paginated(obj.diff_items, request)
+        return render_diff(obj.get_diff())
+
+
+class CursorPaginatedTablePanel(ObjectsTablePanel):
+    """ObjectsTablePanel for a cursor-paginated table, with links to the previous and next pages in its footer."""
+
+    def __init__(self, *, context_pagination_key, **kwargs):
+        """Initialize the panel.
+
+        Args:
+            context_pagination_key (str): Context key of a dict with the `previous` and `next` page URLs, if any.
+        """
+        self.context_pagination_key = context_pagination_key
+        super().__init__(**kwargs)
+
+    def render_footer_content(self, context):
+        """Render the footer content, followed by the previous and next page links."""
+        footer_content = super().render_footer_content(context)
+        pagination = context.get(self.context_pagination_key) or {}
+        if not pagination.get("previous") and not pagination.get("next"):
+            return footer_content
+        return format_html(
+            "{}{}",
+            footer_content,
+            render_component_template("nautobot_ssot/inc/cursor_paginator.html", context, **pagination),
+        )
 
 
 class JobResultViewTab(DistinctViewTab):
@@ -280,6 +310,9 @@ class SyncUIViewSet(
                     "duration",
                     "job_result__status",
                     "job_result",
+                    "parent",
+                    "shard",
+                    "shard_count",
                 ],
                 value_transforms={
                     "dry_run": [dry_run_label],
@@ -297,6 +330,7 @@ class SyncUIViewSet(
                     "num_deleted",
                     "num_failed",
                     "num_errored",
+                    "unchanged_summary",
                 ],
                 key_transforms={
                     "num_created": "creates",
@@ -304,6 +338,7 @@ class SyncUIViewSet(
                     "num_deleted": "deletes",
                     "num_failed": "failures",
                     "num_errored": "errors",
+                    "unchanged_summary": "unchanged (summarized)",
                 },
             ),
         ),
@@ -333,14 +368,14 @@ class SyncUIViewSet(
                 hide_if_empty=False,
                 related_object_attribute="logs",
                 panels=(
-                    ObjectsTablePanel(
+                    CursorPaginatedTablePanel(
                         weight=100,
                         section=SectionChoices.FULL_WIDTH,
                         related_field_name="sync",
                         tab_id="logentries",
                         context_table_key="logs_table",
+                        context_pagination_key="logs_pagination",
                         enable_bulk_actions=False,
-                        include_paginator=True,
                     ),
                 ),
             ),
@@ -363,16 +398,21 @@ class SyncUIViewSet(
     def logentries(self, request, *args, **kwargs):
         """Log entries action for Sync UIViewSet."""
         sync = self.get_object()
-        queryset = sync.logs.all()
+        queryset = sync.get_log_entries()
         filterset = SyncLogEntryFilterSet(request.GET, queryset=queryset, request=request)
 
-        table = SyncLogEntryTable(filterset.qs, user=request.user)
-        RequestConfig(
-            request,
-            paginate={"paginator_class": EnhancedPaginator, "per_page": get_paginate_count(request)},
-        ).configure(table)
+        # Keyset pagination, so that deep pages of large syncs don't need to count and skip all entries before them
+        paginator = SyncLogEntryCursorPagination()
+        page = paginator.paginate_queryset(filterset.qs, request, view=self)
+        table = SyncLogEntryTable(page, user=request.user, orderable=False)
+        RequestConfig(request, paginate=False).configure(table)
 
-        return Response({"logs_table": table})
+        return Response(
+            {
+                "logs_table": table,
+                "logs_pagination": {"previous": paginator.get_previous_link(), "next": paginator.get_next_link()},
+            }
+        )
 
     @action(detail=True, url_path="jobresult", custom_view_base_action="view")
     def jobresult(self, request, *args, **kwargs):